@@ -0,0 +1,83 @@
+"""Benchmark: cifrado César orquestado vs. una sola ejecución de la MT compuesta.
+
+Para cada largo de texto y clave se cifra el mismo texto de dos formas:
+- ``orquestado``: ``orchestrator.encrypt_text`` (~5 ejecuciones de MT por
+  letra, caché de ejecuciones desactivada).
+- ``una ejecución``: ``orchestrator.encrypt_text_single_run``, una sola
+  ejecución de ``caesar_encrypt_composed.json`` sobre ``clave#texto``
+  (tools/build_caesar_machine.py).
+
+Se verifica que ambas salidas coinciden y se reportan los pasos de MT (sumados
+entre ejecuciones en la ruta orquestada) y el mejor tiempo de ``--repeat``
+repeticiones. El costo por letra de la MT compuesta crece con el
+desplazamiento (copia las marcas de la clave en cada letra), por eso se miden
+varias claves. La carga y compilación de la máquina (una vez por proceso, vía
+machine_registry) se reporta aparte.
+
+Uso:
+    python benchmarks/bench_caesar_single_run.py [--sizes 16 256 4096] [--keys D N Z] [--decrypt]
+"""
+from __future__ import annotations
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+import orchestrator  # type: ignore
+from machine_registry import get_definition  # type: ignore
+from bench_mod26 import StepCounter  # type: ignore
+
+SAMPLE_TEXT = 'EL VELOZ MURCIELAGO HINDU COMIA FELIZ CARDILLO Y KIWI, LA CIGUENA TOCABA EL SAXOFON. '
+
+
+def best_time(fn, repeat: int):
+    """(mejor tiempo, pasos de MT, salida) de ``repeat`` ejecuciones de ``fn``."""
+    best = float('inf')
+    for _ in range(repeat):
+        with StepCounter() as counter:
+            start = time.perf_counter()
+            out = fn()
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best, counter.steps, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="César: orquestado vs. una sola ejecución")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 256, 4096], help="Largos de texto")
+    parser.add_argument('--keys', nargs='+', default=['D', 'N', 'Z'], help="Claves (letras)")
+    parser.add_argument('--decrypt', action='store_true', help="Medir el descifrado")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por medición (se toma la mejor)")
+    args = parser.parse_args()
+
+    orchestrator.disable_run_cache()
+    operation = 'decrypt' if args.decrypt else 'encrypt'
+    orchestrated = orchestrator.decrypt_text if args.decrypt else orchestrator.encrypt_text
+    single_run = orchestrator.decrypt_text_single_run if args.decrypt else orchestrator.encrypt_text_single_run
+
+    for name in orchestrator.PIPELINE_CONFIGS:
+        get_definition(orchestrator._cfg(name))
+    start = time.perf_counter()
+    get_definition(orchestrator._cfg(orchestrator.SINGLE_RUN_CONFIGS[operation]))
+    print(f"Carga de {orchestrator.SINGLE_RUN_CONFIGS[operation]}: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    print()
+
+    print(f"{'largo':>6} {'clave':>5} {'orq. pasos':>12} {'orq. s':>9} {'1 ejec. pasos':>14} {'1 ejec. s':>10}"
+          f" {'speedup':>8}")
+    for n in args.sizes:
+        text = (SAMPLE_TEXT * (n // len(SAMPLE_TEXT) + 1))[:n]
+        for key in args.keys:
+            o_secs, o_steps, expected = best_time(lambda: orchestrated(key, text), args.repeat)
+            s_secs, s_steps, out = best_time(lambda: single_run(key, text), args.repeat)
+            assert out == expected, f"la MT compuesta difiere del orquestador (clave {key}, {n} caracteres)"
+            speedup = o_secs / s_secs if s_secs else float('nan')
+            print(f"{n:>6} {key:>5} {o_steps:>12,} {o_secs:>9.3f} {s_steps:>14,} {s_secs:>10.3f} {speedup:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
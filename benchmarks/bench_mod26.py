@@ -0,0 +1,96 @@
+"""Benchmark: ``orchestrator.mod26`` en una sola pasada vs. restas repetidas.
+
+Para cada tamaño n se reduce ``'|' * n`` módulo 26 de dos formas:
+- ``single``: una sola ejecución de ``mod26_full.json`` (ruta por defecto).
+- ``subtract``: la ruta anterior (``use_subtraction=True``), que ejecuta
+  ``subtract_simple.json`` una vez por cada 26 marcas.
+
+Se reportan los pasos lógicos de MT (sumados entre ejecuciones) y el tiempo
+de pared. La ruta por restas crece ~n² con una constante alta, así que solo se
+mide hasta ``--subtract-max`` marcas.
+
+Uso:
+    python benchmarks/bench_mod26.py [--sizes 26 100 1000 10000 100000] [--subtract-max 2000]
+"""
+from __future__ import annotations
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+import orchestrator  # type: ignore
+from machine_registry import get_definition  # type: ignore
+from turing_simulator import TuringMachine  # type: ignore
+
+
+class StepCounter:
+    """Envuelve ``TuringMachine.run`` de las máquinas del registro para sumar pasos."""
+
+    def __init__(self):
+        self.steps = 0
+        self._saved = None
+
+    def __enter__(self):
+        original = TuringMachine.run
+        counter = self
+
+        def run(tm, *args, **kwargs):
+            out = original(tm, *args, **kwargs)
+            counter.steps += tm.steps_executed
+            return out
+
+        self._saved = original
+        TuringMachine.run = run
+        return self
+
+    def __exit__(self, *exc):
+        TuringMachine.run = self._saved
+        return False
+
+
+def measure(n: int, use_subtraction: bool):
+    """Devuelve (pasos, segundos, correcto) de una reducción de n marcas."""
+    marks = '|' * n
+    with StepCounter() as counter:
+        start = time.perf_counter()
+        out = orchestrator.mod26(marks, use_subtraction=use_subtraction)
+        elapsed = time.perf_counter() - start
+    return counter.steps, elapsed, out == '|' * (n % 26)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mod26: una pasada vs. restas repetidas")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[26, 100, 1000, 10000, 100000],
+                        help="Cantidades de marcas a reducir")
+    parser.add_argument('--subtract-max', type=int, default=2000,
+                        help="Tamaño máximo medido con la ruta por restas")
+    args = parser.parse_args()
+
+    orchestrator.disable_run_cache()
+    # Compilar las máquinas antes de medir
+    for name in ('mod26_full.json', 'subtract_simple.json'):
+        get_definition(orchestrator._cfg(name))
+
+    print(f"{'marcas':>8} {'single pasos':>14} {'single s':>9} {'subtract pasos':>15} {'subtract s':>11}"
+          f" {'speedup':>8}")
+    for n in args.sizes:
+        steps, secs, ok = measure(n, use_subtraction=False)
+        assert ok, f"mod26_full dio un resultado incorrecto para {n} marcas"
+        row = f"{n:>8} {steps:>14,} {secs:>9.3f}"
+        if n <= args.subtract_max:
+            sub_steps, sub_secs, sub_ok = measure(n, use_subtraction=True)
+            assert sub_ok, f"la ruta por restas dio un resultado incorrecto para {n} marcas"
+            speedup = sub_secs / secs if secs else float('nan')
+            row += f" {sub_steps:>15,} {sub_secs:>11.3f} {speedup:>7.1f}x"
+        else:
+            row += f" {'-':>15} {'-':>11} {'-':>8}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
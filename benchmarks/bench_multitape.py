@@ -0,0 +1,119 @@
+"""Benchmark: costo por paso del motor multi-cinta según ``num_tapes``.
+
+Usa una misma máquina generada para k = 1, 2, 3 cintas: copia la entrada
+(``#`` seguido de letras ``a``/``b``) de la cinta 0 a las demás, vuelve al
+``#`` y recorre de nuevo comparando las cintas (~3n pasos). Para cada k y
+tamaño se mide ``turing_machine.TuringMachine``:
+- ``step``: ``step()`` paso a paso (camino general, el de la GUI y el debug).
+- ``run``: ``run()`` (bucle especializado ``_run_fast``).
+
+Se reporta el mejor tiempo de ``--repeat`` ejecuciones en ns por paso.
+
+Uso:
+    python benchmarks/bench_multitape.py [--sizes 1000 10000 100000] [--tapes 1 2 3] [--repeat 3]
+"""
+from __future__ import annotations
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from turing_machine import TuringMachine  # type: ignore
+
+LETTERS = ('a', 'b')
+
+
+def copy_compare_config(k: int) -> dict:
+    """Máquina de k cintas: copiar, volver y comparar (formato clásico si k == 1)."""
+    rows = []
+
+    def rule(state, reads, nxt, writes, moves):
+        rows.append((state, reads, nxt, writes, moves))
+
+    rest = ['_'] * (k - 1)
+    rule('q0', ['#'] + rest, 'copy', ['#'] * k, ['R'] * k)
+    for s in LETTERS:
+        rule('copy', [s] + rest, 'copy', [s] * k, ['R'] * k)
+        rule('back', [s] * k, 'back', [s] * k, ['L'] * k)
+        rule('check', [s] * k, 'check', [s] * k, ['R'] * k)
+    rule('copy', ['_'] * k, 'back', ['_'] * k, ['L'] * k)
+    rule('back', ['#'] * k, 'check', ['#'] * k, ['R'] * k)
+    rule('check', ['_'] * k, 'q_accept', ['_'] * k, ['S'] * k)
+
+    transitions = []
+    for state, reads, nxt, writes, moves in rows:
+        if k == 1:
+            transitions.append({'current_state': state, 'read_symbol': reads[0], 'next_state': nxt,
+                                'write_symbol': writes[0], 'move': moves[0]})
+        else:
+            transitions.append({'current_state': state, 'read_symbols': reads, 'next_state': nxt,
+                                'write_symbols': writes, 'movements': moves})
+    return {
+        'num_tapes': k,
+        'states': ['q0', 'copy', 'back', 'check', 'q_accept'],
+        'input_alphabet': ['#'] + list(LETTERS),
+        'tape_alphabet': ['#', '_'] + list(LETTERS),
+        'initial_state': 'q0',
+        'accept_states': ['q_accept'],
+        'blank_symbol': '_',
+        'transitions': transitions,
+    }
+
+
+def run_steps(tm: TuringMachine, w: str, max_steps: int) -> int:
+    """Camino general: step() hasta aceptar o quedar sin transición."""
+    tm._init_tapes(w)
+    step = tm.step
+    accepting = tm.is_accepting_state
+    while tm.step_count < max_steps and step():
+        if accepting():
+            break
+    return tm.step_count
+
+
+def run_fast(tm: TuringMachine, w: str, max_steps: int) -> int:
+    tm.run(w, max_steps=max_steps)
+    return tm.step_count
+
+
+def best_time(fn, repeat: int):
+    best = float('inf')
+    steps = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        steps = fn()
+        best = min(best, time.perf_counter() - start)
+    return steps, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Costo por paso del motor multi-cinta según num_tapes")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="Largo de la entrada (letras después del #)")
+    parser.add_argument('--tapes', type=int, nargs='+', default=[1, 2, 3], help="Cantidades de cintas")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por caso (se toma la mejor)")
+    args = parser.parse_args()
+
+    print(f"{'cintas':>6} {'n':>8} {'pasos':>9} {'step ns/paso':>13} {'run ns/paso':>12} {'speedup':>8}")
+    for k in args.tapes:
+        tm = TuringMachine()
+        if not tm.load_config_data(copy_compare_config(k)):
+            sys.exit(1)
+        for n in args.sizes:
+            w = '#' + ('ab' * n)[:n]
+            max_steps = 4 * n + 10
+            steps_a, t_step = best_time(lambda: run_steps(tm, w, max_steps), args.repeat)
+            steps_b, t_run = best_time(lambda: run_fast(tm, w, max_steps), args.repeat)
+            if steps_a != steps_b or not tm.is_accepting_state():
+                raise AssertionError(f"k={k} n={n}: step() y run() no coinciden")
+            print(f"{k:>6} {n:>8} {steps_b:>9,} {t_step / steps_a * 1e9:>13.0f} "
+                  f"{t_run / steps_b * 1e9:>12.0f} {t_step / t_run:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""Benchmark: simulador original vs. ``turing_simulator.TuringMachine`` actual.
+
+Ejecuta cada máquina de ``config/`` con una entrada representativa usando:
+- ``legacy``: réplica del simulador original (recorre ``transitions`` en cada
+  paso y hace crecer la cinta a la izquierda con ``insert(0, ...)``).
+- ``compiled``: ``turing_simulator.TuringMachine`` con tabla indexada O(1).
+- ``accel``: igual, con ``run(accelerate=True)`` (barridos y cadenas fusionadas);
+  los pasos por segundo cuentan pasos lógicos de la MT.
+
+Uso:
+    python benchmarks/bench_transition_table.py [--min-time 0.3]
+"""
+from __future__ import annotations
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from turing_simulator import TuringMachine  # type: ignore
+
+# Entrada representativa por máquina; las no listadas usan 'A'. Las de César
+# compuestas quedan por debajo del tope de 10000 pasos de ``run`` (clave D).
+WORKLOADS = {
+    'add_simple.json': '|' * 200 + '+' + '|' * 200,
+    'caesar_decrypt_composed.json': 'D#HOLA, MUNDO',
+    'caesar_decrypt_full.json': 'D#HOLA',
+    'caesar_encrypt_composed.json': 'D#HOLA, MUNDO',
+    'caesar_encrypt_full.json': 'D#HOLA',
+    'letter_to_number.json': 'Z',
+    'mod26_full.json': '|' * 51,
+    'number_key_to_letter.json': '27',
+    'number_to_letter.json': '|' * 25,
+    'subtract_simple.json': '|' * 60 + '-' + '|' * 26,
+    'test_simple.json': 'A' * 500,
+}
+
+# Con menos pasos la medición es solo el costo de iniciar la cinta: se omite
+# la máquina (las unificadas demostrativas se detienen en 2 con cualquier entrada)
+MIN_STEPS = 3
+
+
+class LegacyTuringMachine:
+    """Algoritmo previo: búsqueda lineal en el orden declarado por cada paso
+    y cinta como lista que crece a la izquierda con insert(0, ...)."""
+
+    def __init__(self, json_file: str):
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.initial_state = data.get('initial_state')
+        self.accept_states = data.get('accept_states', [])
+        self.blank_symbol = data.get('blank_symbol', '_')
+        self.transitions = data.get('transitions', [])
+        self.tape = []
+        self.head_position = 0
+        self.current_state = None
+        self.steps_executed = 0
+
+    def initialize_tape(self, input_string: str) -> None:
+        self.tape = list(input_string) if input_string else [self.blank_symbol]
+        self.head_position = 0
+        self.current_state = self.initial_state
+        self.steps_executed = 0
+
+    def find_transition(self, state, symbol):
+        for t in self.transitions:
+            if t.get('current_state') == state and t.get('read_symbol') == symbol:
+                return t
+        return None
+
+    def step(self) -> bool:
+        if self.current_state is None or self.current_state in self.accept_states:
+            return False
+        if self.head_position >= len(self.tape):
+            self.tape.append(self.blank_symbol)
+        current_symbol = self.tape[self.head_position]
+        transition = self.find_transition(self.current_state, current_symbol)
+        if transition is None:
+            return False
+        move = transition.get('move', 'N')
+        self.tape[self.head_position] = transition.get('write_symbol', current_symbol)
+        if move == 'L':
+            self.head_position -= 1
+        elif move == 'R':
+            self.head_position += 1
+        if self.head_position < 0:
+            self.tape.insert(0, self.blank_symbol)
+            self.head_position = 0
+        elif self.head_position >= len(self.tape):
+            self.tape.append(self.blank_symbol)
+        self.current_state = transition.get('next_state', self.current_state)
+        self.steps_executed += 1
+        return True
+
+    def run(self, input_string: str, max_steps: int = 10000) -> str:
+        self.initialize_tape(input_string)
+        for _ in range(max_steps):
+            if self.current_state in self.accept_states or not self.step():
+                break
+        return self.get_tape_contents()
+
+    def get_tape_contents(self) -> str:
+        marked = [i for i, sym in enumerate(self.tape) if sym != self.blank_symbol]
+        if not marked:
+            return ''
+        return ''.join(self.tape[marked[0]:marked[-1] + 1])
+
+
+def measure(tm, input_string: str, min_time: float, **run_kwargs):
+    """Repite la ejecución hasta acumular ``min_time`` segundos; devuelve (pasos/s, pasos, salida)."""
+    runs = 0
+    total_steps = 0
+    start = time.perf_counter()
+    while True:
+        out = tm.run(input_string, **run_kwargs)
+        runs += 1
+        total_steps += tm.steps_executed
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    return total_steps / elapsed if elapsed else 0.0, tm.steps_executed, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pasos/s: búsqueda lineal vs tabla compilada")
+    parser.add_argument('--min-time', type=float, default=0.3, help="Segundos mínimos por medición")
+    args = parser.parse_args()
+
+    print(f"{'máquina':28} {'pasos':>7} {'legacy p/s':>12} {'compiled p/s':>13} {'speedup':>8}"
+          f" {'accel p/s':>13} {'speedup':>8}")
+    for path in sorted(glob.glob(os.path.join(ROOT, 'config', '*.json'))):
+        name = os.path.basename(path)
+        w = WORKLOADS.get(name, 'A')
+        probe = TuringMachine(path)
+        probe.run(w)
+        if probe.steps_executed < MIN_STEPS:
+            print(f"{name:28} {probe.steps_executed:>7}  (omitida: menos de {MIN_STEPS} pasos)")
+            continue
+        legacy_rate, steps, legacy_out = measure(LegacyTuringMachine(path), w, args.min_time)
+        fast_rate, fast_steps, fast_out = measure(TuringMachine(path), w, args.min_time)
+        accel_rate, accel_steps, accel_out = measure(TuringMachine(path), w, args.min_time, accelerate=True)
+        assert (legacy_out, steps) == (fast_out, fast_steps) == (accel_out, accel_steps), \
+            f"resultado distinto en {name}"
+        speedup = fast_rate / legacy_rate if legacy_rate else float('nan')
+        accel_speedup = accel_rate / legacy_rate if legacy_rate else float('nan')
+        print(f"{name:28} {steps:>7} {legacy_rate:>12,.0f} {fast_rate:>13,.0f} {speedup:>7.1f}x"
+              f" {accel_rate:>13,.0f} {accel_speedup:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+"""Suite de benchmarks: todas las máquinas de ``config/`` y el pipeline César.
+
+Mide, para cada ``config/*.json`` con entradas de tamaño creciente, los pasos
+por segundo y el tiempo de pared en:
+- ``single``: ``turing_simulator.TuringMachine`` (tabla compilada).
+- ``accel``: lo mismo con ``run(accelerate=True)`` (pasos lógicos por segundo).
+- ``multi``: ``turing_machine.TuringMachine`` (motor multi-cinta de la GUI).
+
+Y el rendimiento de ``encrypt_text``/``decrypt_text`` (caracteres por segundo)
+según el largo del mensaje, con la caché de ejecuciones desactivada.
+
+Cada caso se repite hasta acumular ``--min-time`` segundos; se reporta el mejor
+tiempo por ejecución (el más estable frente a ruido) y el promedio. Los
+resultados se guardan en JSON (``--out``) y ``--compare BASE.json`` marca como
+regresión todo caso cuyo rendimiento cae más de ``--threshold`` respecto de la
+base; en ese caso el proceso termina con código 1.
+
+Uso:
+    python benchmarks/run_suite.py --out benchmarks/baseline.json
+    python benchmarks/run_suite.py --compare benchmarks/baseline.json [--threshold 0.10]
+    python benchmarks/run_suite.py --results nuevo.json --compare base.json   # sin volver a medir
+    python benchmarks/run_suite.py --quick --only machines --engines single accel
+"""
+from __future__ import annotations
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+import platform
+from datetime import datetime, timezone
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+import orchestrator  # type: ignore
+from turing_simulator import TuringMachine  # type: ignore
+from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+
+ENGINES = ('single', 'accel', 'multi')
+
+# Máximo de pasos por ejecución; ninguna entrada de la suite lo alcanza salvo
+# las máquinas que no se detienen (ver MAX_STEPS_OVERRIDE).
+MAX_STEPS = 10 ** 7
+# number_to_letter.json no llega a aceptar (el lazo de '_' en q_back tapa la
+# transición de aceptación): se mide el ritmo de paso hasta el tope habitual.
+MAX_STEPS_OVERRIDE = {'number_to_letter.json': 10000}
+
+SAMPLE_TEXT = 'EL VELOZ MURCIELAGO HINDU COMIA FELIZ CARDILLO Y KIWI, LA CIGUENA TOCABA EL SAXOFON. '
+
+# Máquina -> (entrada para el tamaño n, tamaños). Las no listadas usan 'A'.
+WORKLOADS = {
+    'add_simple.json': (lambda n: '|' * n + '+' + '|' * n, (100, 1000, 10000)),
+    'caesar_decrypt_composed.json': (lambda n: 'D#' + (SAMPLE_TEXT * n)[:n], (16, 256)),
+    'caesar_decrypt_full.json': (lambda n: 'D#' + (SAMPLE_TEXT * n)[:n], (16,)),
+    'caesar_encrypt_composed.json': (lambda n: 'D#' + (SAMPLE_TEXT * n)[:n], (16, 256)),
+    'caesar_encrypt_full.json': (lambda n: 'D#' + (SAMPLE_TEXT * n)[:n], (16,)),
+    'letter_to_number.json': (lambda n: 'Z', (1,)),
+    'mod26_full.json': (lambda n: '|' * n, (51, 500, 2000)),
+    'number_key_to_letter.json': (lambda n: str(n), (27,)),
+    'number_to_letter.json': (lambda n: '|' * n, (25,)),
+    'subtract_simple.json': (lambda n: '|' * n + '-' + '|' * 26, (60, 500, 2000)),
+    'test_simple.json': (lambda n: 'A' * n, (500, 5000, 50000)),
+}
+DEFAULT_WORKLOAD = (lambda n: 'A', (1,))
+
+CAESAR_SIZES = (16, 256, 4096)
+
+
+def repeat(fn, min_time: float):
+    """Ejecuta ``fn`` hasta acumular ``min_time`` s; devuelve (ejecuciones, mejor, promedio, último resultado)."""
+    runs = 0
+    best = float('inf')
+    total = 0.0
+    while True:
+        start = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - start
+        runs += 1
+        total += elapsed
+        best = min(best, elapsed)
+        if total >= min_time:
+            return runs, best, total / runs, out
+
+
+def _runner(engine: str, path: str, w: str, max_steps: int):
+    """Función sin argumentos que ejecuta la máquina y devuelve (salida, pasos)."""
+    if engine == 'multi':
+        tm = MultiTuringMachine()
+        if not tm.load_config(path):
+            raise ValueError(f"No se pudo cargar {path}")
+
+        def run():
+            return tm.run(w, max_steps=max_steps), tm.step_count
+    else:
+        tm = TuringMachine(path)
+        accelerate = engine == 'accel'
+
+        def run():
+            return tm.run(w, max_steps=max_steps, accelerate=accelerate), tm.steps_executed
+    return run
+
+
+def bench_machines(engines, min_time: float, quick: bool):
+    results = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'config', '*.json'))):
+        name = os.path.basename(path)
+        make_input, sizes = WORKLOADS.get(name, DEFAULT_WORKLOAD)
+        max_steps = MAX_STEPS_OVERRIDE.get(name, MAX_STEPS)
+        for n in sizes[:1] if quick else sizes:
+            w = make_input(n)
+            reference = None
+            for engine in engines:
+                runs, best, mean, (out, steps) = repeat(_runner(engine, path, w, max_steps), min_time)
+                # Los dos modos del simulador de una cinta deben coincidir exactamente
+                if engine in ('single', 'accel'):
+                    if reference is not None and reference != (out, steps):
+                        raise AssertionError(f"{name} n={n}: 'accel' difiere de 'single'")
+                    reference = (out, steps)
+                results.append({
+                    'id': f"machine/{name}/{engine}/{n}",
+                    'group': 'machine', 'name': name, 'engine': engine, 'size': n,
+                    'steps': steps, 'runs': runs, 'seconds': best, 'mean_seconds': mean,
+                    'rate': steps / best if best else 0.0, 'unit': 'pasos/s',
+                })
+    return results
+
+
+def bench_caesar(min_time: float, quick: bool):
+    results = []
+    orchestrator.disable_run_cache()
+    key = 'D'
+    for n in CAESAR_SIZES[:1] if quick else CAESAR_SIZES:
+        text = (SAMPLE_TEXT * (n // len(SAMPLE_TEXT) + 1))[:n]
+        cipher = orchestrator.encrypt_text(key, text)
+        if orchestrator.decrypt_text(key, cipher) != text:
+            raise AssertionError(f"decrypt(encrypt(texto)) != texto para {n} caracteres")
+        for op, fn, arg in (('encrypt_text', orchestrator.encrypt_text, text),
+                            ('decrypt_text', orchestrator.decrypt_text, cipher)):
+            runs, best, mean, _ = repeat(lambda: fn(key, arg), min_time)
+            results.append({
+                'id': f"caesar/{op}/{n}",
+                'group': 'caesar', 'name': op, 'engine': 'orchestrator', 'size': n,
+                'steps': None, 'runs': runs, 'seconds': best, 'mean_seconds': mean,
+                'rate': n / best if best else 0.0, 'unit': 'caracteres/s',
+            })
+    return results
+
+
+def run_suite(only=None, engines=ENGINES, min_time: float = 0.2, quick: bool = False, progress=None):
+    """Corre la suite y devuelve el documento JSON de resultados."""
+    results = []
+    if only in (None, 'machines'):
+        results += bench_machines(engines, min_time, quick)
+        if progress:
+            progress(results)
+    if only in (None, 'caesar'):
+        caesar = bench_caesar(min_time, quick)
+        results += caesar
+        if progress:
+            progress(caesar)
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'min_time': min_time,
+            'quick': quick,
+            # Una corrida parcial no cubre todos los casos de la base
+            'partial': quick or only is not None or tuple(engines) != ENGINES,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float, include_missing: bool = True):
+    """Compara rendimientos por ``id``.
+
+    Devuelve una lista de (id, rate base, rate actual, cociente, estado) con
+    estado ``'regresión'`` si el cociente actual/base es menor que
+    ``1 - threshold``, ``'mejora'`` si es mayor que ``1 + threshold`` y ``'ok'``
+    en otro caso. Los casos que solo están en uno de los dos documentos se
+    reportan como ``'nuevo'`` o (si ``include_missing``) ``'faltante'``.
+    """
+    base = {r['id']: r for r in baseline['results']}
+    cur = {r['id']: r for r in current['results']}
+    rows = []
+    for rid, r in cur.items():
+        b = base.get(rid)
+        if b is None:
+            rows.append((rid, None, r['rate'], None, 'nuevo'))
+            continue
+        ratio = r['rate'] / b['rate'] if b['rate'] else float('inf')
+        if ratio < 1 - threshold:
+            status = 'regresión'
+        elif ratio > 1 + threshold:
+            status = 'mejora'
+        else:
+            status = 'ok'
+        rows.append((rid, b['rate'], r['rate'], ratio, status))
+    for rid, b in base.items():
+        if include_missing and rid not in cur:
+            rows.append((rid, b['rate'], None, None, 'faltante'))
+    return rows
+
+
+def print_results(results) -> None:
+    for r in results:
+        steps = f"{r['steps']:,}" if r['steps'] is not None else '-'
+        print(f"{r['id']:52} {steps:>11} {r['seconds'] * 1000:>10.2f} ms {r['rate']:>14,.0f} {r['unit']}")
+
+
+def print_comparison(rows) -> None:
+    def fmt(x):
+        return f"{x:,.0f}" if x is not None else '-'
+    print(f"{'caso':52} {'base':>14} {'actual':>14} {'cociente':>9}  estado")
+    for rid, b, c, ratio, status in rows:
+        r = f"{ratio:.2f}x" if ratio is not None else '-'
+        print(f"{rid:52} {fmt(b):>14} {fmt(c):>14} {r:>9}  {status}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de las MTs y del pipeline César")
+    parser.add_argument('--out', metavar='ARCHIVO', help="Guardar los resultados en JSON")
+    parser.add_argument('--compare', metavar='BASE', help="Comparar contra resultados guardados")
+    parser.add_argument('--results', metavar='ARCHIVO',
+                        help="Usar resultados guardados en lugar de medir (con --compare)")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Caída relativa de rendimiento considerada regresión (default 0.10)")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Segundos mínimos por caso")
+    parser.add_argument('--only', choices=('machines', 'caesar'), help="Correr solo una parte de la suite")
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES),
+                        help="Motores a medir en las máquinas")
+    parser.add_argument('--quick', action='store_true', help="Solo el tamaño más chico de cada caso")
+    args = parser.parse_args(argv)
+
+    if args.results:
+        with open(args.results, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        current = run_suite(args.only, args.engines, args.min_time, args.quick, progress=print_results)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(baseline, current, args.threshold,
+                       include_missing=not current['meta'].get('partial', False))
+        print()
+        print_comparison(rows)
+        regressions = [row for row in rows if row[4] == 'regresión']
+        if regressions:
+            print(f"\n{len(regressions)} regresión(es) de más del {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,20 @@
 
 Uso:
     python main.py --config config/test_simple.json --input AAA
+
+Continuar una ejecución que agotó --max-steps:
+    python main.py --config config/mod26_full.json --input "||||..." --checkpoint run.tmck
+    python main.py --resume run.tmck --max-steps 1000000 --checkpoint run.tmck
+
+Perfil de estados y transiciones (tabla en consola y línea de tiempo JSON):
+    python main.py --config config/mod26_full.json --input "||||..." --profile --profile-out perfil.json
+
+Detener una máquina que entró en un ciclo (en lugar de agotar --max-steps):
+    python main.py --config config/number_to_letter.json --input "|||" --detect-loops
+
+Cifrado César en streaming (stdin/stdout o archivos, memoria constante):
+    python main.py encrypt --key D < entrada.txt > cifrado.txt
+    python main.py decrypt --key 3 --in cifrado.txt --out claro.txt
 """
 import sys
 import os
@@ -11,28 +25,134 @@ SRC_DIR = os.path.join(os.path.dirname(__file__), 'src')
 if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
-from turing_simulator import TuringMachine  # type: ignore
+from machine_registry import new_machine  # type: ignore
+from checkpoint import load_checkpoint, save_checkpoint  # type: ignore
+from profiler import ExecutionProfiler, FORMATS as PROFILE_FORMATS  # type: ignore
+from loop_detector import LoopDetector  # type: ignore
 
 
-def parse_args():
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(description="Ejecutor universal de MT (una cinta)")
-    parser.add_argument("--config", required=True, help="Ruta al archivo JSON de la máquina")
+    parser.add_argument("--config", help="Ruta al archivo JSON de la máquina")
     parser.add_argument("--input", default="", help="Cadena de entrada para la cinta")
     parser.add_argument("--max-steps", type=int, default=10000, help="Máximo de pasos antes de detener")
-    return parser.parse_args()
+    parser.add_argument("--accelerate", action="store_true",
+                        help="Saltar en bloque las transiciones de barrido (mismo resultado y conteo de pasos)")
+    parser.add_argument("--checkpoint", metavar="ARCHIVO",
+                        help="Guardar la configuración final (estado, cabezal, cinta, pasos) en ARCHIVO")
+    parser.add_argument("--resume", metavar="ARCHIVO",
+                        help="Continuar desde un checkpoint en lugar de --input (hasta --max-steps pasos más);"
+                             " sin --config se usa la ruta guardada en el checkpoint")
+    parser.add_argument("--profile", action="store_true",
+                        help="Contar pasos por estado y por transición y mostrar los más usados")
+    parser.add_argument("--profile-out", metavar="ARCHIVO",
+                        help="Con --profile: exportar la línea de tiempo de estados en JSON")
+    parser.add_argument("--profile-format", choices=PROFILE_FORMATS, default="chrome",
+                        help="Formato de --profile-out: chrome (chrome://tracing, Perfetto) o speedscope")
+    parser.add_argument("--detect-loops", action="store_true",
+                        help="Detenerse con resultado 'diverge' si la configuración se repite")
+
+    sub = parser.add_subparsers(dest="command")
+    for name, help_text in (("encrypt", "Cifrar texto en streaming"), ("decrypt", "Descifrar texto en streaming")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("--key", required=True, help="Clave: letra A-Z o número 0-25")
+        cmd.add_argument("--in", dest="in_file", default="-", help="Archivo de entrada ('-' = stdin)")
+        cmd.add_argument("--out", dest="out_file", default="-", help="Archivo de salida ('-' = stdout)")
+        cmd.add_argument("--chunk-size", type=int, default=64 * 1024, help="Caracteres leídos por bloque")
+        cmd.add_argument("--no-cache", action="store_true",
+                         help="No memoizar ejecuciones repetidas de las MTs")
+
+    args = parser.parse_args(argv)
+    if args.command is None and not args.config and not args.resume:
+        parser.error("se requiere --config (o --resume, o un subcomando encrypt/decrypt)")
+    return args
+
+
+def _key_letter(key: str) -> str:
+    key = key.strip()
+    if key.isdigit():
+        n = int(key)
+        if not 0 <= n <= 25:
+            raise ValueError(f"La clave debe estar entre 0 y 25, recibido: {n}")
+        return chr(ord('A') + n)
+    return key
+
+
+def run_stream(args) -> None:
+    from orchestrator import encrypt_stream, decrypt_stream, enable_run_cache  # type: ignore
+
+    if not args.no_cache:
+        enable_run_cache()
+    stream = encrypt_stream if args.command == "encrypt" else decrypt_stream
+    src = sys.stdin if args.in_file == "-" else open(args.in_file, 'r', encoding='utf-8', newline='')
+    dst = sys.stdout if args.out_file == "-" else open(args.out_file, 'w', encoding='utf-8', newline='')
+    try:
+        for chunk in stream(_key_letter(args.key), src, chunk_size=args.chunk_size):
+            dst.write(chunk)
+            dst.flush()
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
 
 
 def main():
     args = parse_args()
+    if args.command is not None:
+        try:
+            run_stream(args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    checkpoint = None
+    if args.resume:
+        checkpoint = load_checkpoint(args.resume)
+        args.config = args.config or checkpoint.source
+        if not args.config:
+            print("El checkpoint no indica la máquina; use --config")
+            sys.exit(1)
+
     if not os.path.isfile(args.config):
         print(f"No existe el archivo JSON: {args.config}")
         sys.exit(1)
 
-    tm = TuringMachine(args.config)
-    output = tm.run(args.input, max_steps=args.max_steps)
+    tm = new_machine(args.config)
+    if args.profile or args.profile_out:
+        tm.profiler = ExecutionProfiler(timeline=bool(args.profile_out))
+        if args.accelerate:
+            print("Nota: con --profile la ejecución va paso a paso (se ignora --accelerate)")
+        if args.detect_loops:
+            print("Nota: con --profile no se detectan ciclos (se ignora --detect-loops)")
+    elif args.detect_loops:
+        tm.loop_detector = LoopDetector()
+        if args.accelerate:
+            print("Nota: con --detect-loops la ejecución va paso a paso (se ignora --accelerate)")
+    if checkpoint is not None:
+        try:
+            output = tm.resume(checkpoint, args.max_steps, accelerate=args.accelerate)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        output = tm.run(args.input, max_steps=args.max_steps, accelerate=args.accelerate)
+    if args.checkpoint:
+        save_checkpoint(tm.checkpoint(), args.checkpoint)
     print("Estado final:", tm.current_state)
     print("Pasos ejecutados:", tm.steps_executed)
     print("Salida cinta:", output)
+    if tm.loop_detector is not None and tm.loop_detector.diverged:
+        d = tm.loop_detector
+        print(f"Resultado: diverge (la configuración del paso {d.cycle_start} se repite cada "
+              f"{d.cycle_length} pasos, desplazamiento {d.drift[0]})")
+    if tm.profiler is not None:
+        print()
+        print(tm.profiler.report())
+        if args.profile_out:
+            tm.profiler.save(args.profile_out, args.profile_format)
+            print(f"Línea de tiempo ({args.profile_format}) guardada en {args.profile_out}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,298 @@
+"""caesar_machine.py
+
+Compilador de la MT de cifrado César de una sola ejecución.
+
+``orchestrator.encrypt_text`` ejecuta ~5 máquinas por letra (letter_to_number,
+add_simple, mod26_full, number_to_letter) y hace en Python el traspaso entre
+ellas. ``build_caesar_machine`` compone esas mismas máquinas de ``config/``
+(con ``machine_composer``) en una sola MT de una cinta que recibe
+``clave#texto`` y termina, aceptando, con solo el texto cifrado en la cinta y
+el cabezal en su primer carácter.
+
+Convenciones de la cinta
+------------------------
+Clave: letra A-Z/a-z o número que entiende ``number_key_to_letter`` (1..27;
+vacía equivale a A). La clave se lleva ``KEY_OFFSET`` celdas a la izquierda del
+'#' y ahí corren ``letter_to_number`` (y, al descifrar, ``subtract_simple``
+sobre ``26 - clave`` como ``orchestrator._inverse_shift_marks``). El
+desplazamiento S queda en marcas pegado a la izquierda del '#'.
+
+Bucle por carácter, con la cinta así::
+
+    texto_cifrado ⊢ [WORKSPACE_GAP blancos] S # T_i T_i+1 ... T_n
+
+- ``⊢`` (ANCHOR) marca el final de la salida; detrás de él, tras un blanco,
+  está la zona de trabajo donde corren los componentes. Cada componente recibe
+  su entrada como un bloque contiguo con blancos a ambos lados.
+- Se lee T_i (la celda a la derecha del '#'), se escribe ahí el nuevo '#' y se
+  lleva T_i en el estado hasta el ancla. Un carácter que no es letra se escribe
+  directamente en la salida; una letra se escribe en la zona de trabajo y pasa
+  por letter_to_number, se le agrega '+' y una copia de S (contada en el
+  estado, S nunca pasa de 26 marcas), add_simple, un pegamento que junta las marcas separadas por el '+'
+  borrado, mod26_full y number_to_letter (cortada al entrar en ``q_back``, que
+  en turing_simulator no acepta nunca). La letra resultante se lleva al ancla.
+- Al escribir en la salida el ancla avanza una celda, y luego S y el '#'
+  avanzan también una celda (el '#' viejo pasa a ser marca y se borra la
+  primera de S): las distancias no crecen con el largo del texto.
+- Al llegar al blanco tras T_n se borran S, el '#' y el ancla.
+
+El texto solo puede usar ``TEXT_ALPHABET`` (el blanco '_' no está: en la cinta
+no se distingue del fin del texto). Las letras minúsculas salen en mayúscula y
+el resto de los caracteres se copia, igual que en ``orchestrator``.
+
+La máquina usa la cinta bi-infinita de ``turing_simulator`` (la salida queda a
+la izquierda de la entrada); no sirve para ``turing_machine``, cuyo cabezal no
+pasa de la celda 0.
+
+Uso:
+    maquina = build_caesar_machine(decrypt=False)
+    tm = TuringMachine(); tm.load_data(maquina)
+    tm.run('D#HOLA', max_steps=caesar_step_budget(4), accelerate=True)  # 'KROD'
+
+Herramienta: ``tools/build_caesar_machine.py`` escribe
+``config/caesar_encrypt_composed.json`` y ``config/caesar_decrypt_composed.json``.
+"""
+from __future__ import annotations
+import json
+import os
+from typing import Any, Dict, Optional
+
+try:
+    from machine_composer import MachineComposer  # type: ignore
+except ImportError:  # importado como paquete (src.caesar_machine)
+    from .machine_composer import MachineComposer
+
+CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'config'))
+
+BLANK = '_'
+SEPARATOR = '#'
+MARK = '|'
+# Símbolo propio del compuesto (no puede aparecer en el texto)
+ANCHOR = '⊢'
+
+LETTERS = [chr(c) for c in range(ord('A'), ord('Z') + 1)]
+DIGITS = [str(d) for d in range(10)]
+TEXT_ALPHABET = tuple([chr(c) for c in range(32, 127) if chr(c) != BLANK]
+                      + list('\t\n\r') + list('ÁÉÍÓÚÜÑáéíóúüñ¡¿'))
+
+# Celdas entre el '#' y la letra clave mientras se calcula el desplazamiento
+KEY_OFFSET = 30
+# Marcas de S: hasta 25 al cifrar, hasta 26 al descifrar (26 - 0 con clave A)
+MAX_SHIFT = 26
+# Blancos entre el ancla y S: la zona de trabajo ocupa a lo sumo 53 celdas
+# (la de la letra, 25 marcas, '+' y 26 de la copia de S)
+WORKSPACE_GAP = 64
+# Pasos por carácter en el peor caso (clave Z, letra Z) y de la fase de clave
+STEPS_PER_CHAR = 1024
+KEY_STEPS = 4096
+
+COMPONENTS = {
+    'number_key': 'number_key_to_letter.json',
+    'letter_to_number': 'letter_to_number.json',
+    'subtract': 'subtract_simple.json',
+    'add': 'add_simple.json',
+    'mod26': 'mod26_full.json',
+    'number_to_letter': 'number_to_letter.json',
+}
+
+
+def caesar_step_budget(text_length: int) -> int:
+    """``max_steps`` suficiente para cifrar un texto de ``text_length`` caracteres."""
+    return KEY_STEPS + STEPS_PER_CHAR * text_length
+
+
+def _tag(ch: str) -> str:
+    """Sufijo de estado para un carácter llevado en el control finito."""
+    return ch if ch.isascii() and ch.isalnum() else f"u{ord(ch):04X}"
+
+
+def _load(name: str, config_dir: str) -> Dict[str, Any]:
+    with open(os.path.join(config_dir, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _key_phase(c: MachineComposer, decrypt: bool, comps: Dict[str, Dict[str, Any]]) -> None:
+    """De ``clave#`` a ``S#`` con S = desplazamiento en marcas; termina en q_place_anchor."""
+    # Letra: se escribe sobre el '#'. Número: number_key_to_letter la escribe ahí.
+    for letter in LETTERS:
+        for ch in (letter, letter.lower()):
+            c.add('q_start', ch, f'q_key_{letter}', BLANK, 'R')
+        c.add(f'q_key_{letter}', SEPARATOR, 'q_key_at_sep', letter)
+    for ch in [*DIGITS, SEPARATOR]:
+        c.add('q_start', ch, 'q_key_digits')
+    c.scan('q_key_digits', DIGITS, 'R')
+    c.add('q_key_digits', SEPARATOR, 'q_key_rewind', BLANK, 'L')
+    c.scan('q_key_rewind', DIGITS, 'L')
+    number_key = c.include(comps['number_key'], 'NKEY', {'q_accept': 'q_key_at_sep'})
+    c.add('q_key_rewind', BLANK, number_key, move='R')
+
+    # Llevar la letra KEY_OFFSET celdas a la izquierda (dejando el '#' en su lugar)
+    for letter in LETTERS:
+        c.add('q_key_at_sep', letter, 'q_key_park_1', move='L')
+    for i in range(1, KEY_OFFSET):
+        c.add(f'q_key_park_{i}', BLANK, f'q_key_park_{i + 1}', move='L')
+    c.add(f'q_key_park_{KEY_OFFSET}', BLANK, 'q_key_back', ANCHOR, 'R')
+    c.scan('q_key_back', [BLANK], 'R')
+    after_key = 'q_inv_start' if decrypt else 'q_shift_ready'
+    key_marks = c.include(comps['letter_to_number'], 'KL2N', {'q_accept': after_key})
+    for letter in LETTERS:
+        c.add('q_key_back', letter, f'q_key_drop_{letter}', SEPARATOR, 'L')
+        c.scan(f'q_key_drop_{letter}', [BLANK], 'L')
+        c.add(f'q_key_drop_{letter}', ANCHOR, key_marks, letter)
+
+    if decrypt:
+        # |^26 - |^k a la izquierda de las marcas de la clave
+        c.scan('q_inv_start', [MARK], 'L')
+        c.add('q_inv_start', BLANK, 'q_const_1', '-', 'L')
+        for i in range(1, 26):
+            c.add(f'q_const_{i}', BLANK, f'q_const_{i + 1}', MARK, 'L')
+        subtract = c.include(comps['subtract'], 'SUB', {'q_accept': 'q_gather'})
+        c.add('q_const_26', BLANK, subtract, MARK)
+        # subtract_simple deja "| _^k |^(25-k)": se junta la primera marca con el resto
+        c.add('q_gather', MARK, 'q_gather_next', move='R')
+        c.add('q_gather_next', MARK, 'q_slide')
+        c.add('q_gather_next', BLANK, 'q_gather_scan', move='R')
+        c.scan('q_gather_scan', [BLANK], 'R')
+        c.add('q_gather_scan', MARK, 'q_gather_put', move='L')
+        c.add('q_gather_scan', SEPARATOR, 'q_gather_home', move='L')
+        c.add('q_gather_put', BLANK, 'q_gather_erase', MARK, 'L')
+        c.scan('q_gather_erase', [BLANK], 'L')
+        c.add('q_gather_erase', MARK, 'q_gather_to_block', BLANK, 'R')
+        c.scan('q_gather_to_block', [BLANK], 'R')
+        c.add('q_gather_to_block', MARK, 'q_slide')
+        c.scan('q_gather_home', [BLANK], 'L')
+        c.add('q_gather_home', MARK, 'q_slide')
+    else:
+        c.add('q_shift_ready', MARK, 'q_slide')
+        c.add('q_shift_ready', BLANK, 'q_seek_sep', move='R')
+        c.scan('q_seek_sep', [BLANK], 'R')
+        c.add('q_seek_sep', SEPARATOR, 'q_anchor_scan', move='L')
+
+    # Correr S a la derecha hasta pegarlo al '#': se pasa la primera marca al final
+    c.scan('q_slide', [MARK], 'R')
+    c.add('q_slide', SEPARATOR, 'q_anchor_scan', move='L')
+    c.add('q_slide', BLANK, 'q_slide_back', MARK, 'L')
+    c.scan('q_slide_back', [MARK], 'L')
+    c.add('q_slide_back', BLANK, 'q_slide_erase', move='R')
+    c.add('q_slide_erase', MARK, 'q_slide', BLANK, 'R')
+
+    # Ancla WORKSPACE_GAP blancos a la izquierda de S
+    c.scan('q_anchor_scan', [MARK], 'L')
+    c.add('q_anchor_scan', BLANK, 'q_gap_2', move='L')
+    for i in range(2, WORKSPACE_GAP):
+        c.add(f'q_gap_{i}', BLANK, f'q_gap_{i + 1}', move='L')
+    c.add(f'q_gap_{WORKSPACE_GAP}', BLANK, 'q_place_anchor', move='L')
+
+
+def _letter_pipeline(c: MachineComposer, comps: Dict[str, Dict[str, Any]]) -> str:
+    """Letra en la zona de trabajo -> letra cifrada llevada al ancla; devuelve la entrada."""
+    l2n = c.include(comps['letter_to_number'], 'L2N', {'q_accept': 'q_plus'})
+
+    # "marcas_letra +" y una copia de S a continuación. S tiene a lo sumo 26
+    # marcas: se cuentan en el estado (q_count_j) y se escriben de una vez.
+    c.scan('q_plus', [MARK], 'R')
+    c.add('q_plus', BLANK, 'q_copy_seek', '+', 'R')
+    c.scan('q_copy_seek', [BLANK], 'R')
+    c.add('q_copy_seek', MARK, 'q_count_0')
+    c.add('q_copy_seek', SEPARATOR, 'q_count_0')
+    for j in range(MAX_SHIFT + 1):
+        if j < MAX_SHIFT:
+            c.add(f'q_count_{j}', MARK, f'q_count_{j + 1}', move='R')
+        c.add(f'q_count_{j}', SEPARATOR, f'q_copy_back_{j}')
+        c.scan(f'q_copy_back_{j}', [SEPARATOR, MARK], 'L')
+        c.add(f'q_copy_back_{j}', BLANK, f'q_copy_gap_{j}', move='L')
+        c.scan(f'q_copy_gap_{j}', [BLANK], 'L')
+        for sym in (MARK, '+'):
+            c.add(f'q_copy_gap_{j}', sym, f'q_copy_write_{j}', move='R')
+        if j:
+            c.add(f'q_copy_write_{j}', BLANK, f'q_copy_write_{j - 1}', MARK, 'R')
+        else:
+            c.add('q_copy_write_0', BLANK, 'q_add_rewind', move='L')
+    c.scan('q_add_rewind', [MARK, '+'], 'L')
+
+    add = c.include(comps['add'], 'ADD', {'q_accept': 'q_join'})
+    c.add('q_add_rewind', BLANK, add, move='R')
+
+    # add_simple borra el '+' y deja "a _ b": se pasa la primera marca al hueco
+    c.add('q_join', BLANK, 'q_join_scan', move='L')
+    c.scan('q_join_scan', [MARK], 'L')
+    c.add('q_join_scan', BLANK, 'q_join_check', move='L')
+    c.add('q_join_check', MARK, 'q_join_fill', move='R')
+    c.add('q_join_check', BLANK, 'q_join_skip', move='R')
+    c.add('q_join_fill', BLANK, 'q_join_rewind', MARK, 'L')
+    c.scan('q_join_rewind', [MARK], 'L')
+    c.add('q_join_rewind', BLANK, 'q_join_drop', move='R')
+
+    n2l = c.include(comps['number_to_letter'], 'N2L',
+                    {'q_accept': 'q_deliver_take', 'q_back': 'q_deliver'})
+    mod26 = c.include(comps['mod26'], 'MOD', {'q_accept': n2l})
+    c.add('q_join_drop', MARK, mod26, BLANK, 'R')
+    c.add('q_join_skip', BLANK, mod26, move='R')
+
+    # La letra queda a la derecha del cabezal (q_back) o bajo él (q_accept)
+    c.add('q_deliver', BLANK, 'q_deliver_take', move='R')
+    for letter in LETTERS:
+        c.add('q_deliver_take', letter, f'q_put_{letter}', BLANK, 'L')
+    return l2n
+
+
+def build_caesar_machine(decrypt: bool = False, config_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Definición JSON de la MT que cifra (o descifra) ``clave#texto`` en una ejecución."""
+    config_dir = config_dir or CONFIG_DIR
+    comps = {role: _load(name, config_dir) for role, name in COMPONENTS.items()}
+    c = MachineComposer(BLANK)
+    _key_phase(c, decrypt, comps)
+    c.add('q_place_anchor', BLANK, 'q_begin', ANCHOR, 'R')
+    c.scan('q_begin', [BLANK, MARK], 'R')
+    c.add('q_begin', SEPARATOR, 'q_read', move='R')
+
+    # Tomar T_i: el '#' avanza sobre su celda y T_i viaja en el estado hasta el ancla
+    carried = {}
+    for ch in TEXT_ALPHABET:
+        up = ch.upper() if 'a' <= ch <= 'z' else ch
+        carried.setdefault(up, f'q_carry_{_tag(up)}')
+        c.add('q_read', ch, carried[up], SEPARATOR, 'L')
+    for ch, state in carried.items():
+        c.scan(state, [SEPARATOR, MARK], 'L')
+        gap_state = f'q_carry_gap_{_tag(ch)}'
+        c.add(state, BLANK, gap_state, move='L')
+        c.scan(gap_state, [BLANK], 'L')
+        if ch in LETTERS:
+            c.add(gap_state, ANCHOR, f'q_ws_{ch}', move='R')
+            c.add(f'q_ws_{ch}', BLANK, f'q_ws_write_{ch}', move='R')
+        else:
+            c.add(gap_state, ANCHOR, 'q_reanchor', ch, 'R')
+
+    pipeline = _letter_pipeline(c, comps)
+    for letter in LETTERS:
+        c.add(f'q_ws_write_{letter}', BLANK, pipeline, letter)
+        c.scan(f'q_put_{letter}', [BLANK], 'L')
+        c.add(f'q_put_{letter}', ANCHOR, 'q_reanchor', letter, 'R')
+
+    # Ancla una celda más allá; S y el '#' viejo avanzan una celda
+    c.add('q_reanchor', BLANK, 'q_to_sep', ANCHOR, 'R')
+    c.scan('q_to_sep', [BLANK, MARK], 'R')
+    c.add('q_to_sep', SEPARATOR, 'q_shift_back', MARK, 'L')
+    c.scan('q_shift_back', [MARK], 'L')
+    c.add('q_shift_back', BLANK, 'q_shift_erase', move='R')
+    c.add('q_shift_erase', MARK, 'q_shift_fwd', BLANK, 'R')
+    c.scan('q_shift_fwd', [MARK], 'R')
+    c.add('q_shift_fwd', SEPARATOR, 'q_read', move='R')
+
+    # Fin del texto: borrar '#', S y el ancla; volver al inicio de la salida
+    c.add('q_read', BLANK, 'q_finish', move='L')
+    c.add('q_finish', SEPARATOR, 'q_finish_marks', BLANK, 'L')
+    c.add('q_finish_marks', MARK, 'q_finish_marks', BLANK, 'L')
+    c.add('q_finish_marks', BLANK, 'q_finish_gap', move='L')
+    c.scan('q_finish_gap', [BLANK], 'L')
+    c.add('q_finish_gap', ANCHOR, 'q_finish_home', BLANK, 'L')
+    c.scan('q_finish_home', TEXT_ALPHABET, 'L')
+    c.add('q_finish_home', BLANK, 'q_accept', move='R')
+
+    mode = 'descifrado' if decrypt else 'cifrado'
+    return c.build(
+        'q_start', ['q_accept'], TEXT_ALPHABET,
+        description=f"MT de {mode} César en una sola ejecución (compuesta por tools/build_caesar_machine.py)",
+        purpose="Entrada: clave#texto (clave A-Z o 1..27); salida: el texto " + mode,
+        components=[name for role, name in COMPONENTS.items() if decrypt or role != 'subtract'],
+    )
@@ -0,0 +1,122 @@
+"""checkpoint.py
+
+Configuraciones instantáneas (checkpoints) de una MT: estado, cabezales, cintas
+y pasos ejecutados. Permiten continuar una ejecución que agotó ``max_steps``
+(``TuringMachine.resume``) en el mismo proceso, en otro o en otro equipo.
+
+Las cintas se guardan como los códigos de un byte que usan los simuladores
+(``tape.Tape`` y ``turing_machine``), junto con la tabla de símbolos para
+decodificarlos. En disco el formato es compacto:
+
+    TMCHK1\\n
+    <encabezado JSON en una línea>\\n
+    <códigos de todas las cintas concatenados, comprimidos con zlib>
+
+El encabezado incluye un hash de la definición de la máquina: reanudar con una
+máquina distinta produce ``ValueError`` en lugar de un resultado sin sentido.
+
+Uso:
+    tm = new_machine('config/mod26_full.json')
+    tm.run('|' * 5000, max_steps=100000)
+    save_checkpoint(tm.checkpoint(), 'mod26.tmck')
+    ...
+    tm.resume(load_checkpoint('mod26.tmck'), extra_steps=10**6)
+"""
+from __future__ import annotations
+import json
+import zlib
+import hashlib
+from typing import Any, Dict, List, Optional
+
+MAGIC = b'TMCHK1\n'
+
+
+def definition_digest(fields: Any) -> str:
+    """Hash estable de los campos que definen una máquina (estados, transiciones, ...)."""
+    raw = json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class Checkpoint:
+    """Configuración de una MT en un instante.
+
+    - ``engine``: ``'single'`` (turing_simulator) o ``'multi'`` (turing_machine).
+    - ``machine``: hash de la definición (``definition_digest``).
+    - ``tapes[i]``: códigos de la cinta i; la celda ``j`` está en la posición
+      absoluta ``origins[i] + j``. ``heads[i]`` es la posición absoluta del cabezal.
+    - ``symbols``: tabla de decodificación de los códigos.
+    - ``foreign``: posición -> símbolo de las celdas fuera del alfabeto (cinta 0);
+      sus códigos son ``len(symbols)`` o mayores.
+    - ``foreign_extra``: lo mismo para las cintas 1, 2, ... (multi-cinta).
+    """
+
+    def __init__(self, engine: str, machine: str, state: Optional[str], steps: int,
+                 symbols: List[str], tapes: List[bytes], origins: List[int], heads: List[int],
+                 halted: bool = False, foreign: Optional[Dict[int, str]] = None,
+                 source: Optional[str] = None, foreign_extra: Optional[List[Dict[int, str]]] = None):
+        self.engine = engine
+        self.machine = machine
+        self.state = state
+        self.steps = steps
+        self.symbols = symbols
+        self.tapes = tapes
+        self.origins = origins
+        self.heads = heads
+        self.halted = halted
+        self.foreign = foreign or {}
+        self.foreign_extra = foreign_extra or []
+        self.source = source
+
+    def check(self, engine: str, machine: str) -> None:
+        """ValueError si el checkpoint no corresponde a ese simulador y máquina."""
+        if self.engine != engine:
+            raise ValueError(f"Checkpoint de otro simulador ('{self.engine}', se esperaba '{engine}')")
+        if self.machine != machine:
+            raise ValueError("El checkpoint corresponde a otra definición de máquina")
+
+    def to_bytes(self) -> bytes:
+        header = {
+            'engine': self.engine,
+            'machine': self.machine,
+            'source': self.source,
+            'state': self.state,
+            'steps': self.steps,
+            'halted': self.halted,
+            'symbols': self.symbols,
+            'origins': self.origins,
+            'heads': self.heads,
+            'lengths': [len(t) for t in self.tapes],
+            'foreign': sorted(self.foreign.items()),
+        }
+        if any(self.foreign_extra):
+            header['foreign_extra'] = [sorted(cells.items()) for cells in self.foreign_extra]
+        line = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return MAGIC + line + b'\n' + zlib.compress(b''.join(self.tapes))
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'Checkpoint':
+        if not raw.startswith(MAGIC):
+            raise ValueError("No es un archivo de checkpoint de MT")
+        end = raw.index(b'\n', len(MAGIC))
+        header = json.loads(raw[len(MAGIC):end].decode('utf-8'))
+        data = zlib.decompress(raw[end + 1:])
+        tapes = []
+        offset = 0
+        for length in header['lengths']:
+            tapes.append(data[offset:offset + length])
+            offset += length
+        return cls(header['engine'], header['machine'], header['state'], header['steps'],
+                   header['symbols'], tapes, header['origins'], header['heads'],
+                   halted=header['halted'], foreign={pos: sym for pos, sym in header['foreign']},
+                   source=header.get('source'),
+                   foreign_extra=[{pos: sym for pos, sym in cells} for cells in header.get('foreign_extra', [])])
+
+
+def save_checkpoint(checkpoint: Checkpoint, path: str) -> None:
+    with open(path, 'wb') as f:
+        f.write(checkpoint.to_bytes())
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    with open(path, 'rb') as f:
+        return Checkpoint.from_bytes(f.read())
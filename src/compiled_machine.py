@@ -0,0 +1,229 @@
+"""compiled_machine.py
+
+Compilación de una definición JSON de MT (una cinta) a una tabla de
+transiciones indexada.
+
+- Cada estado y cada símbolo recibe un identificador entero (id).
+- La tabla es densa: ``table[symbol_id * n_states + state_id]`` contiene
+  ``(next_state_id, write_symbol_id, move_delta, transition_index)`` o ``None``.
+- Se respeta la regla "gana la primera coincidencia declarada": si el JSON
+  repite un par (estado, símbolo), solo la primera transición ocupa la celda.
+
+La búsqueda por paso queda en O(1) sin importar cuántas transiciones tenga la
+máquina. Los ids de símbolo son también los códigos de celda de ``tape.Tape``
+(el blanco es siempre 0, como máximo 255 símbolos). Los caracteres de entrada
+fuera del alfabeto comparten el id ``foreign_id`` (``len(symbols)``), cuya fila
+de la tabla está vacía: leerlos detiene la máquina. Así la definición no cambia
+después de compilarla y puede compartirse entre hilos sin bloqueos.
+
+También se detectan las transiciones de "barrido": el estado no cambia, el
+símbolo se reescribe igual y el cabezal se mueve L o R. ``sweep[slot]`` guarda
+la dirección (0 si no es barrido) y ``sweep_symbols[state]`` los códigos (bytes)
+que el estado barre hacia cada lado; el modo acelerado del simulador los usa para
+saltar una racha completa de celdas en una sola operación.
+
+Por último se fusionan las cadenas deterministas de estados
+(superinstrucciones): si desde un estado solo hay un camino posible -su única
+transición, o el único escalón de una "escalera" de conteo como q_1 → q_2 → ...
+de number_to_letter- y todos los pasos se mueven en la misma dirección,
+``chains[slot]`` (slot del primer paso) guarda la secuencia completa como un
+``FusedChain``. El
+simulador la ejecuta comparando y escribiendo la franja de cinta de una sola vez.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+
+# Desplazamiento del cabezal para cada movimiento; cualquier otro valor es 'N'.
+MOVE_DELTA = {'L': -1, 'R': 1}
+
+Entry = Tuple[int, int, int, int]
+
+# Longitud máxima de una cadena fusionada (acota memoria y ciclos de enlaces).
+CHAIN_LIMIT = 256
+
+
+class FusedChain:
+    """Secuencia determinista de pasos que avanza en una sola dirección.
+
+    El paso ``j`` lee el código ``reads[j]`` en la posición
+    ``inicio + direction * j``, escribe ``writes[j]`` y deja la máquina en
+    ``states[j]``. Solo el último paso puede moverse distinto (``last_delta``).
+    """
+    __slots__ = ('reads', 'writes', 'states', 'direction', 'last_delta',
+                 'first_nb', 'last_nb')
+
+    def __init__(self, reads: bytes, writes: bytes, states: List[int],
+                 direction: int, last_delta: int, blank: int):
+        self.reads = reads
+        self.writes = writes
+        self.states = states
+        self.direction = direction
+        self.last_delta = last_delta
+        # Índices de la primera/última escritura no blanca entre los primeros m pasos
+        # (last_nb[m]); -1 si no hay. Permite actualizar las cotas de la cinta sin recorrer.
+        marked = [j for j, w in enumerate(writes) if w != blank]
+        self.first_nb = marked[0] if marked else -1
+        self.last_nb = [-1] * (len(writes) + 1)
+        for j, w in enumerate(writes):
+            self.last_nb[j + 1] = j if w != blank else self.last_nb[j]
+
+    def __len__(self) -> int:
+        return len(self.reads)
+
+
+class CompiledMachine:
+    """Tabla de transiciones indexada por ids enteros de estado y símbolo."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.blank_symbol: str = data.get('blank_symbol', '_')
+        self.initial_state: Optional[str] = data.get('initial_state')
+        self.transitions: List[Dict[str, Any]] = data.get('transitions', [])
+
+        self.state_names: List[str] = []
+        self.state_ids: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self.symbol_ids: Dict[str, int] = {}
+
+        # Los estados deben quedar fijos antes de construir la tabla.
+        for s in data.get('states', []):
+            self._add_state(s)
+        if self.initial_state is not None:
+            self._add_state(self.initial_state)
+        for s in data.get('accept_states', []):
+            self._add_state(s)
+        for t in self.transitions:
+            cur = t.get('current_state')
+            if cur is None or t.get('read_symbol') is None:
+                continue
+            self._add_state(cur)
+            self._add_state(t.get('next_state', cur))
+        self.n_states = len(self.state_names)
+
+        accept = set(data.get('accept_states', []))
+        self.accepting: List[bool] = [name in accept for name in self.state_names]
+
+        self.table: List[Optional[Entry]] = []
+        self.sweep: List[int] = []
+        self.chains: List[Optional[FusedChain]] = []
+        self.intern_symbol(self.blank_symbol)
+        for s in data.get('tape_alphabet', []):
+            self.intern_symbol(s)
+        self.blank_id = self.symbol_ids[self.blank_symbol]
+
+        for index, t in enumerate(self.transitions):
+            cur = t.get('current_state')
+            read = t.get('read_symbol')
+            if cur is None or read is None:
+                continue
+            write = t.get('write_symbol', read)
+            slot = self.intern_symbol(read) * self.n_states + self.state_ids[cur]
+            if self.table[slot] is not None:
+                continue  # primera coincidencia declarada gana
+            self.table[slot] = (
+                self.state_ids[t.get('next_state', cur)],
+                self.intern_symbol(write),
+                MOVE_DELTA.get(t.get('move', 'N'), 0),
+                index,
+            )
+
+        # (izquierda, derecha) por estado; solo cuentan las entradas efectivas.
+        left_sets: List[set] = [set() for _ in range(self.n_states)]
+        right_sets: List[set] = [set() for _ in range(self.n_states)]
+        for slot, entry in enumerate(self.table):
+            if entry is None:
+                continue
+            sym, sid = divmod(slot, self.n_states)
+            next_id, write_id, delta, _ = entry
+            if next_id == sid and write_id == sym and delta != 0:
+                self.sweep[slot] = delta
+                (right_sets if delta > 0 else left_sets)[sid].add(sym)
+        self.sweep_symbols: List[Tuple[bytes, bytes]] = [
+            (bytes(sorted(l)), bytes(sorted(r))) for l, r in zip(left_sets, right_sets)
+        ]
+
+        self._build_chains()
+
+        # Fila vacía para los caracteres fuera del alfabeto.
+        self.foreign_id = len(self.symbols)
+        self.table.extend([None] * self.n_states)
+        self.sweep.extend([0] * self.n_states)
+        self.chains.extend([None] * self.n_states)
+
+    def _build_chains(self) -> None:
+        n = self.n_states
+        outgoing: List[List[Tuple[int, Entry]]] = [[] for _ in range(n)]
+        for slot, entry in enumerate(self.table):
+            if entry is not None:
+                sym, sid = divmod(slot, n)
+                outgoing[sid].append((sym, entry))
+        # Transiciones que cambian de estado y mueven el cabezal, por estado.
+        moves: List[set] = [
+            {e[2] for _, e in out if e[0] != sid and e[2] != 0}
+            for sid, out in enumerate(outgoing)
+        ]
+        links: List[Optional[Tuple[int, Entry]]] = [None] * n
+        for sid, out in enumerate(outgoing):
+            if self.accepting[sid]:
+                continue
+            if len(out) == 1 and out[0][1][0] != sid:
+                links[sid] = out[0]
+                continue
+            # Escalera: un único escalón cuyo destino sigue en la misma dirección.
+            steps = [(sym, e) for sym, e in out
+                     if e[0] != sid and e[2] != 0 and e[2] in moves[e[0]]]
+            if len(steps) == 1:
+                links[sid] = steps[0]
+
+        for sid in range(n):
+            reads: List[int] = []
+            writes: List[int] = []
+            states: List[int] = []
+            direction = 0
+            delta = 0
+            cur = sid
+            while len(reads) < CHAIN_LIMIT and links[cur] is not None:
+                sym, (nxt, write_id, delta, _) = links[cur]  # type: ignore[misc]
+                reads.append(sym)
+                writes.append(write_id)
+                states.append(nxt)
+                if len(reads) == 1:
+                    direction = delta
+                if delta == 0 or delta != direction or self.accepting[nxt]:
+                    break
+                cur = nxt
+            if len(reads) >= 2:
+                slot = links[sid][0] * n + sid  # type: ignore[index]
+                self.chains[slot] = FusedChain(bytes(reads), bytes(writes), states, direction, delta,
+                                               self.blank_id)
+
+    def _add_state(self, name: str) -> int:
+        sid = self.state_ids.get(name)
+        if sid is None:
+            sid = len(self.state_names)
+            self.state_ids[name] = sid
+            self.state_names.append(name)
+        return sid
+
+    def intern_symbol(self, symbol: str) -> int:
+        """Devuelve el id de ``symbol``, agregándolo (sin transiciones) si es nuevo.
+        Solo se usa durante la compilación."""
+        sym = self.symbol_ids.get(symbol)
+        if sym is None:
+            sym = len(self.symbols)
+            if sym >= 255:
+                raise ValueError("La máquina usa más de 255 símbolos distintos")
+            self.table.extend([None] * self.n_states)
+            self.sweep.extend([0] * self.n_states)
+            self.chains.extend([None] * self.n_states)
+            self.symbols.append(symbol)
+            self.symbol_ids[symbol] = sym
+        return sym
+
+    def lookup(self, state: Optional[str], symbol: str) -> Optional[Entry]:
+        """Busca δ(state, symbol) en O(1); ``None`` si no hay transición."""
+        sid = self.state_ids.get(state)  # type: ignore[arg-type]
+        sym = self.symbol_ids.get(symbol)
+        if sid is None or sym is None:
+            return None
+        return self.table[sym * self.n_states + sid]
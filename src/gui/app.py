@@ -13,7 +13,6 @@ from __future__ import annotations
 import os
 import sys
 import re
-import json
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 
@@ -24,12 +23,33 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
 from turing_machine import TuringMachine  # type: ignore
+from observers import StepObserver  # type: ignore
+from machine_registry import default_registry  # type: ignore
+from gui.tape_view import CanvasText, FrameLimiter, TapeView  # type: ignore
+from gui.turbo import ACCEPTED, ERROR, HALTED, MAX_STEPS, TurboRunner  # type: ignore
 
 # Eliminado soporte específico de Cifrado César en Python.
 # La GUI ahora es puramente universal: cualquier JSON cargado se simula.
 PipelineStep = None  # Mantener referencias opcionales inertes
 
 
+class LastTransition(StepObserver):
+    """Observador que guarda el último paso ejecutado (etiqueta δ de la vista)."""
+
+    def __init__(self):
+        self.event = None
+
+    def on_step(self, tm, event):
+        self.event = event
+
+    @staticmethod
+    def describe(event) -> str:
+        def fmt(values):
+            return values[0] if len(values) == 1 else f"({', '.join(values)})"
+        return (f"({event.state}, {fmt(event.reads)}) → "
+                f"({event.next_state}, {fmt(event.writes)}, {fmt(event.moves)})")
+
+
 class TMVisualizer(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -44,6 +64,12 @@ class TMVisualizer(tk.Tk):
         self.step_delay_ms = tk.IntVar(value=300)
         self.max_steps = tk.IntVar(value=100000)
         self.step_count = 0
+        # Modo turbo: la MT corre en un hilo aparte y la vista lee sus instantáneas
+        self.var_turbo = tk.BooleanVar(value=False)
+        self.turbo: TurboRunner | None = None
+        self.turbo_view = None
+        # Paso ejecutado más reciente, informado por la MT (ver observers.py)
+        self.last_transition = LastTransition()
         self.cfg_input_alphabet: set[str] = set()
         self.cfg_blank: str = '_'
         self.cfg_example: str | None = None
@@ -105,6 +131,8 @@ class TMVisualizer(tk.Tk):
         ttk.Label(speed_frame, text="Max steps:").pack(side=tk.LEFT, padx=(8, 4))
         self.spin_max = ttk.Spinbox(speed_frame, from_=1, to=1000000, textvariable=self.max_steps, width=8)
         self.spin_max.pack(side=tk.LEFT)
+        ttk.Checkbutton(speed_frame, text="Turbo (hilo aparte, sin demora)",
+                        variable=self.var_turbo).pack(side=tk.LEFT, padx=(12, 0))
 
         # Panel César eliminado: se quitó completamente; no se crean controles.
 
@@ -170,6 +198,16 @@ class TMVisualizer(tk.Tk):
         canvas_frame.rowconfigure(0, weight=1)
         self.canvas = tk.Canvas(canvas_frame, bg="white")
         self.canvas.grid(row=0, column=0, sticky=tk.NSEW)
+        # Vista retenida: los ítems se crean una vez y cada cuadro actualiza solo lo que cambió
+        self.tape_view = TapeView(self.canvas, 20, 40, window=31, cell_w=34, cell_h=50,
+                                  font=("Courier New", 16, "bold"),
+                                  markers=[dict(text="▼", fill="red", font=("Arial", 20), dy=-18)])
+        self.multi_views: list[TapeView] = []
+        self.txt_stage = CanvasText(self.canvas, 0, 0, fill="purple", font=("Segoe UI", 11, "bold"))
+        self.txt_q = CanvasText(self.canvas, 0, 0, fill="blue", font=("Segoe UI", 12, "bold"))
+        self.txt_delta = CanvasText(self.canvas, 0, 0, fill="darkgreen", font=("Segoe UI", 10))
+        self.frames = FrameLimiter(self, self._render_view)
+        self._pending_delta = None
 
         # Right info panel
         info = ttk.LabelFrame(main_pane, text="Estado y Transición")
@@ -248,10 +286,14 @@ class TMVisualizer(tk.Tk):
         )
         if not fn:
             return
-        tm = TuringMachine()
-        if not tm.load_config(fn):
-            messagebox.showerror("Error", "No se pudo cargar la configuración")
+        self._stop_turbo()
+        try:
+            meta = default_registry.config(fn)
+            tm = default_registry.new_multi_machine(fn)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo cargar la configuración: {e}")
             return
+        tm.add_observer(self.last_transition)
         self.tm = tm
         self.loaded_config = fn
         self.lbl_cfg.configure(text=os.path.basename(fn), foreground="black")
@@ -259,8 +301,6 @@ class TMVisualizer(tk.Tk):
 
         # Leer metadatos (Σ, blank, example) del JSON para validar entrada y sugerencias
         try:
-            with open(fn, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
             sigma = meta.get('input_alphabet') or []
             self.cfg_input_alphabet = set(sigma)
             self.cfg_blank = meta.get('blank_symbol', '_') or '_'
@@ -294,6 +334,7 @@ class TMVisualizer(tk.Tk):
                 msg += f"\n\nEjemplo sugerido: {self._example_suggestion}"
             messagebox.showwarning("Entrada inválida", msg)
             return
+        self._stop_turbo()
         self.tm.initialize_tape(w)
         self.step_count = 0
         self.running = False
@@ -301,19 +342,17 @@ class TMVisualizer(tk.Tk):
         self._log(f"Inicializado con w='{w}'")
 
     def _on_step(self):
-        if not self.tm:
+        if not self.tm or self.turbo:
             return
         if self.tm.is_accepting_state():
             self._log("Estado de aceptación alcanzado")
             self.running = False
             return
-        # Obtener transición antes de ejecutarla
-        state = self._get_state()
-        sym = self._get_symbol()
-        delta = self._find_delta(state, sym)
+        # La transición aplicada la informa la MT a su observador
+        self.last_transition.event = None
         progressed = self.tm.step()  # bool
         self.step_count += 1
-        self._refresh_view(delta=delta)
+        self._refresh_view(delta=self.last_transition.event)
         if not progressed:
             self._log("Sin transición definida: ejecución detenida")
             self.running = False
@@ -324,7 +363,10 @@ class TMVisualizer(tk.Tk):
         if self.running:
             return
         self.running = True
-        self._run_loop()
+        if self.var_turbo.get():
+            self._start_turbo()
+        else:
+            self._run_loop()
 
     def _run_loop(self):
         if not self.running or not self.tm:
@@ -343,6 +385,59 @@ class TMVisualizer(tk.Tk):
 
     def _on_pause(self):
         self.running = False
+        if self.turbo:
+            self._stop_turbo()
+            self._log(f"Pausa en el paso {self.step_count}")
+
+    # ---- Modo turbo ----
+    def _start_turbo(self):
+        if self.tm.is_accepting_state():
+            self._log("Estado de aceptación alcanzado")
+            self.running = False
+            return
+        # En turbo no se dibuja cada paso: sin observadores la MT no arma eventos
+        self.tm.remove_observer(self.last_transition)
+        self.turbo = TurboRunner(self.tm, self.max_steps.get(), steps=self.step_count)
+        self.turbo.start()
+        self._poll_turbo()
+
+    def _poll_turbo(self):
+        runner = self.turbo
+        if runner is None:
+            return
+        snapshot = runner.latest()
+        if snapshot is not None:
+            self.turbo_view = snapshot
+            self.step_count = snapshot.steps
+            self._refresh_view(delta=None)
+            if snapshot.finished is not None:
+                self._stop_turbo()
+                self.running = False
+                messages = {
+                    ACCEPTED: "Estado de aceptación alcanzado",
+                    HALTED: "Sin transición definida: ejecución detenida",
+                    MAX_STEPS: "Se alcanzó el máximo de pasos",
+                    ERROR: f"Error durante la ejecución: {snapshot.error}",
+                }
+                self._log(f"{messages[snapshot.finished]} ({self.step_count} pasos)")
+                return
+        self.after(int(runner.interval * 1000), self._poll_turbo)
+
+    def _stop_turbo(self):
+        """Detiene el hilo turbo (si corre) y vuelve a dibujar desde la MT."""
+        runner = self.turbo
+        if runner is None:
+            return
+        runner.stop()
+        runner.tm.add_observer(self.last_transition)
+        self.turbo = None
+        self.turbo_view = None
+        self.step_count = runner.steps
+        self._refresh_view(delta=None)
+
+    def _machine_view(self):
+        """Lo que se dibuja: la última instantánea en turbo, si no la MT."""
+        return self.turbo_view if self.turbo else self.tm
 
     def _on_reset(self):
         if not self.tm:
@@ -355,14 +450,21 @@ class TMVisualizer(tk.Tk):
 
     # ---- Rendering and helpers ----
     def _refresh_view(self, delta):
+        # Se dibuja en el próximo cuadro; pasos intermedios más rápidos que el refresco no se dibujan
+        self._pending_delta = delta
+        self.frames.request()
+
+    def _render_view(self):
+        if self.turbo and self.turbo_view is None:
+            return  # El hilo turbo todavía no publicó una instantánea
+        delta = self._pending_delta
         # Update info labels
         state = self._get_state()
         sym = self._get_symbol()
         self.lbl_state.configure(text=str(state))
         self.lbl_symbol.configure(text=str(sym))
         if delta:
-            qn, wr, mv = delta
-            self.lbl_delta.configure(text=f"({state}, {sym}) → ({qn}, {wr}, {mv})")
+            self.lbl_delta.configure(text=LastTransition.describe(delta))
         else:
             self.lbl_delta.configure(text="-")
         self.lbl_steps.configure(text=str(self.step_count))
@@ -370,134 +472,119 @@ class TMVisualizer(tk.Tk):
         # Draw tape
         self._draw_tape()
 
+    @staticmethod
+    def _visible_range(head, length, window):
+        """Celdas [start, end) visibles alrededor del cabezal."""
+        half = window // 2
+        start = max(0, head - half)
+        end = max(start + window, head + half + 1)
+        if end > length:
+            end = length
+            start = max(0, end - window)
+        return start, end
+
     def _draw_tape(self):
-        self.canvas.delete("all")
         active_steps = self._get_active_pipeline_steps()
-        if self.pipeline_mode and active_steps:
-            step = active_steps[self.pipeline_index]
-            tape = step.tape
-            head = step.head
-            blank = '_'
-        else:
-            tape, head, blank = self._get_tape_snapshot()
+        tm = self._machine_view()
         
         # Detectar si es multi-cinta
-        if self.tm and hasattr(self.tm, 'num_tapes') and self.tm.num_tapes > 1:
-            self._draw_multitape()
-            return
+        if tm and hasattr(tm, 'num_tapes') and tm.num_tapes > 1:
+            self.tape_view.hide()
+            for item in (self.txt_stage, self.txt_q, self.txt_delta):
+                item.hide()
+            self._draw_multitape(tm)
+            return
+        for view in self.multi_views:
+            view.hide()
         
         # Define visible window around head
-        window = 31
-        half = window // 2
-        start = max(0, head - half)
-        end = max(start + window, head + half + 1)
-        if end > len(tape):
-            end = len(tape)
-            start = max(0, end - window)
-
-        cell_w, cell_h = 34, 50
-        margin_x, margin_y = 20, 40
-        y = margin_y
-
-        for i in range(start, end):
-            x = margin_x + (i - start) * cell_w
-            is_head = (i == head)
-            fill = "#fff6cc" if is_head else "white"
-            self.canvas.create_rectangle(x, y, x + cell_w, y + cell_h, fill=fill, outline="#333")
-            ch = tape[i]
-            disp = ch if ch != '_' else '⊔'
-            self.canvas.create_text(x + cell_w/2, y + cell_h/2, text=disp, font=("Courier New", 16, "bold"))
-            if is_head:
-                self.canvas.create_text(x + cell_w/2, y - 18, text="▼", fill="red", font=("Arial", 20))
+        window = self.tape_view.window
+        if self.pipeline_mode and active_steps:
+            step = active_steps[self.pipeline_index]
+            start, end = self._visible_range(step.head, len(step.tape), window)
+            cells, head, length = step.tape[start:end], step.head, len(step.tape)
+        elif tm and hasattr(tm, 'tape_window'):
+            # Solo se decodifica el tramo visible de la cinta
+            head = tm.head_positions[0]
+            length = tm.tape_length(0)
+            start, end = self._visible_range(head, length, window)
+            cells = tm.tape_window(0, start, end)
+        else:
+            tape, head, blank = self._get_tape_snapshot()
+            length = len(tape)
+            start, end = self._visible_range(head, length, window)
+            cells = tape[start:end]
+        self.tape_view.show(cells, head - start)
 
         # State label under the tape
+        cell_w, cell_h = self.tape_view.cell_w, self.tape_view.cell_h
+        x = self.tape_view.x + (min(window, length) * cell_w)/2
+        y = self.tape_view.y
         if self.pipeline_mode and active_steps:
             current = active_steps[self.pipeline_index]
-            self.canvas.create_text(margin_x + (min(window, len(tape)) * cell_w)/2, y + cell_h + 16,
-                                    text=f"Etapa: {current.stage}", fill="purple", font=("Segoe UI", 11, "bold"))
-            self.canvas.create_text(margin_x + (min(window, len(tape)) * cell_w)/2, y + cell_h + 36,
-                                    text=f"q = {current.state}", fill="blue", font=("Segoe UI", 12, "bold"))
+            self.txt_stage.set(f"Etapa: {current.stage}", x, y + cell_h + 16)
+            self.txt_q.set(f"q = {current.state}", x, y + cell_h + 36)
             # Mostrar delta si disponible
             if current.delta:
                 d_q, d_w, d_m = current.delta
-                self.canvas.create_text(margin_x + (min(window, len(tape)) * cell_w)/2, y + cell_h + 56,
-                                        text=f"δ: ({d_q}, {d_w}, {d_m})", fill="darkgreen", font=("Segoe UI", 10))
+                self.txt_delta.set(f"δ: ({d_q}, {d_w}, {d_m})", x, y + cell_h + 56)
+            else:
+                self.txt_delta.hide()
         else:
-            self.canvas.create_text(margin_x + (min(window, len(tape)) * cell_w)/2, y + cell_h + 28,
-                                    text=f"q = {self._get_state()}", fill="blue", font=("Segoe UI", 12, "bold"))
+            self.txt_stage.hide()
+            self.txt_delta.hide()
+            self.txt_q.set(f"q = {self._get_state()}", x, y + cell_h + 28)
 
-    def _draw_multitape(self):
+    def _draw_multitape(self, tm):
         """Dibuja múltiples cintas para MTs multi-cinta"""
-        if not self.tm or not hasattr(self.tm, 'tapes'):
+        if not tm or not hasattr(tm, 'tape_window'):
             return
         
-        num_tapes = len(self.tm.tapes)
+        num_tapes = len(tm.head_positions)
         cell_w, cell_h = 28, 40
         window = 25  # Menos celdas por cinta para caber todas
         margin_x = 10
         tape_spacing = 80  # Espacio vertical entre cintas
         
-        for tape_idx in range(num_tapes):
-            tape = self.tm.tapes[tape_idx]
-            head = self.tm.head_positions[tape_idx]
-            blank = self.tm.blank_symbol
-            
-            # Ventana visible alrededor del cabezal
-            half = window // 2
-            start = max(0, head - half)
-            end = max(start + window, head + half + 1)
-            if end > len(tape):
-                end = len(tape)
-                start = max(0, end - window)
-            
-            y = 20 + tape_idx * tape_spacing
-            
-            # Label de cinta
-            self.canvas.create_text(margin_x - 5, y + cell_h/2, text=f"T{tape_idx}:", 
-                                   anchor="e", font=("Segoe UI", 10, "bold"))
-            
-            # Dibujar celdas
-            for i in range(start, end):
-                x = margin_x + (i - start) * cell_w
-                is_head = (i == head)
-                fill = "#fff6cc" if is_head else "white"
-                self.canvas.create_rectangle(x, y, x + cell_w, y + cell_h, fill=fill, outline="#333")
-                ch = tape[i] if i < len(tape) else blank
-                disp = ch if ch != '_' else '⊔'
-                self.canvas.create_text(x + cell_w/2, y + cell_h/2, text=disp, font=("Courier New", 11))
-                if is_head:
-                    self.canvas.create_text(x + cell_w/2, y - 12, text="▼", fill="red", font=("Arial", 14))
+        if len(self.multi_views) != num_tapes:
+            for view in self.multi_views:
+                view.destroy()
+            self.multi_views = [
+                TapeView(self.canvas, margin_x, 20 + i * tape_spacing, window=window, cell_w=cell_w, cell_h=cell_h,
+                         font=("Courier New", 11), label=f"T{i}:", label_font=("Segoe UI", 10, "bold"),
+                         markers=[dict(text="▼", fill="red", font=("Arial", 14), dy=-12)])
+                for i in range(num_tapes)
+            ]
+        
+        for tape_idx, view in enumerate(self.multi_views):
+            head = tm.head_positions[tape_idx]
+            # Ventana visible alrededor del cabezal (solo se decodifica este tramo)
+            start, end = self._visible_range(head, tm.tape_length(tape_idx), window)
+            view.show(tm.tape_window(tape_idx, start, end), head - start)
         
         # Estado debajo de todas las cintas
-        self.canvas.create_text(margin_x + (window * cell_w)/2, 20 + num_tapes * tape_spacing + 10,
-                                text=f"q = {self._get_state()}", fill="blue", font=("Segoe UI", 12, "bold"))
+        self.txt_q.set(f"q = {self._get_state()}", margin_x + (window * cell_w)/2, 20 + num_tapes * tape_spacing + 10)
 
     def _get_state(self):
-        if not self.tm:
+        tm = self._machine_view()
+        if not tm:
             return '-'
         # Try common attribute name
-        state = getattr(self.tm, 'current_state', None)
+        state = getattr(tm, 'current_state', None)
         if state is not None:
             return state
         # Fallback: no public accessor; show '-'
         return '-'
 
     def _get_symbol(self):
-        if not self.tm:
+        tm = self._machine_view()
+        if not tm:
             return '-'
         try:
-            return self.tm.get_current_symbol()
+            return tm.get_current_symbol()
         except Exception:
             return '-'
 
-    def _find_delta(self, q, s):
-        if not self.tm or q in (None, '-'):
-            return None
-        try:
-            return self.tm.find_transition(q, s)
-        except Exception:
-            return None
-
     def _get_tape_snapshot(self):
         if not self.tm:
             return ['_'] * 31, 15, '_'
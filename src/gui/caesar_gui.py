@@ -11,7 +11,9 @@ if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
 from orchestrator import encrypt_text, decrypt_text  # type: ignore
-from turing_simulator import TuringMachine  # type: ignore
+from machine_registry import new_machine  # type: ignore
+from gui.trace import LazyTrace, RunSpec  # type: ignore
+from gui.tape_view import CanvasText, FrameLimiter, TapeView  # type: ignore
 
 
 class CaesarApp(tk.Tk):
@@ -24,7 +26,8 @@ class CaesarApp(tk.Tk):
         # Estado de simulación visual
         self.current_machine_name = ""
         self.current_machine = None
-        self.simulation_steps = []
+        self.simulation_steps = None  # LazyTrace del último mensaje
+        self.simulation_letters = []
         self.current_step_index = 0
         self.is_playing = False
         self.step_delay = tk.IntVar(value=500)
@@ -106,6 +109,15 @@ class CaesarApp(tk.Tk):
         # Canvas para dibujar la cinta
         self.canvas = tk.Canvas(visual_frame, bg="white", height=180, relief=tk.SUNKEN, bd=2)
         self.canvas.pack(fill=tk.BOTH, expand=True, pady=(0, 4))
+        # Ítems de la cinta creados una vez; cada paso solo actualiza lo que cambia
+        self.tape_view = TapeView(self.canvas, 50, 50, window=20, cell_w=40, cell_h=60,
+                                  font=("Courier New", 12, "bold"), width=2,
+                                  markers=[dict(text="▼", fill="red", font=("Arial", 16, "bold"), dy=-20),
+                                           dict(text="HEAD", fill="red", font=("Arial", 8, "bold"), dy=76)])
+        self.tape_view.hide()
+        self.state_text = CanvasText(self.canvas, 400, 150, fill="blue", font=("Segoe UI", 11, "bold"))
+        self.empty_text = CanvasText(self.canvas, 400, 90, font=("Segoe UI", 11), fill="gray")
+        self.frames = FrameLimiter(self, self._render_step)
         
         # Controles de navegación
         controls = ttk.Frame(visual_frame)
@@ -134,6 +146,15 @@ class CaesarApp(tk.Tk):
         self.btn_next.pack(side=tk.LEFT, padx=2)
         self.btn_last.pack(side=tk.LEFT, padx=2)
 
+        # Saltos por etapa (una ejecución de MT) y por letra del mensaje
+        jumps = ttk.Frame(visual_frame)
+        jumps.pack(fill=tk.X, pady=(4, 0))
+        ttk.Label(jumps, text="Saltar:").pack(side=tk.LEFT, padx=4)
+        ttk.Button(jumps, text="◀◀ Letra", command=self._on_prev_letter, width=10).pack(side=tk.LEFT, padx=2)
+        ttk.Button(jumps, text="◀ Etapa", command=self._on_prev_stage, width=10).pack(side=tk.LEFT, padx=2)
+        ttk.Button(jumps, text="Etapa ▶", command=self._on_next_stage, width=10).pack(side=tk.LEFT, padx=2)
+        ttk.Button(jumps, text="Letra ▶▶", command=self._on_next_letter, width=10).pack(side=tk.LEFT, padx=2)
+
         # Panel inferior: Resultado y Log
         bottom_pane = ttk.Frame(root)
         bottom_pane.pack(fill=tk.BOTH, expand=True)
@@ -158,12 +179,11 @@ class CaesarApp(tk.Tk):
 
     def _draw_empty_canvas(self):
         """Dibuja un canvas vacío con mensaje"""
-        self.canvas.delete("all")
+        self.tape_view.hide()
+        self.state_text.hide()
         w = self.canvas.winfo_width() or 800
         h = self.canvas.winfo_height() or 180
-        self.canvas.create_text(w/2, h/2, 
-                               text="Ejecute una operación de cifrado/descifrado para ver la simulación",
-                               font=("Segoe UI", 11), fill="gray")
+        self.empty_text.set("Ejecute una operación de cifrado/descifrado para ver la simulación", w/2, h/2)
 
     def _parse_input(self):
         """Parsea la entrada en formato clave#texto"""
@@ -197,9 +217,9 @@ class CaesarApp(tk.Tk):
             self._log(f"ENCRIPTANDO con clave {key_num} (letra {key_letter})")
             self._log(f"Texto original: '{text}'")
             
-            # Generar pasos de simulación para la primera letra (demo)
-            if text and text[0].isalpha():
-                self._generate_encryption_steps(text[0].upper(), key_letter)
+            # Simulación de todo el mensaje (perezosa: no ejecuta las MTs por adelantado)
+            letters = [ch.upper() for ch in text if 'A' <= ch.upper() <= 'Z']
+            self._start_simulation(self._encryption_runs(letters, key_letter), letters)
             
             result = encrypt_text(key_letter, text)
             
@@ -221,9 +241,9 @@ class CaesarApp(tk.Tk):
             self._log(f"DESENCRIPTANDO con clave {key_num} (letra {key_letter})")
             self._log(f"Texto cifrado: '{text}'")
             
-            # Generar pasos de simulación para la primera letra (demo)
-            if text and text[0].isalpha():
-                self._generate_decryption_steps(text[0].upper(), key_letter)
+            # Simulación de todo el mensaje (perezosa: no ejecuta las MTs por adelantado)
+            letters = [ch.upper() for ch in text if 'A' <= ch.upper() <= 'Z']
+            self._start_simulation(self._decryption_runs(letters, key_letter), letters)
             
             result = decrypt_text(key_letter, text)
             
@@ -238,227 +258,101 @@ class CaesarApp(tk.Tk):
             self._log(f"✗ ERROR: {str(e)}")
             messagebox.showerror("Error de Desencriptación", str(e))
 
-    def _generate_encryption_steps(self, letter: str, shift_letter: str):
-        """Genera pasos de simulación para encriptar una letra - TODO el pipeline"""
-        self.simulation_steps = []
-        self.current_step_index = 0
-        
-        self._log(f"→ Generando simulación completa del cifrado para '{letter}' con shift '{shift_letter}'...")
-        
-        # ETAPA 1: Convertir letra a marcas
-        self._log(f"  Etapa 1/4: letter_to_number.json - Convertir {letter} a marcas")
-        tm1 = TuringMachine(os.path.join(ROOT, 'config', 'letter_to_number.json'))
-        tm1.initialize_tape(letter)
-        self._capture_tm_steps(tm1, 'letter_to_number.json', f'Convertir {letter} → marcas unarias')
-        letra_marcas = tm1.get_tape_contents()
-        
-        # ETAPA 2: Convertir shift a marcas
-        self._log(f"  Etapa 2/4: letter_to_number.json - Convertir shift {shift_letter} a marcas")
-        tm2 = TuringMachine(os.path.join(ROOT, 'config', 'letter_to_number.json'))
-        tm2.initialize_tape(shift_letter)
-        self._capture_tm_steps(tm2, 'letter_to_number.json', f'Convertir shift {shift_letter} → marcas')
-        shift_marcas = tm2.get_tape_contents()
-        
-        # Sanear marcas (solo |)
-        letra_marcas_clean = ''.join(ch for ch in letra_marcas if ch == '|')
-        shift_marcas_clean = ''.join(ch for ch in shift_marcas if ch == '|')
-        
-        # ETAPA 3: Sumar marcas (add_simple)
-        self._log(f"  Etapa 3/4: add_simple.json - Sumar {len(letra_marcas_clean)} + {len(shift_marcas_clean)} marcas")
-        input_suma = f"{letra_marcas_clean}+{shift_marcas_clean}"
-        tm3 = TuringMachine(os.path.join(ROOT, 'config', 'add_simple.json'))
-        tm3.initialize_tape(input_suma)
-        self._capture_tm_steps(tm3, 'add_simple.json', f'Sumar marcas: {len(letra_marcas_clean)} + {len(shift_marcas_clean)}')
-        suma_result = tm3.get_tape_contents()
-        suma_marcas = ''.join(ch for ch in suma_result if ch == '|')
-        
-        # ETAPA 4: Aplicar mod26 (si es necesario)
-        if len(suma_marcas) >= 26:
-            self._log(f"  Etapa 4a/4: subtract_simple.json - Aplicar mod26 ({len(suma_marcas)} marcas)")
-            twenty_six = '|' * 26
-            input_mod = f"{suma_marcas}-{twenty_six}"
-            tm4 = TuringMachine(os.path.join(ROOT, 'config', 'subtract_simple.json'))
-            tm4.initialize_tape(input_mod)
-            self._capture_tm_steps(tm4, 'subtract_simple.json', f'Mod26: {len(suma_marcas)} - 26')
-            mod_result = tm4.get_tape_contents()
-            marcas_final = ''.join(ch for ch in mod_result if ch == '|')
-        else:
-            marcas_final = suma_marcas
-            self._log(f"  Etapa 4a/4: Sin mod26 necesario ({len(suma_marcas)} < 26)")
-        
-        # ETAPA 5: Convertir marcas a letra
-        self._log(f"  Etapa 4b/4: number_to_letter.json - Convertir {len(marcas_final)} marcas → letra")
-        tm5 = TuringMachine(os.path.join(ROOT, 'config', 'number_to_letter.json'))
-        tm5.initialize_tape(marcas_final)
-        self._capture_tm_steps(tm5, 'number_to_letter.json', f'Convertir {len(marcas_final)} marcas → letra')
-        
-        self._log(f"✓ Simulación completa: {len(self.simulation_steps)} pasos generados")
+    def _start_simulation(self, runs, letters):
+        """Reproduce el pipeline de todo el mensaje; las MTs corren a medida que avanza la reproducción."""
+        self.simulation_steps = LazyTrace(runs)
+        self.simulation_letters = letters
         self.current_step_index = 0
+        self._log(f"→ Simulación del mensaje completo ({len(letters)} letras): cada MT se ejecuta al llegar a ella")
         self._update_canvas_from_step()
 
-    def _capture_tm_steps(self, tm, machine_name, description, max_steps=200):
-        """Captura todos los pasos de ejecución de una MT"""
-        # Estado inicial
-        self.simulation_steps.append({
-            'machine': machine_name,
-            'description': description,
-            'tape': list(tm.tape),
-            'head': tm.head_position,
-            'state': tm.current_state,
-            'step': 0
-        })
-        
-        # Ejecutar hasta aceptación o max_steps
-        step_count = 0
-        while step_count < max_steps:
-            if tm.current_state in tm.accept_states:
-                break
-            
-            progressed = tm.step()
-            if not progressed:
-                break
-            
-            step_count += 1
-            self.simulation_steps.append({
-                'machine': machine_name,
-                'description': description,
-                'tape': list(tm.tape),
-                'head': tm.head_position,
-                'state': tm.current_state,
-                'step': step_count
-            })
-
-    def _generate_decryption_steps(self, letter: str, shift_letter: str):
-        """Genera pasos de simulación para desencriptar una letra - TODO el pipeline"""
-        self.simulation_steps = []
-        self.current_step_index = 0
-        
-        self._log(f"→ Generando simulación completa del descifrado para '{letter}' con shift '{shift_letter}'...")
-        
-        # ETAPA 1: Convertir letra cifrada a marcas
-        self._log(f"  Etapa 1/4: letter_to_number.json - Convertir {letter} a marcas")
-        tm1 = TuringMachine(os.path.join(ROOT, 'config', 'letter_to_number.json'))
-        tm1.initialize_tape(letter)
-        self._capture_tm_steps(tm1, 'letter_to_number.json', f'Convertir {letter} → marcas unarias')
-        letra_marcas = tm1.get_tape_contents()
-        
-        # ETAPA 2: Convertir shift a marcas y calcular inverso (26-shift)
-        self._log(f"  Etapa 2/4: Calcular shift inverso (26 - shift)")
-        tm2 = TuringMachine(os.path.join(ROOT, 'config', 'letter_to_number.json'))
-        tm2.initialize_tape(shift_letter)
-        self._capture_tm_steps(tm2, 'letter_to_number.json', f'Convertir shift {shift_letter} → marcas')
-        shift_marcas = tm2.get_tape_contents()
-        
-        # Calcular 26 - shift
-        shift_marcas_clean = ''.join(ch for ch in shift_marcas if ch == '|')
+    def _encryption_runs(self, letters, shift_letter: str):
+        """Ejecuciones del pipeline de cifrado para todas las letras, una por vez.
+
+        Es un generador de RunSpec: recibe (send) el registro de cada ejecución
+        y arma con su salida la entrada de la etapa siguiente.
+        """
+        rec = yield RunSpec(None, 'clave', 'letter_to_number.json', f'Convertir shift {shift_letter} → marcas',
+                            self._config('letter_to_number.json'), shift_letter)
+        shift_marcas = ''.join(ch for ch in rec.output if ch == '|')
+        yield from self._letter_runs(letters, shift_marcas)
+
+    def _decryption_runs(self, letters, shift_letter: str):
+        """Como _encryption_runs, sumando el shift inverso (26 - shift)."""
+        rec = yield RunSpec(None, 'clave', 'letter_to_number.json', f'Convertir shift {shift_letter} → marcas',
+                            self._config('letter_to_number.json'), shift_letter)
+        shift_marcas = ''.join(ch for ch in rec.output if ch == '|')
         const26 = '|' * 26
-        input_inv = f"{const26}-{shift_marcas_clean}"
-        tm_inv = TuringMachine(os.path.join(ROOT, 'config', 'subtract_simple.json'))
-        tm_inv.initialize_tape(input_inv)
-        self._capture_tm_steps(tm_inv, 'subtract_simple.json', f'Calcular 26 - {len(shift_marcas_clean)}')
-        inv_result = tm_inv.get_tape_contents()
-        inv_marcas = ''.join(ch for ch in inv_result if ch == '|')
-        
-        # ETAPA 3: Sumar letra + shift_inverso
-        letra_marcas_clean = ''.join(ch for ch in letra_marcas if ch == '|')
-        self._log(f"  Etapa 3/4: add_simple.json - Sumar {len(letra_marcas_clean)} + {len(inv_marcas)} marcas")
-        input_suma = f"{letra_marcas_clean}+{inv_marcas}"
-        tm3 = TuringMachine(os.path.join(ROOT, 'config', 'add_simple.json'))
-        tm3.initialize_tape(input_suma)
-        self._capture_tm_steps(tm3, 'add_simple.json', f'Sumar: {len(letra_marcas_clean)} + {len(inv_marcas)}')
-        suma_result = tm3.get_tape_contents()
-        suma_marcas = ''.join(ch for ch in suma_result if ch == '|')
-        
-        # ETAPA 4: Aplicar mod26
-        if len(suma_marcas) >= 26:
-            self._log(f"  Etapa 4a/4: subtract_simple.json - Aplicar mod26")
-            twenty_six = '|' * 26
-            input_mod = f"{suma_marcas}-{twenty_six}"
-            tm4 = TuringMachine(os.path.join(ROOT, 'config', 'subtract_simple.json'))
-            tm4.initialize_tape(input_mod)
-            self._capture_tm_steps(tm4, 'subtract_simple.json', f'Mod26: {len(suma_marcas)} - 26')
-            mod_result = tm4.get_tape_contents()
-            marcas_final = ''.join(ch for ch in mod_result if ch == '|')
-        else:
-            marcas_final = suma_marcas
-            self._log(f"  Etapa 4a/4: Sin mod26 necesario")
-        
-        # ETAPA 5: Convertir marcas a letra
-        self._log(f"  Etapa 4b/4: number_to_letter.json - Convertir {len(marcas_final)} marcas → letra")
-        tm5 = TuringMachine(os.path.join(ROOT, 'config', 'number_to_letter.json'))
-        tm5.initialize_tape(marcas_final)
-        self._capture_tm_steps(tm5, 'number_to_letter.json', f'Convertir {len(marcas_final)} marcas → letra')
-        
-        self._log(f"✓ Simulación completa: {len(self.simulation_steps)} pasos generados")
-        self.current_step_index = 0
-        self._update_canvas_from_step()
+        rec = yield RunSpec(None, 'clave', 'subtract_simple.json', f'Calcular 26 - {len(shift_marcas)}',
+                            self._config('subtract_simple.json'), f"{const26}-{shift_marcas}")
+        inv_marcas = ''.join(ch for ch in rec.output if ch == '|')
+        yield from self._letter_runs(letters, inv_marcas)
+
+    def _letter_runs(self, letters, shift_marcas: str):
+        """Etapas por letra: letra→marcas, suma del shift, mod26 (si hace falta) y marcas→letra."""
+        for i, letter in enumerate(letters):
+            rec = yield RunSpec(i, 'letra→marcas', 'letter_to_number.json', f'Convertir {letter} → marcas unarias',
+                                self._config('letter_to_number.json'), letter)
+            letra_marcas = ''.join(ch for ch in rec.output if ch == '|')
+
+            rec = yield RunSpec(i, 'suma', 'add_simple.json',
+                                f'Sumar marcas: {len(letra_marcas)} + {len(shift_marcas)}',
+                                self._config('add_simple.json'), f"{letra_marcas}+{shift_marcas}")
+            marcas = ''.join(ch for ch in rec.output if ch == '|')
+
+            if len(marcas) >= 26:
+                twenty_six = '|' * 26
+                rec = yield RunSpec(i, 'mod26', 'subtract_simple.json', f'Mod26: {len(marcas)} - 26',
+                                    self._config('subtract_simple.json'), f"{marcas}-{twenty_six}")
+                marcas = ''.join(ch for ch in rec.output if ch == '|')
+
+            yield RunSpec(i, 'marcas→letra', 'number_to_letter.json', f'Convertir {len(marcas)} marcas → letra',
+                          self._config('number_to_letter.json'), marcas)
+
+    @staticmethod
+    def _config(name: str) -> str:
+        return os.path.join(ROOT, 'config', name)
 
     def _update_canvas_from_step(self):
+        """Pide redibujar el paso actual (como máximo un cuadro por refresco de pantalla)"""
+        self.frames.request()
+
+    def _render_step(self):
         """Actualiza el canvas con el paso actual"""
-        if not self.simulation_steps or self.current_step_index >= len(self.simulation_steps):
+        steps = self.simulation_steps
+        if steps is None or not steps.has_step(self.current_step_index):
             self._draw_empty_canvas()
             return
         
-        step = self.simulation_steps[self.current_step_index]
+        step = steps[self.current_step_index]
         
+        if step['letter'] is None:
+            where = "clave"
+        else:
+            where = f"letra {step['letter'] + 1}/{len(self.simulation_letters)} '{self.simulation_letters[step['letter']]}'"
         self.current_machine_name = step['machine']
-        self.lbl_machine_name.configure(text=f"Máquina: {step['machine']}")
+        self.lbl_machine_name.configure(text=f"Máquina: {step['machine']} ({where}, {step['stage']})")
         self.lbl_state_info.configure(text=f"Estado: {step['state']}")
-        self.lbl_step_info.configure(text=f"Paso: {self.current_step_index + 1}/{len(self.simulation_steps)}")
+        total = f"{steps.known_length}" if steps.exhausted else f"{steps.known_length}+"
+        self.lbl_step_info.configure(text=f"Paso: {self.current_step_index + 1}/{total}")
         
         self._draw_tape_from_step(step)
 
     def _draw_tape_from_step(self, step):
         """Dibuja la cinta desde un paso capturado"""
-        self.canvas.delete("all")
-        
         tape = step['tape']
         head = step['head']
-        state = step['state']
-        blank = '_'
-        
-        cell_w, cell_h = 40, 60
-        window = 20  # Celdas visibles
+        window = self.tape_view.window  # Celdas visibles
         
         start = max(0, head - window // 2)
         end = min(len(tape), start + window)
         
-        # Asegurar ventana mínima
-        if end - start < window:
-            end = min(len(tape), start + window)
-        
-        margin_x = 50
-        margin_y = 50
-        
-        for i in range(start, end):
-            x = margin_x + (i - start) * cell_w
-            y = margin_y
-            
-            is_head = (i == head)
-            fill_color = "#fff6cc" if is_head else "white"
-            
-            # Celda
-            self.canvas.create_rectangle(x, y, x + cell_w, y + cell_h, 
-                                        fill=fill_color, outline="#333", width=2)
-            
-            # Símbolo
-            sym = tape[i] if i < len(tape) else blank
-            display_sym = sym if sym != '_' else '⊔'
-            self.canvas.create_text(x + cell_w/2, y + cell_h/2, 
-                                  text=display_sym, font=("Courier New", 12, "bold"))
-            
-            # Indicador de cabezal
-            if is_head:
-                self.canvas.create_text(x + cell_w/2, y - 20, 
-                                      text="▼", fill="red", font=("Arial", 16, "bold"))
-                self.canvas.create_text(x + cell_w/2, y + cell_h + 16,
-                                      text="HEAD", fill="red", font=("Arial", 8, "bold"))
+        self.empty_text.hide()
+        self.tape_view.show(tape[start:end], head - start)
         
         # Estado
         canvas_width = self.canvas.winfo_width() or 800
-        self.canvas.create_text(canvas_width/2, margin_y + cell_h + 40,
-                              text=f"q = {state}", fill="blue", 
-                              font=("Segoe UI", 11, "bold"))
+        self.state_text.set(f"q = {step['state']}", canvas_width/2, 50 + 60 + 40)
 
     # Controles de navegación
     def _on_first_step(self):
@@ -471,17 +365,39 @@ class CaesarApp(tk.Tk):
             self._update_canvas_from_step()
     
     def _on_next_step(self):
-        if self.current_step_index < len(self.simulation_steps) - 1:
+        if self.simulation_steps is not None and self.simulation_steps.has_step(self.current_step_index + 1):
             self.current_step_index += 1
             self._update_canvas_from_step()
     
     def _on_last_step(self):
-        if self.simulation_steps:
-            self.current_step_index = len(self.simulation_steps) - 1
+        if self.simulation_steps is not None:
+            # Ejecuta lo que falta del pipeline (solo se conserva una ventana de ejecuciones)
+            self.current_step_index = self.simulation_steps.finish() - 1
             self._update_canvas_from_step()
+
+    def _jump_to(self, index):
+        if index is not None:
+            self.current_step_index = index
+            self._update_canvas_from_step()
+
+    def _on_prev_stage(self):
+        if self.simulation_steps is not None:
+            self._jump_to(self.simulation_steps.prev_stage(self.current_step_index))
+
+    def _on_next_stage(self):
+        if self.simulation_steps is not None:
+            self._jump_to(self.simulation_steps.next_stage(self.current_step_index))
+
+    def _on_prev_letter(self):
+        if self.simulation_steps is not None:
+            self._jump_to(self.simulation_steps.prev_letter(self.current_step_index))
+
+    def _on_next_letter(self):
+        if self.simulation_steps is not None:
+            self._jump_to(self.simulation_steps.next_letter(self.current_step_index))
     
     def _on_play(self):
-        if not self.simulation_steps:
+        if self.simulation_steps is None:
             return
         self.is_playing = True
         self._play_loop()
@@ -489,7 +405,7 @@ class CaesarApp(tk.Tk):
     def _play_loop(self):
         if not self.is_playing:
             return
-        if self.current_step_index < len(self.simulation_steps) - 1:
+        if self.simulation_steps.has_step(self.current_step_index + 1):
             self.current_step_index += 1
             self._update_canvas_from_step()
             self.after(self.step_delay.get(), self._play_loop)
@@ -0,0 +1,188 @@
+"""Vista de cinta en modo retenido para los Canvas de las GUIs.
+
+En lugar de ``canvas.delete("all")`` y recrear cada rectángulo y texto en cada
+paso, ``TapeView`` crea una sola vez los ítems de una ventana de celdas y en
+cada cuadro solo toca lo que cambió: ``itemconfigure`` para los símbolos
+distintos y para el resaltado de la celda del cabezal, y ``coords`` para mover
+el marcador del cabezal. ``CanvasText`` hace lo mismo con un texto suelto.
+
+``FrameLimiter`` acota la tasa de redibujo: los pedidos que llegan antes del
+próximo cuadro se agrupan en uno solo, que dibuja el estado más reciente. Si la
+simulación avanza más rápido que la pantalla, se saltean cuadros en lugar de
+encolar redibujos.
+"""
+from __future__ import annotations
+import time
+from typing import Callable, List, Optional, Sequence
+
+BLANK_GLYPH = '⊔'
+
+
+class CanvasText:
+    """Texto de un Canvas creado una vez; ``set`` solo lo reconfigura si cambió."""
+
+    def __init__(self, canvas, x: float, y: float, **options):
+        self.canvas = canvas
+        self.item = canvas.create_text(x, y, text='', **options)
+        self._text = ''
+        self._pos = (x, y)
+        self._visible = True
+
+    def set(self, text: str, x: Optional[float] = None, y: Optional[float] = None) -> None:
+        if text != self._text:
+            self.canvas.itemconfigure(self.item, text=text)
+            self._text = text
+        pos = (self._pos[0] if x is None else x, self._pos[1] if y is None else y)
+        if pos != self._pos:
+            self.canvas.coords(self.item, *pos)
+            self._pos = pos
+        self.show()
+
+    def show(self) -> None:
+        if not self._visible:
+            self.canvas.itemconfigure(self.item, state='normal')
+            self._visible = True
+
+    def hide(self) -> None:
+        if self._visible:
+            self.canvas.itemconfigure(self.item, state='hidden')
+            self._visible = False
+
+    def destroy(self) -> None:
+        self.canvas.delete(self.item)
+
+
+class TapeView:
+    """Ventana de ``window`` celdas de una cinta dibujada a partir de (x, y).
+
+    ``show(cells, head)`` muestra los símbolos ``cells`` (uno por celda de la
+    ventana, como máximo ``window``) y resalta la celda ``head`` (índice dentro
+    de la ventana, o None si el cabezal no está a la vista). ``markers`` son
+    textos que acompañan al cabezal (p. ej. ``▼``): opciones de
+    ``create_text`` más ``dy``, la distancia vertical desde el borde superior
+    de la celda.
+    """
+
+    def __init__(self, canvas, x: float, y: float, window: int, cell_w: float, cell_h: float,
+                 font, markers: Sequence[dict] = (), blank: str = '_', fill: str = 'white',
+                 head_fill: str = '#fff6cc', outline: str = '#333', width: int = 1,
+                 label: Optional[str] = None, label_font=None):
+        self.canvas = canvas
+        self.x, self.y = x, y
+        self.window = window
+        self.cell_w, self.cell_h = cell_w, cell_h
+        self.blank = blank
+        self.fill, self.head_fill = fill, head_fill
+        self._rects: List[int] = []
+        self._texts: List[int] = []
+        for i in range(window):
+            cx = x + i * cell_w
+            self._rects.append(canvas.create_rectangle(cx, y, cx + cell_w, y + cell_h, fill=fill,
+                                                       outline=outline, width=width))
+            self._texts.append(canvas.create_text(cx + cell_w / 2, y + cell_h / 2, text='', font=font))
+        self._markers: List[int] = []
+        self._marker_dy: List[float] = []
+        for options in markers:
+            options = dict(options)
+            self._marker_dy.append(options.pop('dy'))
+            self._markers.append(canvas.create_text(x, y, state='hidden', **options))
+        self._label = None
+        if label is not None:
+            self._label = canvas.create_text(x - 5, y + cell_h / 2, text=label, anchor='e', font=label_font)
+        self._shown_text: List[str] = [''] * window
+        self._visible_cells = window
+        self._head: Optional[int] = None
+        self._hidden = False
+
+    def _items(self) -> List[int]:
+        items = self._rects + self._texts + self._markers
+        if self._label is not None:
+            items.append(self._label)
+        return items
+
+    def show(self, cells: Sequence[str], head: Optional[int]) -> None:
+        canvas = self.canvas
+        if self._hidden:
+            self._hidden = False
+            if self._label is not None:
+                canvas.itemconfigure(self._label, state='normal')
+            # Celdas y marcadores se vuelven a mostrar abajo
+            self._visible_cells = 0
+            self._head = None
+        n = min(len(cells), self.window)
+        shown = self._shown_text
+        blank = self.blank
+        for i in range(n):
+            sym = cells[i]
+            disp = BLANK_GLYPH if sym == blank else sym
+            if disp != shown[i]:
+                canvas.itemconfigure(self._texts[i], text=disp)
+                shown[i] = disp
+        if n != self._visible_cells:
+            lo, hi = sorted((n, self._visible_cells))
+            state = 'normal' if n > self._visible_cells else 'hidden'
+            for i in range(lo, hi):
+                canvas.itemconfigure(self._rects[i], state=state)
+                canvas.itemconfigure(self._texts[i], state=state)
+            self._visible_cells = n
+        if head is not None and not 0 <= head < n:
+            head = None
+        if head != self._head:
+            if self._head is not None:
+                canvas.itemconfigure(self._rects[self._head], fill=self.fill)
+            if head is None:
+                for item in self._markers:
+                    canvas.itemconfigure(item, state='hidden')
+            else:
+                canvas.itemconfigure(self._rects[head], fill=self.head_fill)
+                cx = self.x + head * self.cell_w + self.cell_w / 2
+                for item, dy in zip(self._markers, self._marker_dy):
+                    canvas.coords(item, cx, self.y + dy)
+                    if self._head is None:
+                        canvas.itemconfigure(item, state='normal')
+            self._head = head
+
+    def hide(self) -> None:
+        if not self._hidden:
+            for item in self._items():
+                self.canvas.itemconfigure(item, state='hidden')
+            if self._head is not None:
+                self.canvas.itemconfigure(self._rects[self._head], fill=self.fill)
+            self._hidden = True
+
+    def destroy(self) -> None:
+        for item in self._items():
+            self.canvas.delete(item)
+
+
+class FrameLimiter:
+    """Agrupa pedidos de redibujo para no superar ``max_fps`` cuadros por segundo.
+
+    ``request()`` programa una llamada a ``draw`` (con ``widget.after``) si no
+    hay una pendiente; los pedidos que llegan mientras tanto no agregan nada, y
+    ``draw`` ve el estado más reciente al ejecutarse.
+    """
+
+    def __init__(self, widget, draw: Callable[[], None], max_fps: float = 60.0):
+        self.widget = widget
+        self.draw = draw
+        self.interval = 1.0 / max_fps
+        self._pending = None
+        self._last = 0.0
+
+    def request(self) -> None:
+        if self._pending is not None:
+            return
+        wait = self._last + self.interval - time.perf_counter()
+        self._pending = self.widget.after(max(0, int(wait * 1000)), self._flush)
+
+    def _flush(self) -> None:
+        self._pending = None
+        self._last = time.perf_counter()
+        self.draw()
+
+    def flush(self) -> None:
+        """Dibuja ya (cancelando el cuadro pendiente, si lo hay)."""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+        self._flush()
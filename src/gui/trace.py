@@ -1,32 +1,298 @@
 """Utilities to capture step-by-step traces from TuringMachine runs.
 
-We avoid modifying the TuringMachine class and instead rely on its debug
-printing. We temporarily redirect stdout to capture the printed trace.
+Traces are recorded in structured form by attaching a TraceRecorder to the
+machine (``tm.recorder``); no debug printing or stdout capture is involved.
+
+KeyframeTrace stores the steps of several runs for playback: a full tape
+keyframe every N steps plus the recorder's per-step deltas, so any step can be
+rebuilt by copying one keyframe and replaying fewer than N writes.
+
+LazyTrace plays back a pipeline whose runs are produced by a generator: each
+machine runs only when playback or a seek first reaches it, and only a bounded
+window of recorded runs is kept (evicted runs are re-executed from their input
+if revisited).
 """
 from __future__ import annotations
-import io
+import os
 import sys
-from contextlib import redirect_stdout
-from typing import Tuple
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
+from trace_recorder import TraceRecorder  # type: ignore
+from machine_registry import new_machine  # type: ignore
 
-def run_with_trace(tm, input_string: str, max_steps: int = 5000) -> Tuple[str, str]:
-    """Run a TuringMachine instance with debug enabled and capture the trace.
 
-    Returns (output_string, trace_text).
+def run_with_trace(tm, input_string: str, max_steps: int = 5000) -> TraceRecorder:
+    """Run a TuringMachine instance (either engine) while recording every step.
+
+    Returns the TraceRecorder; its ``output`` attribute holds the run output.
+    The machine's previous recorder (usually None) is restored afterwards.
     """
-    # Enable debug, capture stdout, then run
+    previous = getattr(tm, 'recorder', None)
+    recorder = TraceRecorder()
+    tm.recorder = recorder
     try:
-        if hasattr(tm, 'enable_debug_mode'):
-            tm.enable_debug_mode()
-        buff = io.StringIO()
-        with redirect_stdout(buff):
-            output = tm.run(input_string, max_steps=max_steps)
-        trace = buff.getvalue()
-        return output, trace
+        recorder.output = tm.run(input_string, max_steps=max_steps)
+        return recorder
     finally:
-        if hasattr(tm, 'disable_debug_mode'):
-            tm.disable_debug_mode()
+        tm.recorder = previous
+
+
+class _TraceRun:
+    """One recorded run plus its keyframes: (step, origin, tape codes)."""
+
+    def __init__(self, recorder: TraceRecorder, machine: str, description: str, min_interval: int):
+        self.recorder = recorder
+        self.machine = machine
+        self.description = description
+        self.keyframes: List[Tuple[int, int, bytes]] = []
+        self.keyframe_steps: List[int] = []
+        self._build_keyframes(min_interval)
+
+    def _build_keyframes(self, min_interval: int) -> None:
+        rec = self.recorder
+        base, initial = rec.initial_tapes[0]
+        # Two-sided buffer as in tape.Tape: position p >= base is right[p - base],
+        # p < base is left[base - 1 - p], so growth on either side is amortised O(1)
+        left = bytearray()
+        right = bytearray(initial)
+        last = 0
+        self._add_keyframe(0, base, left, right)
+        for k, (pos, code, move) in enumerate(zip(rec.head, rec.write, rec.move), 1):
+            # The engine allocates the written cell and the cell the head moves to
+            for p in (pos, pos + move):
+                if p < base - len(left):
+                    left.extend(bytes(base - len(left) - p))
+                elif p >= base + len(right):
+                    right.extend(bytes(p - base - len(right) + 1))
+            if pos >= base:
+                right[pos - base] = code
+            else:
+                left[base - 1 - pos] = code
+            # Interval grows with the tape: keyframe memory stays O(1) per step
+            if k - last >= max(min_interval, len(left) + len(right)):
+                self._add_keyframe(k, base, left, right)
+                last = k
+
+    def _add_keyframe(self, step: int, base: int, left: bytearray, right: bytearray) -> None:
+        self.keyframes.append((step, base - len(left), bytes(left[::-1]) + bytes(right)))
+        self.keyframe_steps.append(step)
+
+    def __len__(self) -> int:
+        return len(self.recorder) + 1
+
+    def snapshot(self, k: int, **extra: Any) -> Dict[str, Any]:
+        rec = self.recorder
+        step, lo, initial = self.keyframes[bisect_right(self.keyframe_steps, k) - 1]
+        heads = rec.head[step:k]
+        head = rec.heads_at(k)[0]
+        new_lo = min(min(heads, default=lo), head, lo)
+        new_hi = max(max(heads, default=lo), head, lo + len(initial) - 1)
+        cells = bytearray(new_hi - new_lo + 1)
+        cells[lo - new_lo:lo - new_lo + len(initial)] = initial
+        for pos, code in zip(heads, rec.write[step:k]):
+            cells[pos - new_lo] = code
+        symbols = rec.symbols
+        tape = [symbols[c] if c < len(symbols) else rec.foreign.get(new_lo + i, '')
+                for i, c in enumerate(cells)]
+        return {
+            'machine': self.machine,
+            'description': self.description,
+            'tape': tape,
+            'head': head - new_lo,
+            'state': rec.state_at(k),
+            'step': k,
+            **extra,
+        }
+
+
+class KeyframeTrace:
+    """Sequence of playback steps over one or more recorded runs.
+
+    ``trace[i]`` is a dict with machine, description, tape, head (index into
+    tape), state and step (within its run), built on demand. Memory is the
+    recorder deltas plus keyframes taken every ``max(min_interval, tape
+    length)`` steps, instead of a full tape copy per step.
+    """
+
+    def __init__(self, min_interval: int = 256):
+        self.min_interval = min_interval
+        self._runs: List[_TraceRun] = []
+        self._starts: List[int] = []
+        self._total = 0
+
+    def add_run(self, recorder: TraceRecorder, machine: str, description: str) -> None:
+        self._runs.append(_TraceRun(recorder, machine, description, self.min_interval))
+        self._starts.append(self._total)
+        self._total += len(self._runs[-1])
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError(index)
+        r = bisect_right(self._starts, index) - 1
+        return self._runs[r].snapshot(index - self._starts[r])
+
+
+RunSpec = namedtuple('RunSpec', ['letter', 'stage', 'machine', 'description', 'config', 'tape_input', 'max_steps'],
+                     defaults=(10000,))
+RunSpec.__doc__ = """One machine run of a pipeline: which config to run on which input.
+
+``letter`` is the index of the message letter the run belongs to (None for
+runs shared by the whole message, e.g. the key conversion) and ``stage`` a
+short label for the pipeline stage.
+"""
+
+StageInfo = namedtuple('StageInfo', ['start', 'length', 'spec'])
+
+
+class LazyTrace:
+    """Playback steps of a pipeline whose runs are executed on demand.
+
+    ``runs`` is a generator of RunSpec. After each yield it receives (via
+    ``send``) the TraceRecorder of the run it just described, so later stages
+    can use earlier outputs (``recorder.output``) as their input.
+
+    The generator is advanced only when an index past the known steps is
+    requested, so the first frame costs one machine run regardless of message
+    length. ``stages`` indexes every run seen so far (global start, length,
+    spec) and makes stage/letter jumps a bisect; only the last ``window``
+    recorded runs are kept in memory.
+    """
+
+    def __init__(self, runs: Generator[RunSpec, TraceRecorder, None], window: int = 16,
+                 min_interval: int = 256):
+        self.window = window
+        self.min_interval = min_interval
+        self.stages: List[StageInfo] = []
+        self._starts: List[int] = []
+        self._known = 0
+        self._runs = runs
+        self._pending: Optional[TraceRecorder] = None
+        self._exhausted = False
+        self._cache: 'OrderedDict[int, _TraceRun]' = OrderedDict()
+
+    @property
+    def known_length(self) -> int:
+        """Steps generated so far (the total once ``exhausted``)."""
+        return self._known
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted
+
+    def _pull(self) -> bool:
+        """Execute the next run of the pipeline. False when there are no more."""
+        if self._exhausted:
+            return False
+        try:
+            if not self.stages:
+                spec = next(self._runs)
+            else:
+                spec = self._runs.send(self._pending)
+        except StopIteration:
+            self._exhausted = True
+            self._pending = None
+            return False
+        recorder = self._record(spec)
+        self._pending = recorder
+        self._keep(len(self.stages), _TraceRun(recorder, spec.machine, spec.description, self.min_interval))
+        self.stages.append(StageInfo(self._known, len(recorder) + 1, spec))
+        self._starts.append(self._known)
+        self._known += len(recorder) + 1
+        return True
+
+    @staticmethod
+    def _record(spec: RunSpec) -> TraceRecorder:
+        return run_with_trace(new_machine(spec.config), spec.tape_input, max_steps=spec.max_steps)
+
+    def _keep(self, r: int, run: _TraceRun) -> None:
+        self._cache[r] = run
+        self._cache.move_to_end(r)
+        while len(self._cache) > self.window:
+            self._cache.popitem(last=False)
+
+    def _run(self, r: int) -> _TraceRun:
+        run = self._cache.get(r)
+        if run is None:
+            # Evicted: the machines are deterministic, so re-running gives the same trace
+            spec = self.stages[r].spec
+            run = _TraceRun(self._record(spec), spec.machine, spec.description, self.min_interval)
+        self._keep(r, run)
+        return run
+
+    def has_step(self, index: int) -> bool:
+        """True if step ``index`` exists, running machines up to it if needed."""
+        while index >= self._known:
+            if not self._pull():
+                return False
+        return index >= 0
+
+    def finish(self) -> int:
+        """Run the rest of the pipeline and return the total number of steps."""
+        while self._pull():
+            pass
+        return self._known
+
+    def stage_of(self, index: int) -> int:
+        """Position in ``stages`` of the run containing step ``index``."""
+        if not self.has_step(index):
+            raise IndexError(index)
+        return bisect_right(self._starts, index) - 1
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        r = self.stage_of(index)
+        info = self.stages[r]
+        return self._run(r).snapshot(index - info.start, letter=info.spec.letter, stage=info.spec.stage,
+                                     stage_index=r)
+
+    def next_stage(self, index: int) -> Optional[int]:
+        """First step of the run after the one containing ``index``, or None."""
+        r = self.stage_of(index) + 1
+        if r >= len(self.stages) and not self._pull():
+            return None
+        return self.stages[r].start
+
+    def prev_stage(self, index: int) -> int:
+        """First step of the current run, or of the previous one if already there."""
+        r = self.stage_of(index)
+        if index == self.stages[r].start and r > 0:
+            r -= 1
+        return self.stages[r].start
+
+    def next_letter(self, index: int) -> Optional[int]:
+        """First step of the next message letter, or None after the last one."""
+        r = self.stage_of(index)
+        current = self.stages[r].spec.letter
+        while True:
+            r += 1
+            if r >= len(self.stages) and not self._pull():
+                return None
+            letter = self.stages[r].spec.letter
+            if letter is not None and letter != current:
+                return self.stages[r].start
+
+    def prev_letter(self, index: int) -> int:
+        """First step of the current letter, or of the previous one if already there."""
+        r = self.stage_of(index)
+        letter = self.stages[r].spec.letter
+        while r > 0 and self.stages[r - 1].spec.letter == letter:
+            r -= 1
+        if self.stages[r].start == index and r > 0:
+            r -= 1
+            letter = self.stages[r].spec.letter
+            while r > 0 and self.stages[r - 1].spec.letter == letter:
+                r -= 1
+        return self.stages[r].start
 
 
 def safe_marks(s: str) -> str:
@@ -0,0 +1,148 @@
+"""Modo turbo del visualizador: la MT corre en un hilo aparte a velocidad del motor.
+
+``TurboRunner`` ejecuta la MT en bloques de pasos dentro de un hilo de
+trabajo (``tm.advance``: sin observadores, el bucle rápido del núcleo) y
+publica ``MachineSnapshot`` (estado, pasos, cabezales y un tramo de cada cinta
+alrededor del cabezal) en una cola de un solo lugar, a una tasa fija de
+refresco. El hilo de Tk solo toma la última instantánea: nunca lee la máquina
+mientras el hilo la modifica, y los pasos intermedios no generan redibujos.
+
+El tamaño de los bloques se ajusta para que cada uno dure unos pocos
+milisegundos, así ``stop()`` (pausa o cancelación) responde de inmediato.
+"""
+from __future__ import annotations
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+# Motivos de fin de una ejecución en turbo
+ACCEPTED = 'accept'
+HALTED = 'halt'
+MAX_STEPS = 'max_steps'
+ERROR = 'error'
+
+
+class MachineSnapshot:
+    """Copia de lo que dibuja la GUI, con la misma interfaz de lectura que la MT.
+
+    Guarda ``radius`` celdas a cada lado de cada cabezal; ``tape_window`` fuera
+    de ese tramo devuelve blancos.
+    """
+
+    def __init__(self, tm, steps: int, radius: int = 64, finished: Optional[str] = None,
+                 error: Optional[str] = None):
+        self.current_state = tm.current_state
+        self.steps = steps
+        self.finished = finished
+        self.error = error
+        self.blank_symbol = tm.blank_symbol
+        self.head_positions = list(tm.head_positions)
+        self.num_tapes = len(self.head_positions)
+        self._lengths = [tm.tape_length(i) for i in range(self.num_tapes)]
+        self._windows: List[Tuple[int, List[str]]] = []
+        for i, head in enumerate(self.head_positions):
+            start = max(0, head - radius)
+            self._windows.append((start, tm.tape_window(i, start, head + radius + 1)))
+
+    def tape_length(self, tape_idx: int) -> int:
+        return self._lengths[tape_idx]
+
+    def tape_window(self, tape_idx: int, start: int, end: int) -> List[str]:
+        lo, cells = self._windows[tape_idx]
+        blank = self.blank_symbol
+        return [cells[i - lo] if 0 <= i - lo < len(cells) else blank for i in range(start, end)]
+
+    def get_current_symbol(self) -> str:
+        return self.tape_window(0, self.head_positions[0], self.head_positions[0] + 1)[0]
+
+    def is_accepting_state(self) -> bool:
+        return self.finished == ACCEPTED
+
+
+class TurboRunner:
+    """Ejecuta una MT en un hilo de trabajo hasta aceptar, detenerse o llegar a ``max_steps``.
+
+    ``steps`` es la cantidad de pasos ya ejecutados al empezar (cuenta de la GUI).
+    Mientras el hilo corre, la MT le pertenece: el hilo de Tk solo lee las
+    instantáneas de ``latest()`` y vuelve a usar la MT después de ``stop()``.
+    """
+
+    def __init__(self, tm, max_steps: int, steps: int = 0, fps: float = 30.0, radius: int = 64,
+                 slice_ms: float = 4.0):
+        self.tm = tm
+        self.max_steps = max_steps
+        self.steps = steps
+        self.interval = 1.0 / fps
+        self.radius = radius
+        self.slice = slice_ms / 1000.0
+        self.finished: Optional[str] = None
+        self._snapshots: queue.Queue = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._work, name='tm-turbo', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Detiene el hilo (a lo sumo tras el bloque en curso) y espera a que termine."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def latest(self) -> Optional[MachineSnapshot]:
+        """Última instantánea publicada (o None si no hay una nueva)."""
+        try:
+            return self._snapshots.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _publish(self, snapshot: MachineSnapshot) -> None:
+        # Cola de un lugar: la instantánea vieja que nadie leyó se descarta
+        try:
+            self._snapshots.get_nowait()
+        except queue.Empty:
+            pass
+        self._snapshots.put_nowait(snapshot)
+
+    def _advance(self, count: int) -> Optional[str]:
+        """Ejecuta hasta ``count`` pasos; devuelve el motivo de fin, si terminó."""
+        tm = self.tm
+        if tm.is_accepting_state():
+            return ACCEPTED
+        # Sin observadores, advance() corre el bucle rápido del núcleo (tm_core)
+        self.steps += tm.advance(min(count, self.max_steps - self.steps))
+        if tm.is_accepting_state():
+            return ACCEPTED
+        if tm.halted:
+            return HALTED
+        if self.steps >= self.max_steps:
+            return MAX_STEPS
+        return None
+
+    def _work(self) -> None:
+        chunk = 256
+        next_frame = time.perf_counter() + self.interval
+        try:
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                finished = self._advance(chunk)
+                now = time.perf_counter()
+                if finished is not None:
+                    self.finished = finished
+                    self._publish(MachineSnapshot(self.tm, self.steps, self.radius, finished))
+                    return
+                # Bloques de ~slice_ms: pausa/cancelación responden sin esperar
+                elapsed = now - start
+                if elapsed > 0:
+                    chunk = max(16, min(chunk * 4, 1 << 16, int(chunk * self.slice / elapsed)))
+                if now >= next_frame:
+                    self._publish(MachineSnapshot(self.tm, self.steps, self.radius))
+                    next_frame = now + self.interval
+        except Exception as e:
+            self.finished = ERROR
+            self._publish(MachineSnapshot(self.tm, self.steps, self.radius, ERROR, str(e)))
@@ -0,0 +1,82 @@
+"""loop_detector.py
+
+Detección de ciclos en ejecuciones que no se detienen.
+
+Una MT determinista que repite una configuración completa (estado, cabezales y
+contenido de las cintas) ya no va a aceptar ni a quedarse sin transición: va a
+repetir el mismo ciclo hasta agotar ``max_steps``. Con un detector asignado
+(``tm.loop_detector = LoopDetector()``) run()/resume() se detienen en cuanto
+ven la repetición y dejan ``result == DIVERGES``.
+
+- Hash incremental de la cinta (estilo Zobrist): XOR de ``hash((posición,
+  código))`` sobre las celdas no blancas. Cada escritura lo actualiza con dos
+  XOR, así comparar configuraciones cuesta O(1) y no O(cinta).
+- Muestreo de Brent: se guarda la configuración de los pasos 0, 1, 2, 4, 8, ...
+  y cada paso se compara contra la última guardada. Un ciclo de largo λ que
+  empieza en el paso μ se detecta antes del paso ~2·max(μ, λ) + λ, sin guardar
+  más de una configuración a la vez.
+- Cuando los hashes coinciden se comparan las cintas guardadas (copias tomadas
+  solo en los pasos potencia de dos: O(1) amortizado por paso), de modo que una
+  colisión nunca da un falso "diverge".
+- Repetición desplazada: una MT que avanza para siempre sobre blancos nuevos
+  (p. ej. number_to_letter yendo a la izquierda en q_back) nunca repite la
+  configuración exacta. Mientras todos los cabezales están fuera de las celdas
+  no blancas, leyendo y escribiendo blancos, se anota dónde estaba cada estado;
+  si un estado vuelve a aparecer igual o más lejos del contenido, el mismo
+  tramo se repetirá desplazado para siempre (``drift`` != 0).
+
+Limitaciones: otras divergencias (contadores que crecen, patrones que se
+copian) no repiten configuración y siguen hasta ``max_steps``. El detector usa
+el bucle paso a paso del núcleo (tm_core): ignora ``accelerate`` y no se aplica
+cuando hay perfilador, grabación u observadores.
+
+Uso:
+    tm.loop_detector = LoopDetector()
+    tm.run(entrada)
+    if tm.loop_detector.diverged:
+        print(tm.loop_detector.cycle_start, tm.loop_detector.cycle_length)
+"""
+from __future__ import annotations
+from typing import Optional, Tuple
+
+# Resultado de una ejecución detenida por el detector
+DIVERGES = 'diverges'
+
+
+class LoopDetector:
+    """Resultado de la detección de la última ejecución.
+
+    ``cycle_start`` es el paso (contado como ``steps_executed``/``step_count``)
+    de una configuración que se repite, ``cycle_length`` los pasos hasta su
+    repetición y ``drift`` el desplazamiento de cada cabezal en ese tramo (todo
+    0 si se repitió exactamente); ``None`` si la ejecución no divergió.
+    ``snapshots`` cuenta las copias de cinta tomadas y ``collisions`` los
+    hashes iguales con cintas distintas.
+    """
+
+    def __init__(self):
+        self.start()
+
+    def start(self) -> None:
+        self.result: Optional[str] = None
+        self.cycle_start: Optional[int] = None
+        self.cycle_length: Optional[int] = None
+        self.drift: Optional[Tuple[int, ...]] = None
+        self.snapshots = 0
+        self.collisions = 0
+
+    @property
+    def diverged(self) -> bool:
+        return self.result == DIVERGES
+
+    def found(self, cycle_start: int, cycle_length: int, drift: Tuple[int, ...]) -> None:
+        self.result = DIVERGES
+        self.cycle_start = cycle_start
+        self.cycle_length = cycle_length
+        self.drift = drift
+
+    def __repr__(self) -> str:
+        if not self.diverged:
+            return "LoopDetector(sin ciclo)"
+        return (f"LoopDetector(diverge: paso {self.cycle_start}, ciclo de {self.cycle_length} pasos, "
+                f"desplazamiento {self.drift})")
@@ -0,0 +1,134 @@
+"""machine_composer.py
+
+Composición secuencial de MTs de una cinta (semántica de ``turing_simulator``).
+
+Una máquina compuesta se arma con tres piezas:
+
+- Componentes: definiciones JSON (p. ej. las de ``config/``) incluidas con un
+  prefijo propio; el estado ``q0`` de un componente con prefijo ``ADD`` pasa a
+  llamarse ``ADD_q0``. Dos copias de la misma máquina no comparten estados.
+- Traspasos (handoffs): cada estado de aceptación de un componente se
+  reemplaza por un estado del compuesto. Las transiciones que entraban en él
+  entran ahora en el estado de traspaso, con la misma escritura y movimiento,
+  y las que salían de él se descartan (la máquina original se detenía ahí).
+  También se puede cortar un componente en un estado que no es de aceptación:
+  ``number_to_letter`` escribe la letra al entrar en ``q_back``, pero en
+  ``turing_simulator`` nunca acepta (el lazo sobre '_' tapa la transición de
+  aceptación), así que el compuesto la toma como salida en ``q_back``.
+- Pegamento: transiciones propias del compuesto (``add``, ``scan``) que mueven
+  el cabezal entre regiones de la cinta y dejan la entrada del siguiente
+  componente como este la espera.
+
+De cada componente se conserva solo la primera transición de cada par
+(estado, símbolo), la que aplica ``turing_simulator``. Una transición de
+pegamento que repite un par ya definido es un error de composición y lanza
+``ValueError``; así el resultado no tiene pares repetidos y no depende de qué
+coincidencia gana.
+
+Uso:
+    composer = MachineComposer()
+    inicio = composer.include(datos_add, 'ADD', {'q_accept': 'q_listo'})
+    composer.add('q_start', '|', inicio)
+    composer.scan('q_listo', ['|'], 'L')
+    ...
+    maquina = composer.build('q_start', ['q_fin'], input_alphabet=[...])
+
+La composición de cifrado César de una sola ejecución está en
+``caesar_machine.py``.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+
+def prefixed(prefix: str, state: str) -> str:
+    """Nombre en el compuesto del estado ``state`` de un componente."""
+    return f"{prefix}_{state}"
+
+
+class MachineComposer:
+    """Acumula estados y transiciones de componentes y pegamento."""
+
+    def __init__(self, blank: str = '_'):
+        self.blank = blank
+        # Diccionarios como conjuntos ordenados: el JSON sale en orden de creación
+        self._states: Dict[str, None] = {}
+        self._tape_alphabet: Dict[str, None] = {blank: None}
+        self._transitions: List[Dict[str, str]] = []
+        self._defined: Dict[tuple, str] = {}
+        self._prefixes: Dict[str, None] = {}
+
+    def _state(self, name: str) -> str:
+        self._states.setdefault(name)
+        return name
+
+    def add(self, state: str, read: str, next_state: str,
+            write: Optional[str] = None, move: str = 'N') -> None:
+        """Transición de pegamento; sin ``write`` se reescribe el símbolo leído."""
+        key = (state, read)
+        if key in self._defined:
+            raise ValueError(f"Transición repetida para ({state!r}, {read!r}) "
+                             f"(ya definida por {self._defined[key]})")
+        self._defined[key] = 'el pegamento'
+        self._append(state, read, next_state, read if write is None else write, move)
+
+    def scan(self, state: str, symbols: Iterable[str], move: str) -> None:
+        """Barrido: sobre cada símbolo de ``symbols`` se mueve sin cambiar de estado."""
+        for sym in symbols:
+            self.add(state, sym, state, sym, move)
+
+    def _append(self, state: str, read: str, next_state: str, write: str, move: str) -> None:
+        self._state(state)
+        self._state(next_state)
+        self._tape_alphabet.setdefault(read)
+        self._tape_alphabet.setdefault(write)
+        self._transitions.append({'current_state': state, 'read_symbol': read,
+                                  'next_state': next_state, 'write_symbol': write, 'move': move})
+
+    def include(self, data: Dict[str, Any], prefix: str, handoffs: Mapping[str, str]) -> str:
+        """Incluye una copia prefijada de ``data``; devuelve el nombre de su estado inicial.
+
+        ``handoffs`` asigna a estados del componente el estado del compuesto que
+        los reemplaza; debe cubrir todos sus estados de aceptación.
+        """
+        if prefix in self._prefixes:
+            raise ValueError(f"Prefijo repetido: {prefix}")
+        if data.get('blank_symbol', '_') != self.blank:
+            raise ValueError(f"El componente {prefix} usa otro símbolo blanco")
+        missing = [s for s in data.get('accept_states', []) if s not in handoffs]
+        if missing:
+            raise ValueError(f"Faltan traspasos para los estados de aceptación de {prefix}: {missing}")
+        self._prefixes.setdefault(prefix)
+
+        def name(state: str) -> str:
+            return handoffs[state] if state in handoffs else prefixed(prefix, state)
+
+        for sym in data.get('tape_alphabet', []):
+            self._tape_alphabet.setdefault(sym)
+        for t in data.get('transitions', []):
+            state, read = t.get('current_state'), t.get('read_symbol')
+            if state is None or read is None or state in handoffs:
+                continue
+            key = (name(state), read)
+            if key in self._defined:
+                continue  # tapada por una anterior del mismo componente
+            self._defined[key] = prefix
+            self._append(key[0], read, name(t.get('next_state', state)),
+                         t.get('write_symbol', read), t.get('move', 'N'))
+        return name(data['initial_state'])
+
+    def build(self, initial_state: str, accept_states: List[str],
+              input_alphabet: Iterable[str], **extra: Any) -> Dict[str, Any]:
+        """Definición JSON del compuesto; ``extra`` agrega campos descriptivos."""
+        for s in [initial_state, *accept_states]:
+            self._state(s)
+        machine: Dict[str, Any] = dict(extra)
+        machine.update({
+            'states': list(self._states),
+            'input_alphabet': list(dict.fromkeys(input_alphabet)),
+            'tape_alphabet': list(self._tape_alphabet),
+            'initial_state': initial_state,
+            'accept_states': list(accept_states),
+            'blank_symbol': self.blank,
+            'transitions': list(self._transitions),
+        })
+        return machine
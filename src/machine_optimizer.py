@@ -0,0 +1,213 @@
+"""machine_optimizer.py
+
+Optimización de definiciones JSON de MT de una cinta sin cambiar lo que
+calculan (semántica de ``turing_simulator``: gana la primera transición
+declarada y no se dan pasos desde un estado de aceptación).
+
+Pasadas, en orden:
+
+1. Transiciones repetidas: una idéntica a otra anterior se elimina; una con el
+   mismo par (estado, símbolo) que otra anterior nunca se aplica (``shadowed``)
+   y también se elimina.
+2. Transiciones muertas: las que salen de un estado de aceptación.
+3. Estados inalcanzables: los que no se alcanzan desde ``initial_state``
+   siguiendo las transiciones; se quitan junto con sus transiciones.
+4. Minimización (refinamiento de particiones de Moore, como en un AFD): dos
+   estados son equivalentes si para cada símbolo ambos escriben lo mismo, se
+   mueven igual y pasan a estados equivalentes (o ninguno tiene transición).
+   Cada clase se reemplaza por un representante. Los estados de aceptación no
+   se fusionan entre sí, así el estado final reportado no cambia de nombre.
+
+El resultado hace exactamente los mismos pasos y deja la misma cinta; solo
+``current_state`` puede mostrar el representante de un estado fusionado.
+Como no quedan pares (estado, símbolo) repetidos, la definición ya no depende
+de qué coincidencia gana (en ``turing_machine`` gana la última).
+
+Uso:
+    optimized, report = optimize(data)
+    print(report.summary())
+
+Herramienta de línea de comandos: ``tools/optimize_machine.py``.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from compiled_machine import MOVE_DELTA  # type: ignore
+except ImportError:  # importado como paquete (src.machine_optimizer)
+    from .compiled_machine import MOVE_DELTA
+
+_FIELDS = ('current_state', 'read_symbol', 'next_state', 'write_symbol', 'move')
+
+
+class OptimizationReport:
+    """Qué eliminó o fusionó ``optimize``."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.states_before = len(_all_states(data))
+        self.transitions_before = len(data.get('transitions', []))
+        self.states_after = self.states_before
+        self.transitions_after = self.transitions_before
+        # Transiciones idénticas a una anterior / tapadas por una anterior con el mismo (estado, símbolo)
+        self.duplicates = 0
+        self.shadowed = 0
+        # Transiciones que salen de estados de aceptación
+        self.from_accept = 0
+        self.unreachable_states: List[str] = []
+        self.unreachable_transitions = 0
+        # Representante -> estados fusionados en él
+        self.merged: Dict[str, List[str]] = {}
+        self.merged_transitions = 0
+
+    @property
+    def changed(self) -> bool:
+        return (self.states_after, self.transitions_after) != (self.states_before, self.transitions_before)
+
+    def summary(self) -> str:
+        lines = [
+            f"Estados: {self.states_before} -> {self.states_after}",
+            f"Transiciones: {self.transitions_before} -> {self.transitions_after}",
+            f"  repetidas: {self.duplicates}, tapadas por una anterior: {self.shadowed}, "
+            f"desde aceptación: {self.from_accept}",
+            f"  de estados inalcanzables: {self.unreachable_transitions}, "
+            f"de estados fusionados: {self.merged_transitions}",
+        ]
+        if self.unreachable_states:
+            lines.append(f"Estados inalcanzables: {', '.join(self.unreachable_states)}")
+        for rep, states in self.merged.items():
+            lines.append(f"Fusionados en {rep}: {', '.join(states)}")
+        return '\n'.join(lines)
+
+
+def _all_states(data: Dict[str, Any]) -> List[str]:
+    """Estados en orden de aparición: declarados, inicial, de aceptación, transiciones."""
+    seen: Dict[str, None] = {}
+    for s in data.get('states', []):
+        seen.setdefault(s)
+    if data.get('initial_state') is not None:
+        seen.setdefault(data['initial_state'])
+    for s in data.get('accept_states', []):
+        seen.setdefault(s)
+    for t in data.get('transitions', []):
+        if t.get('current_state') is not None and t.get('read_symbol') is not None:
+            seen.setdefault(t['current_state'])
+            seen.setdefault(t.get('next_state', t['current_state']))
+    return list(seen)
+
+
+def remove_redundant(transitions: List[Dict[str, Any]], accept_states,
+                     report: Optional[OptimizationReport] = None) -> List[Dict[str, Any]]:
+    """Pasadas 1 y 2: quita repetidas, tapadas y las que salen de aceptación."""
+    accept = set(accept_states)
+    seen = {}
+    kept = []
+    for t in transitions:
+        state, read = t.get('current_state'), t.get('read_symbol')
+        if state is None or read is None:
+            kept.append(t)  # el simulador la ignora; no es asunto del optimizador
+            continue
+        key = (state, read)
+        first = seen.get(key)
+        if first is not None:
+            if report is not None:
+                if all(first.get(f) == t.get(f) for f in _FIELDS):
+                    report.duplicates += 1
+                else:
+                    report.shadowed += 1
+            continue
+        seen[key] = t
+        if state in accept:
+            if report is not None:
+                report.from_accept += 1
+            continue
+        kept.append(t)
+    return kept
+
+
+def reachable_states(initial_state: Optional[str], transitions: List[Dict[str, Any]]) -> set:
+    """Estados alcanzables desde ``initial_state`` por cualquier transición."""
+    successors: Dict[str, set] = {}
+    for t in transitions:
+        if t.get('current_state') is not None and t.get('read_symbol') is not None:
+            successors.setdefault(t['current_state'], set()).add(t.get('next_state', t['current_state']))
+    if initial_state is None:
+        return set()
+    reached = {initial_state}
+    pending = [initial_state]
+    while pending:
+        for nxt in successors.get(pending.pop(), ()):
+            if nxt not in reached:
+                reached.add(nxt)
+                pending.append(nxt)
+    return reached
+
+
+def equivalent_states(states: List[str], accept_states, transitions: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Pasada 4: estado -> representante de su clase (el primero en ``states``).
+
+    ``transitions`` no debe tener pares (estado, símbolo) repetidos.
+    """
+    accept = set(accept_states)
+    rows: Dict[str, Dict[str, Tuple[str, int, str]]] = {s: {} for s in states}
+    for t in transitions:
+        state, read = t.get('current_state'), t.get('read_symbol')
+        if state in rows and read is not None:
+            rows[state][read] = (t.get('write_symbol', read), MOVE_DELTA.get(t.get('move', 'N'), 0),
+                                 t.get('next_state', state))
+
+    def classes(key_of) -> Dict[str, int]:
+        ids: Dict[Any, int] = {}
+        return {s: ids.setdefault(key_of(s), len(ids)) for s in states}
+
+    # Partición inicial: qué escribe y cómo se mueve cada estado con cada símbolo
+    block = classes(lambda s: (s if s in accept else None,
+                               frozenset((r, w, d) for r, (w, d, _) in rows[s].items())))
+    while True:
+        refined = classes(lambda s: (block[s], frozenset((r, block.get(n, n)) for r, (_, _, n) in rows[s].items())))
+        if len(set(refined.values())) == len(set(block.values())):
+            break
+        block = refined
+    representative: Dict[int, str] = {}
+    return {s: representative.setdefault(block[s], s) for s in states}
+
+
+def optimize(data: Dict[str, Any]) -> Tuple[Dict[str, Any], OptimizationReport]:
+    """Devuelve ``(definición optimizada, reporte)``; ``data`` no se modifica."""
+    report = OptimizationReport(data)
+    initial = data.get('initial_state')
+    accept_states = data.get('accept_states', [])
+    transitions = remove_redundant(data.get('transitions', []), accept_states, report)
+
+    reached = reachable_states(initial, transitions)
+    if initial is not None:
+        report.unreachable_states = [s for s in _all_states(data) if s not in reached]
+        kept = [t for t in transitions if t.get('current_state') is None or t['current_state'] in reached]
+        report.unreachable_transitions = len(transitions) - len(kept)
+        transitions = kept
+    states = [s for s in _all_states(data) if s in reached] if initial is not None else _all_states(data)
+
+    # El inicial primero: así representa a su clase y conserva el nombre
+    if initial in states:
+        states.remove(initial)
+        states.insert(0, initial)
+    rep = equivalent_states(states, accept_states, transitions)
+    for s, r in rep.items():
+        if s != r:
+            report.merged.setdefault(r, []).append(s)
+    kept = []
+    for t in transitions:
+        state = t.get('current_state')
+        if state is not None and rep.get(state, state) != state:
+            report.merged_transitions += 1
+            continue
+        if t.get('next_state') in rep and rep[t['next_state']] != t['next_state']:
+            t = dict(t, next_state=rep[t['next_state']])
+        kept.append(t)
+
+    optimized = dict(data)
+    optimized['states'] = [s for s in data.get('states', []) if rep.get(s, s) == s and (initial is None or s in reached)]
+    optimized['accept_states'] = [s for s in accept_states if initial is None or s in reached]
+    optimized['transitions'] = kept
+    report.states_after = len(_all_states(optimized))
+    report.transitions_after = len(kept)
+    return optimized, report
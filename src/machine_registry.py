@@ -0,0 +1,113 @@
+"""machine_registry.py
+
+Registro de máquinas por proceso: cada configuración JSON se lee, parsea y
+compila una sola vez y luego se reparte como instancias nuevas y baratas (solo
+estado de ejecución: cinta, cabezal, estado actual).
+
+La caché se indexa por ruta absoluta y se valida con (mtime, tamaño); si cambian,
+se compara el hash del contenido antes de recompilar, de modo que tocar un
+archivo sin modificarlo no invalida nada.
+
+La GUI multi-cinta pide instancias de ``turing_machine.TuringMachine`` con
+``new_multi_machine``: su tabla también se compila una sola vez por definición.
+
+Uso:
+    from machine_registry import new_machine
+    tm = new_machine('config/add_simple.json')
+    tm.run('||+|||')
+"""
+from __future__ import annotations
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    from compiled_machine import CompiledMachine  # type: ignore
+    from turing_simulator import TuringMachine  # type: ignore
+    from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+except ImportError:  # importado como paquete (src.machine_registry)
+    from .compiled_machine import CompiledMachine
+    from .turing_simulator import TuringMachine
+    from .turing_machine import TuringMachine as MultiTuringMachine
+
+
+class MachineDefinition:
+    """Definición parseada y compilada de una MT. Compartida: no modificar ``data``."""
+
+    def __init__(self, path: str, data: Dict[str, Any], digest: str):
+        self.path = path
+        self.data = data
+        self.digest = digest
+        self.compiled = CompiledMachine(data)
+        self._multi: Optional[MultiTuringMachine] = None
+
+    @property
+    def key(self) -> tuple:
+        """Identidad de la máquina: ruta + hash del contenido."""
+        return (self.path, self.digest)
+
+    def new_machine(self) -> TuringMachine:
+        return TuringMachine.from_definition(self.data, self.compiled, self.path)
+
+    def new_multi_machine(self) -> MultiTuringMachine:
+        """Instancia de ``turing_machine.TuringMachine`` (GUI multi-cinta); la
+        definición se compila la primera vez y las siguientes la comparten."""
+        if self._multi is None:
+            prototype = MultiTuringMachine()
+            if not prototype.load_config_data(self.data, self.path):
+                raise ValueError(f"Configuración inválida: {self.path}")
+            self._multi = prototype
+        return self._multi.fresh()
+
+
+class MachineRegistry:
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}  # path -> (mtime_ns, size, definition)
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def definition(self, json_file: str) -> MachineDefinition:
+        path = os.path.abspath(json_file)
+        st = os.stat(path)
+        cached = self._entries.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with self._lock:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            if cached is not None and cached[2].digest == digest:
+                definition = cached[2]
+            else:
+                definition = MachineDefinition(path, json.loads(raw.decode('utf-8')), digest)
+                self.loads += 1
+            self._entries[path] = (st.st_mtime_ns, st.st_size, definition)
+            return definition
+
+    def config(self, json_file: str) -> Dict[str, Any]:
+        """JSON parseado (compartido, solo lectura)."""
+        return self.definition(json_file).data
+
+    def new_machine(self, json_file: str) -> TuringMachine:
+        return self.definition(json_file).new_machine()
+
+    def new_multi_machine(self, json_file: str) -> MultiTuringMachine:
+        return self.definition(json_file).new_multi_machine()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+default_registry = MachineRegistry()
+
+
+def get_definition(json_file: str) -> MachineDefinition:
+    return default_registry.definition(json_file)
+
+
+def new_machine(json_file: str) -> TuringMachine:
+    """Instancia fresca de ``turing_simulator.TuringMachine`` desde el registro global."""
+    return default_registry.new_machine(json_file)
@@ -0,0 +1,194 @@
+"""observers.py
+
+Observadores de la ejecución del simulador multi-cinta (``turing_machine``).
+
+Un observador hereda de ``StepObserver`` y redefine los avisos que le
+interesan:
+
+- ``on_start(tm)``: la MT quedó en su configuración inicial (``run``,
+  ``restore``/``resume``)
+- ``on_step(tm, event)`` / ``on_steps(tm, events)``: pasos ejecutados, como
+  ``StepEvent``; se entregan en lotes de ``batch`` pasos (por defecto 1)
+- ``on_tape_grow(tm, tape_idx, length)``: una cinta creció para alojar al cabezal
+- ``on_halt(tm, reason)``: ``ACCEPT``, ``NO_TRANSITION`` o ``MAX_STEPS``
+
+Antes de ``on_tape_grow`` y ``on_halt`` se entregan los pasos pendientes, así
+cada observador ve los avisos en orden. Sin observadores la MT corre con su
+bucle especializado, sin ninguna comprobación por paso.
+
+Uso:
+    tm.add_observer(DebugPrinter())          # equivale a enable_debug_mode()
+    tm.recorder = TraceRecorder()            # se registra como RecorderObserver
+"""
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+
+# Motivos de detención (on_halt)
+ACCEPT = 'accept'
+NO_TRANSITION = 'no_transition'
+MAX_STEPS = 'max_steps'
+
+
+class StepEvent:
+    """Un paso ejecutado.
+
+    ``step`` es el número de paso (0 = primero), ``heads`` las posiciones donde
+    se leyó y escribió, ``read_codes``/``write_codes`` los códigos por cinta,
+    ``moves`` los movimientos declarados en la transición y ``deltas`` el
+    desplazamiento real de cada cabezal (0 si chocó con la celda 0). ``reads``
+    y ``writes`` decodifican los símbolos solo si se consultan.
+    """
+    __slots__ = ('step', 'state', 'next_state', 'heads', 'read_codes', 'write_codes', 'moves',
+                 'deltas', 'symbols')
+
+    def __init__(self, step: int, state: str, next_state: str, heads: List[int], read_codes: bytes,
+                 write_codes: bytes, moves: Tuple[str, ...], deltas: List[int], symbols: Sequence[str]):
+        self.step = step
+        self.state = state
+        self.next_state = next_state
+        self.heads = heads
+        self.read_codes = read_codes
+        self.write_codes = write_codes
+        self.moves = moves
+        self.deltas = deltas
+        self.symbols = symbols
+
+    @property
+    def reads(self) -> Tuple[str, ...]:
+        return tuple(self.symbols[c] for c in self.read_codes)
+
+    @property
+    def writes(self) -> Tuple[str, ...]:
+        return tuple(self.symbols[c] for c in self.write_codes)
+
+    def __repr__(self) -> str:
+        return (f"StepEvent(step={self.step}, {self.state}, {self.reads} -> {self.next_state}, "
+                f"{self.writes}, {self.moves})")
+
+
+class StepObserver:
+    """Base de los observadores: todos los avisos son opcionales."""
+
+    # Pasos que se acumulan antes de llamar a on_steps
+    batch = 1
+
+    def on_start(self, tm) -> None:
+        pass
+
+    def on_step(self, tm, event: StepEvent) -> None:
+        pass
+
+    def on_steps(self, tm, events: List[StepEvent]) -> None:
+        for event in events:
+            self.on_step(tm, event)
+
+    def on_tape_grow(self, tm, tape_idx: int, length: int) -> None:
+        pass
+
+    def on_halt(self, tm, reason: str) -> None:
+        pass
+
+
+class ObserverSet:
+    """Observadores de una MT, con un búfer de pasos por observador.
+
+    Es falso si está vacío: la MT lo consulta una vez por ejecución para
+    elegir el bucle sin avisos.
+    """
+
+    def __init__(self):
+        self._observers: List[StepObserver] = []
+        self._pending: List[List[StepEvent]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._observers)
+
+    def __iter__(self):
+        return iter(self._observers)
+
+    def add(self, observer: StepObserver) -> None:
+        self._observers.append(observer)
+        self._pending.append([])
+
+    def remove(self, observer: StepObserver, tm=None) -> None:
+        """Quita ``observer``; si se indica ``tm``, antes le entrega sus pasos pendientes."""
+        i = self._observers.index(observer)
+        if tm is not None and self._pending[i]:
+            observer.on_steps(tm, self._pending[i])
+        del self._observers[i]
+        del self._pending[i]
+
+    def start(self, tm) -> None:
+        for i, observer in enumerate(self._observers):
+            self._pending[i] = []
+            observer.on_start(tm)
+
+    def step(self, tm, event: StepEvent) -> None:
+        for observer, pending in zip(self._observers, self._pending):
+            pending.append(event)
+            if len(pending) >= observer.batch:
+                observer.on_steps(tm, pending[:])
+                pending.clear()
+
+    def flush(self, tm) -> None:
+        """Entrega los pasos pendientes de todos los observadores."""
+        for observer, pending in zip(self._observers, self._pending):
+            if pending:
+                observer.on_steps(tm, pending[:])
+                pending.clear()
+
+    def tape_grow(self, tm, tape_idx: int, length: int) -> None:
+        self.flush(tm)
+        for observer in self._observers:
+            observer.on_tape_grow(tm, tape_idx, length)
+
+    def halt(self, tm, reason: str) -> None:
+        self.flush(tm)
+        for observer in self._observers:
+            observer.on_halt(tm, reason)
+
+
+class DebugPrinter(StepObserver):
+    """Salida del modo debug: una línea por paso y la cinta cada 25 pasos."""
+
+    def on_start(self, tm) -> None:
+        print("=== Inicio ejecución MT ===")
+        if tm.input_string is not None:
+            print(f"Cintas: {tm.num_tapes}, Entrada: '{tm.input_string}'")
+        else:
+            print(f"Cintas: {tm.num_tapes}, Reanudación desde el paso {tm.step_count}")
+
+    def on_step(self, tm, event: StepEvent) -> None:
+        moves = event.moves[0] if len(event.moves) == 1 else event.moves
+        print(f"Paso {event.step}: estado={event.state} símbolos={event.reads} -> {event.next_state}, "
+              f"escribir={event.writes}, movimientos={moves}")
+        if (event.step + 1) % 25 == 0:
+            tm.display_tape()
+
+    def on_halt(self, tm, reason: str) -> None:
+        if reason == NO_TRANSITION:
+            symbols = tuple(tm.tape_window(i, h, h + 1)[0] for i, h in enumerate(tm.head_positions))
+            print(f"Sin transición para estado={tm.current_state} símbolos={symbols}")
+        print("=== Fin ejecución ===")
+        print(f"Pasos: {tm.step_count} | Estado final: {tm.current_state} | Aceptado: {tm.is_accepting_state()}")
+        tm.display_tape()
+
+
+class RecorderObserver(StepObserver):
+    """Graba cada paso en un ``TraceRecorder`` (ver trace_recorder.py).
+
+    Entrega paso a paso: quien avanza con step() lee la grabación al día.
+    """
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def on_start(self, tm) -> None:
+        self.recorder.start(tm._symbols, [], tm.current_state,
+                            [(0, bytes(t)) for t in tm._tapes], tm.head_positions,
+                            tm._foreign_cells[0] if tm._foreign_cells else None)
+
+    def on_step(self, tm, event: StepEvent) -> None:
+        rec = self.recorder
+        rec.record_multi(rec.state_id(event.next_state), event.heads, event.read_codes,
+                         event.write_codes, event.deltas)
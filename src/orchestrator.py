@@ -1,6 +1,11 @@
 from __future__ import annotations
 import os
 import sys
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterator, Optional, TextIO
 
 # Ensure src on path when run from repo root
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -8,16 +13,101 @@ SRC = os.path.join(ROOT, 'src')
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
-from turing_simulator import TuringMachine  # type: ignore
+from machine_registry import get_definition  # type: ignore
+from caesar_machine import caesar_step_budget  # type: ignore
+
+
+RunCacheInfo = namedtuple('RunCacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'enabled'])
+
+
+class RunCache:
+    """LRU acotada de ejecuciones de MT: (identidad de máquina, entrada) -> salida.
+
+    Todas las máquinas de config/ son deterministas, así que repetir una
+    ejecución con la misma entrada siempre produce la misma cinta. La identidad
+    de la máquina incluye el hash del JSON (machine_registry), por lo que editar
+    un archivo nunca devuelve resultados viejos.
+    """
+
+    def __init__(self, maxsize: int = 4096, enabled: bool = False):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> RunCacheInfo:
+        return RunCacheInfo(self.hits, self.misses, self.maxsize, len(self._data), self.enabled)
+
+
+_run_cache = RunCache()
+
+
+def enable_run_cache(maxsize: int = 4096) -> None:
+    """Activa la memoización de ejecuciones (opcional; desactivada por defecto)."""
+    _run_cache.maxsize = maxsize
+    _run_cache.enabled = True
+
+
+def disable_run_cache() -> None:
+    _run_cache.enabled = False
+    _run_cache.clear()
+
+
+def run_cache_info() -> RunCacheInfo:
+    return _run_cache.info()
+
+
+# Máquinas que usa el pipeline César (se precargan en los workers paralelos).
+PIPELINE_CONFIGS = (
+    'letter_to_number.json',
+    'add_simple.json',
+    'subtract_simple.json',
+    'mod26_full.json',
+    'number_to_letter.json',
+)
 
 
 def _cfg(name: str) -> str:
     return os.path.join(ROOT, 'config', name)
 
 
-def _run_tm(config_name: str, input_str: str) -> str:
-    tm = TuringMachine(_cfg(config_name))
-    return tm.run(input_str)
+def _run_tm(config_name: str, input_str: str, max_steps: int = 10000) -> str:
+    # Definición cacheada en el registro; accelerate da el mismo resultado que paso a paso
+    definition = get_definition(_cfg(config_name))
+    if not _run_cache.enabled:
+        return definition.new_machine().run(input_str, max_steps=max_steps, accelerate=True)
+    # El presupuesto forma parte de la clave: con otro límite la cinta final puede cambiar
+    key = (definition.key, input_str, max_steps)
+    out = _run_cache.get(key)
+    if out is None:
+        out = definition.new_machine().run(input_str, max_steps=max_steps, accelerate=True)
+        _run_cache.put(key, out)
+    return out
 
 
 def key_letter_to_shift_marks(key_letter: str) -> str:
@@ -52,22 +142,33 @@ def add_unary(a: str, b: str) -> str:
     return ''.join(ch for ch in out if ch == '|')
 
 
-def subtract_unary(a: str, b: str) -> str:
-    out = _run_tm('subtract_simple.json', f"{a}-{b}")
+def subtract_unary(a: str, b: str, max_steps: int = 10000) -> str:
+    out = _run_tm('subtract_simple.json', f"{a}-{b}", max_steps=max_steps)
     # Sanear: quedarnos solo con marcas unarias
     return ''.join(ch for ch in out if ch == '|')
 
 
-def mod26(marks: str) -> str:
+def _mod26_step_budget(n: int) -> int:
+    # mod26_full hace a lo sumo n // 26 + 1 pasadas de ida y vuelta sobre la cinta
+    return (n // 26 + 1) * (2 * n + 64)
+
+
+def mod26(marks: str, use_subtraction: bool = False) -> str:
     """Reduce unary marks modulo 26 using only JSON-defined MTs.
 
-    Implemented by repeatedly subtracting 26 (||||||||||||||||||||||||||)
-    via the subtract machine until result length < 26.
+    By default this is a single run of the mod26_full machine, which erases
+    batches of 26 marks on one tape. With ``use_subtraction=True`` it uses the
+    original method: repeatedly subtract 26 (||||||||||||||||||||||||||) via
+    the subtract machine until result length < 26.
     """
-    twenty_six = '|' * 26
     # Guard simple cases
     if not marks:
         return ''
+    if not use_subtraction:
+        marks = ''.join(ch for ch in marks if ch == '|')
+        out = _run_tm('mod26_full.json', marks, max_steps=_mod26_step_budget(len(marks)))
+        return ''.join(ch for ch in out if ch == '|')
+    twenty_six = '|' * 26
     # Loop using subtract_unary MT; control flow stays in Python (no arithmetic).
     # Hard stop to avoid runaway on malformed configs
     for _ in range(2000):
@@ -75,13 +176,17 @@ def mod26(marks: str) -> str:
         marks = ''.join(ch for ch in marks if ch == '|')
         if len(marks) < 26:
             return marks
-        marks = subtract_unary(marks, twenty_six)
+        # subtract_simple cuesta ~54 pasos por marca; el límite por defecto no alcanza sobre ~170
+        marks = subtract_unary(marks, twenty_six, max_steps=64 * (len(marks) + 26) + 1024)
     # If we ever hit the guard, return current best effort
     return marks
 
 
-def encrypt_text(key_letter: str, text: str) -> str:
-    shift_marks = key_letter_to_shift_marks(key_letter)
+# Tamaño de bloque (caracteres) para encrypt_stream/decrypt_stream.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _shift_chars(text: str, shift_marks: str) -> str:
     out_chars = []
     for ch in text:
         u = ch.upper()
@@ -95,19 +200,122 @@ def encrypt_text(key_letter: str, text: str) -> str:
     return ''.join(out_chars)
 
 
-def decrypt_text(key_letter: str, text: str) -> str:
+def _inverse_shift_marks(key_letter: str) -> str:
     shift_marks = key_letter_to_shift_marks(key_letter)
     # Compute (26 - shift) in unary using subtract machine
     const26 = '|' * 26
-    inv_marks = subtract_unary(const26, shift_marks)
-    out_chars = []
-    for ch in text:
-        u = ch.upper()
-        if 'A' <= u <= 'Z':
-            n_marks = letter_to_marks(u)
-            s_marks = add_unary(n_marks, inv_marks)
-            r_marks = mod26(s_marks)
-            out_chars.append(marks_to_letter(r_marks))
-        else:
-            out_chars.append(ch)
-    return ''.join(out_chars)
+    return subtract_unary(const26, shift_marks)
+
+
+def encrypt_text(key_letter: str, text: str) -> str:
+    return _shift_chars(text, key_letter_to_shift_marks(key_letter))
+
+
+def decrypt_text(key_letter: str, text: str) -> str:
+    return _shift_chars(text, _inverse_shift_marks(key_letter))
+
+
+# Single-run machines composed from the modular configs (tools/build_caesar_machine.py).
+SINGLE_RUN_CONFIGS = {
+    'encrypt': 'caesar_encrypt_composed.json',
+    'decrypt': 'caesar_decrypt_composed.json',
+}
+
+
+def _single_run(operation: str, key_letter: str, text: str) -> str:
+    if not key_letter or len(key_letter) != 1 or not 'A' <= key_letter.upper() <= 'Z':
+        raise ValueError("La clave debe ser una sola letra A-Z")
+    config_name = SINGLE_RUN_CONFIGS[operation]
+    alphabet = get_definition(_cfg(config_name)).data['input_alphabet']
+    unsupported = set(text).difference(alphabet)
+    if unsupported:
+        raise ValueError(f"Caracteres no soportados por {config_name}: {''.join(sorted(unsupported))!r}")
+    return _run_tm(config_name, f"{key_letter}#{text}", max_steps=caesar_step_budget(len(text)))
+
+
+def encrypt_text_single_run(key_letter: str, text: str) -> str:
+    """Same result as encrypt_text, computed by one run of a single machine.
+
+    caesar_encrypt_composed.json processes the whole ``key#text`` tape instead
+    of ~5 machine runs per letter (see caesar_machine.py for the tape layout).
+    Characters outside its alphabet (caesar_machine.TEXT_ALPHABET; e.g. the
+    blank '_') raise ValueError.
+    """
+    return _single_run('encrypt', key_letter, text)
+
+
+def decrypt_text_single_run(key_letter: str, text: str) -> str:
+    """Single-run counterpart of decrypt_text; see encrypt_text_single_run."""
+    return _single_run('decrypt', key_letter, text)
+
+
+def _stream_chunks(source: TextIO, shift_marks: str, chunk_size: int) -> Iterator[str]:
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield _shift_chars(chunk, shift_marks)
+
+
+def encrypt_stream(key_letter: str, source: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Encrypt text read in chunks from a file-like object (``read(n)`` -> str).
+
+    Yields one encrypted chunk per chunk read, so memory use does not depend on
+    the input size. The key is validated (and its shift computed) immediately.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser positivo")
+    return _stream_chunks(source, key_letter_to_shift_marks(key_letter), chunk_size)
+
+
+def decrypt_stream(key_letter: str, source: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Streaming counterpart of decrypt_text; see encrypt_stream."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser positivo")
+    return _stream_chunks(source, _inverse_shift_marks(key_letter), chunk_size)
+
+
+# Modo paralelo: bloques de texto repartidos en un ProcessPoolExecutor.
+DEFAULT_PARALLEL_CHUNK = 4096
+PARALLEL_MIN_LENGTH = 16 * 1024
+
+
+def _init_worker(cache_maxsize: Optional[int]) -> None:
+    """Initializer de cada proceso: carga y compila las máquinas una vez."""
+    for name in PIPELINE_CONFIGS:
+        get_definition(_cfg(name))
+    if cache_maxsize is not None:
+        enable_run_cache(cache_maxsize)
+
+
+def _parallel_shift(text: str, shift_marks: str, workers: Optional[int],
+                    chunk_size: int, min_length: int) -> str:
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser positivo")
+    if len(text) < max(min_length, 2 * chunk_size) or workers == 1:
+        return _shift_chars(text, shift_marks)
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    cache_maxsize = _run_cache.maxsize if _run_cache.enabled else None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_maxsize,)) as pool:
+        # map conserva el orden de los bloques
+        return ''.join(pool.map(_shift_chars, chunks, repeat(shift_marks)))
+
+
+def encrypt_text_parallel(key_letter: str, text: str, workers: Optional[int] = None,
+                          chunk_size: int = DEFAULT_PARALLEL_CHUNK,
+                          min_length: int = PARALLEL_MIN_LENGTH) -> str:
+    """encrypt_text over a process pool; same output, order preserved.
+
+    ``workers`` defaults to the CPU count. Texts shorter than ``min_length``
+    (or than two chunks) run serially, since process start-up would dominate.
+    If the run cache is enabled, each worker gets its own cache of the same size.
+    """
+    return _parallel_shift(text, key_letter_to_shift_marks(key_letter), workers, chunk_size, min_length)
+
+
+def decrypt_text_parallel(key_letter: str, text: str, workers: Optional[int] = None,
+                          chunk_size: int = DEFAULT_PARALLEL_CHUNK,
+                          min_length: int = PARALLEL_MIN_LENGTH) -> str:
+    """Parallel counterpart of decrypt_text; see encrypt_text_parallel."""
+    return _parallel_shift(text, _inverse_shift_marks(key_letter), workers, chunk_size, min_length)
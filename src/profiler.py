@@ -0,0 +1,173 @@
+"""profiler.py
+
+Perfil de ejecución de una MT: dónde se van los pasos.
+
+Se asigna a ``tm.profiler`` en cualquiera de los dos simuladores
+(``turing_simulator`` o ``turing_machine``). Mientras es None los bucles de
+ejecución no cambian en nada; con un perfilador asignado, ``run``/``resume``
+usan un bucle paso a paso (sin acelerar) que además cuenta:
+
+- ``state_visits``: pasos ejecutados desde cada estado
+- ``transition_hits``: veces que se aplicó cada transición
+- ``head_travel``: celdas recorridas por los cabezales (suma de |movimiento|)
+- ``growth_events``: veces que la cinta creció para alojar al cabezal
+
+y, si ``timeline`` es True, los tramos de permanencia en cada estado (estado,
+paso inicial, largo de la cinta al empezar). ``report()`` arma las tablas de
+estados y transiciones más usados; ``to_chrome_trace()``/``to_speedscope()``
+exportan la línea de tiempo (eje en pasos: 1 µs = 1 paso en Chrome).
+
+Uso:
+    tm.profiler = ExecutionProfiler()
+    tm.run('|' * 500, max_steps=10**6)
+    print(tm.profiler.report())
+    tm.profiler.save('perfil.json', 'speedscope')
+"""
+from __future__ import annotations
+import json
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+FORMATS = ('chrome', 'speedscope')
+
+
+class ExecutionProfiler:
+    def __init__(self, timeline: bool = True, max_segments: int = 1_000_000):
+        self.timeline = timeline
+        self.max_segments = max_segments
+        self.engine: Optional[str] = None
+        self.machine: Optional[str] = None
+        self.state_names: List[str] = []
+        self.state_ids: Dict[str, int] = {}
+        self.transition_labels: List[str] = []
+        self.state_visits: List[int] = []
+        self.transition_hits: List[int] = []
+        self.head_travel = 0
+        self.growth_events = 0
+        self.start_step = 0
+        self.end_step = 0
+        self.final_cells = 0
+        self.truncated = False
+        self.seg_state = array('i')
+        self.seg_start = array('q')
+        self.seg_cells = array('q')
+
+    def start(self, engine: str, state_names: Sequence[str], transition_labels: Sequence[str],
+              step: int, machine: Optional[str] = None) -> None:
+        """Descarta lo medido. ``step`` es el contador de pasos de la MT al empezar."""
+        self.engine = engine
+        self.machine = machine
+        self.state_names = list(state_names)
+        self.state_ids = {name: i for i, name in enumerate(self.state_names)}
+        self.transition_labels = list(transition_labels)
+        self.state_visits = [0] * len(self.state_names)
+        self.transition_hits = [0] * len(self.transition_labels)
+        self.head_travel = 0
+        self.growth_events = 0
+        self.start_step = self.end_step = step
+        self.final_cells = 0
+        self.truncated = False
+        self.seg_state = array('i')
+        self.seg_start = array('q')
+        self.seg_cells = array('q')
+
+    def state_id(self, name: str) -> int:
+        sid = self.state_ids.get(name)
+        if sid is None:
+            sid = len(self.state_names)
+            self.state_names.append(name)
+            self.state_ids[name] = sid
+            self.state_visits.append(0)
+        return sid
+
+    def segment(self, state_id: int, step: int, cells: int) -> None:
+        """Empieza un tramo en ``state_id`` en el paso ``step`` (cinta de ``cells`` celdas)."""
+        if not self.timeline:
+            return
+        if len(self.seg_state) >= self.max_segments:
+            self.timeline = False
+            self.truncated = True
+            return
+        self.seg_state.append(state_id)
+        self.seg_start.append(step)
+        self.seg_cells.append(cells)
+
+    def finish(self, step: int, cells: int) -> None:
+        self.end_step = step
+        self.final_cells = cells
+
+    @property
+    def steps(self) -> int:
+        return self.end_step - self.start_step
+
+    def hot_states(self, limit: Optional[int] = None) -> List[Tuple[str, int, float]]:
+        """(estado, pasos, fracción) de mayor a menor."""
+        total = sum(self.state_visits) or 1
+        rows = sorted(zip(self.state_names, self.state_visits), key=lambda r: -r[1])
+        return [(name, n, n / total) for name, n in rows[:limit] if n]
+
+    def hot_transitions(self, limit: Optional[int] = None) -> List[Tuple[str, int, float]]:
+        """(transición, aplicaciones, fracción) de mayor a menor."""
+        total = sum(self.transition_hits) or 1
+        rows = sorted(zip(self.transition_labels, self.transition_hits), key=lambda r: -r[1])
+        return [(label, n, n / total) for label, n in rows[:limit] if n]
+
+    def report(self, limit: int = 15) -> str:
+        lines = [f"Perfil: {self.steps:,} pasos, recorrido del cabezal {self.head_travel:,} celdas, "
+                 f"{self.growth_events:,} crecimientos de cinta (final: {self.final_cells:,} celdas)"]
+        lines.append("")
+        lines.append(f"{'estado':30} {'pasos':>12} {'%':>7}")
+        for name, n, share in self.hot_states(limit):
+            lines.append(f"{name:30} {n:>12,} {share:>7.1%}")
+        lines.append("")
+        lines.append(f"{'transición':50} {'veces':>12} {'%':>7}")
+        for label, n, share in self.hot_transitions(limit):
+            lines.append(f"{label:50} {n:>12,} {share:>7.1%}")
+        if self.truncated:
+            lines.append(f"\n(línea de tiempo truncada tras {self.max_segments:,} tramos)")
+        return '\n'.join(lines)
+
+    def _segments(self):
+        """(estado, inicio, duración, celdas) de cada tramo de la línea de tiempo."""
+        n = len(self.seg_state)
+        for i in range(n):
+            start = self.seg_start[i]
+            end = self.seg_start[i + 1] if i + 1 < n else self.end_step
+            if end > start:
+                yield self.state_names[self.seg_state[i]], start, end - start, self.seg_cells[i]
+
+    def to_chrome_trace(self) -> Dict:
+        """Formato Trace Event de Chrome (chrome://tracing, Perfetto)."""
+        name = self.machine or 'MT'
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': name}},
+                  {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': 'estado'}}]
+        for state, start, length, cells in self._segments():
+            events.append({'name': state, 'cat': 'estado', 'ph': 'X', 'ts': start, 'dur': length,
+                           'pid': 1, 'tid': 1})
+            events.append({'name': 'cinta', 'ph': 'C', 'ts': start, 'pid': 1, 'args': {'celdas': cells}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ns',
+                'otherData': {'unidad': '1 µs = 1 paso', 'motor': self.engine}}
+
+    def to_speedscope(self) -> Dict:
+        """Perfil "evented" de speedscope (https://www.speedscope.app), eje en pasos."""
+        frames = [{'name': name} for name in self.state_names]
+        events = []
+        for state, start, length, _ in self._segments():
+            frame = self.state_ids[state]
+            events.append({'type': 'O', 'frame': frame, 'at': start})
+            events.append({'type': 'C', 'frame': frame, 'at': start + length})
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': self.machine or 'MT',
+            'exporter': 'PRY3-TC profiler',
+            'shared': {'frames': frames},
+            'profiles': [{'type': 'evented', 'name': 'estados', 'unit': 'none',
+                          'startValue': self.start_step, 'endValue': self.end_step, 'events': events}],
+        }
+
+    def save(self, path: str, fmt: str = 'chrome') -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato de perfil desconocido: {fmt} (use {', '.join(FORMATS)})")
+        data = self.to_chrome_trace() if fmt == 'chrome' else self.to_speedscope()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
@@ -0,0 +1,299 @@
+"""tape.py
+
+Cinta bi-infinita para el simulador universal.
+
+La cinta se guarda en dos arreglos alrededor de un origen:
+- ``right``: posiciones 0, 1, 2, ...
+- ``left``:  posiciones -1, -2, -3, ... (``left[i]`` es la posición ``-i - 1``)
+
+Crecer hacia cualquiera de los dos lados es un ``append`` (O(1) amortizado),
+en lugar de insertar al inicio de una lista (O(longitud)). Las posiciones son
+absolutas respecto al origen y pueden ser negativas; el índice "clásico" de una
+celda (0 = celda más a la izquierda ya visitada) es ``pos - lo``.
+
+Las celdas son códigos de símbolo (enteros 0..255) en ``bytearray``: un byte por
+celda en lugar de un puntero de 8 bytes a ``str``. ``symbols[c]`` decodifica el
+código ``c``; el código 0 es siempre el blanco, así que ampliar la cinta es
+agregar bytes en cero. Los caracteres de entrada que no están en el alfabeto
+comparten el código ``foreign`` (``len(symbols)``) y su texto original se guarda
+aparte en ``foreign_cells``: ninguna transición los lee, así que la máquina se
+detiene sobre ellos y nunca los sobrescribe. Solo se decodifica en los bordes
+de la API (``read``, ``contents``, ``to_list``).
+
+Además se mantienen cotas de las celdas no blancas (``nb_lo``/``nb_hi``): solo se
+amplían al escribir un símbolo no blanco y se recortan de forma perezosa en
+``bounds()``. Cada celda recortada solo vuelve a quedar dentro de las cotas con
+una nueva escritura, así que el recorte es O(1) amortizado por escritura y
+extraer la salida cuesta O(salida) en lugar de O(cinta).
+"""
+
+from __future__ import annotations
+import sys
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Cotas de "cinta sin símbolos": cualquier escritura no blanca las reemplaza.
+EMPTY_LO = sys.maxsize
+EMPTY_HI = -sys.maxsize
+
+# Código del blanco en toda cinta.
+BLANK = 0
+
+# Ventana inicial de los recorridos por franjas de scan(); se duplica en cada vuelta.
+_SCAN_WINDOW = 64
+
+
+def _run_forward(buf: bytearray, i: int, end: int, chars: bytes) -> int:
+    """Cantidad de bytes consecutivos de ``chars`` en buf[i], buf[i+1], ... (< end)."""
+    k = 0
+    w = _SCAN_WINDOW
+    while i < end:
+        j = min(end, i + w)
+        chunk = buf[i:j]
+        n = len(chunk) - len(chunk.lstrip(chars))
+        k += n
+        if n < j - i:
+            break
+        i = j
+        w *= 2
+    return k
+
+
+def _run_backward(buf: bytearray, i: int, stop: int, chars: bytes) -> int:
+    """Cantidad de bytes consecutivos de ``chars`` en buf[i], buf[i-1], ... (>= stop)."""
+    k = 0
+    w = _SCAN_WINDOW
+    while i >= stop:
+        j = max(stop, i - w + 1)
+        chunk = buf[j:i + 1]
+        n = len(chunk) - len(chunk.rstrip(chars))
+        k += n
+        if n < i + 1 - j:
+            break
+        i = j - 1
+        w *= 2
+    return k
+
+
+class Tape:
+    __slots__ = ('symbols', 'codes', 'foreign', 'foreign_cells', 'left', 'right', 'nb_lo', 'nb_hi')
+
+    def __init__(self, symbols: Sequence[str] = ('_',), cells: Iterable[str] = (),
+                 codes: Optional[Dict[str, int]] = None):
+        if len(symbols) > 255:
+            raise ValueError("La cinta admite como máximo 255 símbolos distintos")
+        self.foreign = len(symbols)
+        # Tabla de decodificación: el código foreign se resuelve con foreign_cells.
+        self.symbols: List[str] = list(symbols) + [''] * (256 - len(symbols))
+        self.codes: Dict[str, int] = codes if codes is not None else {s: i for i, s in enumerate(symbols)}
+        self.foreign_cells: Dict[int, str] = {}
+        if not isinstance(cells, (str, list, tuple)):
+            cells = list(cells)
+        self.right = bytearray(map(self.codes.get, cells, repeat(self.foreign)))
+        if self.foreign in self.right:
+            self.foreign_cells = {i: sym for i, sym in enumerate(cells) if sym not in self.codes}
+        if not self.right:
+            self.right.append(BLANK)
+        self.left = bytearray()
+        self.nb_lo = EMPTY_LO
+        self.nb_hi = EMPTY_HI
+        stripped = self.right.lstrip(b'\0')
+        if stripped:
+            self.nb_lo = len(self.right) - len(stripped)
+            self.nb_hi = len(self.right.rstrip(b'\0')) - 1
+
+    @classmethod
+    def from_codes(cls, symbols: Sequence[str], origin: int, cells: bytes,
+                   foreign_cells: Optional[Dict[int, str]] = None,
+                   codes: Optional[Dict[str, int]] = None) -> 'Tape':
+        """Reconstruye una cinta a partir de sus códigos (p. ej. de un checkpoint):
+        la celda ``j`` de ``cells`` queda en la posición ``origin + j``."""
+        tape = cls(symbols, (), codes)
+        tape.ensure(origin)
+        tape.put(origin, cells)
+        tape.foreign_cells = dict(foreign_cells or {})
+        if cells.strip(b'\0'):
+            # Cotas holgadas: bounds() las recorta al consultarlas.
+            tape.nb_lo, tape.nb_hi = origin, origin + len(cells) - 1
+        return tape
+
+    @property
+    def blank(self) -> str:
+        return self.symbols[BLANK]
+
+    @property
+    def lo(self) -> int:
+        """Posición de la celda asignada más a la izquierda."""
+        return -len(self.left)
+
+    @property
+    def hi(self) -> int:
+        """Posición de la celda asignada más a la derecha."""
+        return len(self.right) - 1
+
+    def __len__(self) -> int:
+        return len(self.left) + len(self.right)
+
+    def ensure(self, pos: int) -> None:
+        """Asigna celdas en blanco hasta cubrir ``pos``."""
+        if pos >= 0:
+            missing = pos - len(self.right) + 1
+            if missing > 0:
+                self.right.extend(bytes(missing))
+        else:
+            missing = -pos - len(self.left)
+            if missing > 0:
+                self.left.extend(bytes(missing))
+
+    def code_at(self, pos: int) -> int:
+        if pos >= 0:
+            return self.right[pos] if pos < len(self.right) else BLANK
+        i = -pos - 1
+        return self.left[i] if i < len(self.left) else BLANK
+
+    def read(self, pos: int) -> str:
+        code = self.code_at(pos)
+        if code == self.foreign:
+            return self.foreign_cells[pos]
+        return self.symbols[code]
+
+    def write_code(self, pos: int, code: int) -> None:
+        self.ensure(pos)
+        if pos >= 0:
+            self.right[pos] = code
+        else:
+            self.left[-pos - 1] = code
+        if code != BLANK:
+            if pos < self.nb_lo:
+                self.nb_lo = pos
+            if pos > self.nb_hi:
+                self.nb_hi = pos
+
+    def write(self, pos: int, symbol: str) -> None:
+        code = self.codes.get(symbol)
+        if code is None:
+            code = self.foreign
+            self.foreign_cells[pos] = symbol
+        elif self.foreign_cells:
+            self.foreign_cells.pop(pos, None)
+        self.write_code(pos, code)
+
+    def scan(self, pos: int, direction: int, symbols: bytes, limit: int) -> int:
+        """Cuenta cuántas celdas consecutivas desde ``pos`` (en ``direction``)
+        contienen códigos de ``symbols``, hasta ``limit``.
+
+        Recorre franjas crecientes con ``lstrip``/``rstrip`` (en C) en lugar de
+        celda por celda. Si la racha llega al final de lo asignado y el blanco
+        pertenece a ``symbols``, el resto de la cinta también coincide y se
+        devuelve ``limit``.
+        """
+        left, right = self.left, self.right
+        k = 0
+        if direction > 0:
+            if pos < 0:
+                i = -pos - 1
+                k = _run_backward(left, i, max(0, i - limit + 1), symbols)
+                if k <= i or k == limit:
+                    return k
+                pos = 0
+            n = _run_forward(right, pos, min(len(right), pos + limit - k), symbols)
+            k += n
+            if pos + n == len(right) and k < limit and BLANK in symbols:
+                k = limit
+            return k
+        if pos >= 0:
+            i = min(pos, len(right) - 1)
+            k = _run_backward(right, i, max(0, i - limit + 1), symbols)
+            if k <= i or k == limit:
+                return k
+            pos = -1
+        i = -pos - 1
+        n = _run_forward(left, i, min(len(left), i + limit - k), symbols)
+        k += n
+        if i + n == len(left) and k < limit and BLANK in symbols:
+            k = limit
+        return k
+
+    def match_run(self, pos: int, direction: int, expected: bytes, limit: int) -> int:
+        """Longitud del prefijo de ``expected`` que coincide con la cinta leída
+        desde ``pos`` en ``direction`` (como máximo ``limit`` celdas)."""
+        k = min(len(expected), limit)
+        if k <= 0:
+            return 0
+        if direction > 0:
+            cells = self.segment(pos, pos + k - 1)
+        else:
+            cells = self.segment(pos - k + 1, pos)[::-1]
+        if cells == expected[:k]:
+            return k
+        m = 0
+        while cells[m] == expected[m]:
+            m += 1
+        return m
+
+    def put(self, start: int, cells: bytes) -> None:
+        """Escribe los códigos ``cells`` desde ``start`` hacia la derecha con
+        asignación por franjas. No actualiza las cotas no blancas (queda a cargo
+        del llamador) y no debe cubrir celdas foreign."""
+        if not cells:
+            return
+        end = start + len(cells) - 1
+        self.ensure(start)
+        self.ensure(end)
+        b = min(end, -1)
+        if start <= b:
+            # Posiciones b..start (descendente) son left[-b-1 .. -start-1].
+            self.left[-b - 1:-start] = cells[b - start::-1]
+        a = max(start, 0)
+        if a <= end:
+            self.right[a:end + 1] = cells[a - start:]
+
+    def bounds(self) -> Optional[Tuple[int, int]]:
+        """Posiciones (inclusive) del primer y último símbolo no blanco, o None."""
+        lo, hi = self.nb_lo, self.nb_hi
+        while lo <= hi and self.code_at(lo) == BLANK:
+            lo += 1
+        while hi >= lo and self.code_at(hi) == BLANK:
+            hi -= 1
+        if lo > hi:
+            self.nb_lo, self.nb_hi = EMPTY_LO, EMPTY_HI
+            return None
+        self.nb_lo, self.nb_hi = lo, hi
+        return lo, hi
+
+    def contents(self) -> str:
+        """Símbolos entre el primer y el último no blanco (inclusive)."""
+        b = self.bounds()
+        if b is None:
+            return ''
+        return ''.join(self.decode(b[0], b[1]))
+
+    def segment(self, start: int, end: int) -> bytes:
+        """Códigos de ``start`` a ``end`` (inclusive), con blancos fuera de lo asignado."""
+        if start > end:
+            return b''
+        lo, hi = self.lo, self.hi
+        cells = bytearray()
+        if start < lo:
+            cells += bytes(min(end, lo - 1) - start + 1)
+        a, b = max(start, lo), min(end, -1)
+        if a <= b:
+            cells += self.left[-b - 1:-a][::-1]
+        a, b = max(start, 0), min(end, hi)
+        if a <= b:
+            cells += self.right[a:b + 1]
+        if end > hi:
+            cells += bytes(end - max(start, hi + 1) + 1)
+        return bytes(cells)
+
+    def decode(self, start: int, end: int) -> List[str]:
+        """Símbolos de ``start`` a ``end`` (inclusive) como cadenas."""
+        cells = list(map(self.symbols.__getitem__, self.segment(start, end)))
+        for pos, sym in self.foreign_cells.items():
+            if start <= pos <= end and self.code_at(pos) == self.foreign:
+                cells[pos - start] = sym
+        return cells
+
+    def to_list(self) -> List[str]:
+        """Celdas asignadas de izquierda a derecha (copia decodificada)."""
+        return self.decode(self.lo, self.hi)
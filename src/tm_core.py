@@ -0,0 +1,482 @@
+"""tm_core.py
+
+Núcleo de ejecución compartido por los dos simuladores.
+
+``turing_simulator.TuringMachine`` (una cinta, cinta bi-infinita) y
+``turing_machine.TuringMachine`` (una o varias cintas, cabezal que no pasa de
+la celda 0) son adaptadores sobre este módulo: cargan la definición, exponen su
+API y delegan en él los bucles de ejecución. Cada optimización se hace una vez:
+
+- ``run_single``: bucle de una cinta bi-infinita sobre la tabla densa de
+  ``CompiledMachine`` (ids enteros, celdas en ``bytearray``).
+- ``run_clamped``: la misma tabla, reorganizada por estado
+  (``linked_rows``), con el cabezal detenido en la celda 0 (semántica del
+  simulador multi-cinta).
+- ``run_accelerated``: como ``run_single`` pero salta barridos y cadenas
+  fusionadas en bloque (solo cinta bi-infinita, ver compiled_machine.py).
+- ``MultiTapeProgram`` / ``run_multi``: tabla y bucle de varias cintas.
+- ``run_single_detect`` / ``run_multi_detect``: los bucles paso a paso con
+  detección de ciclos (ver loop_detector.py).
+
+Las funciones reciben y devuelven la configuración (cabezal, id de estado,
+pasos ejecutados); lo que cada API hace alrededor (cuándo se comprueba la
+aceptación, ``halted``, grabación, observadores) queda en los adaptadores.
+Cada bucle se detiene al llegar a un estado de aceptación, al no haber
+transición o al agotar ``max_steps`` (menos pasos que ``max_steps`` en un
+estado que no acepta: no hubo transición).
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from compiled_machine import CompiledMachine, MOVE_DELTA  # type: ignore
+    from tape import Tape, EMPTY_LO, EMPTY_HI  # type: ignore
+    from loop_detector import LoopDetector  # type: ignore
+except ImportError:  # importado como paquete (src.tm_core)
+    from .compiled_machine import CompiledMachine, MOVE_DELTA
+    from .tape import Tape, EMPTY_LO, EMPTY_HI
+    from .loop_detector import LoopDetector
+
+def run_single(cm: CompiledMachine, left: bytearray, right: bytearray, head: int, state: int,
+               max_steps: int, nb_lo: int = EMPTY_LO,
+               nb_hi: int = EMPTY_HI) -> Tuple[int, int, int, int, int]:
+    """Ejecuta hasta aceptar, quedar sin transición o dar ``max_steps`` pasos.
+
+    La cinta son ``right`` (posiciones 0, 1, ...) y ``left`` (-1, -2, ...),
+    como en ``tape.Tape``; la celda bajo ``head`` debe estar asignada.
+    ``nb_lo``/``nb_hi`` son las cotas de celdas no blancas, que se amplían con
+    cada escritura.
+
+    Devuelve ``(head, state, pasos, nb_lo, nb_hi)``.
+    """
+    table = cm.table
+    n_states = cm.n_states
+    accepting = cm.accepting
+    blank_id = cm.blank_id
+    steps = 0
+    while steps < max_steps and not accepting[state]:
+        entry = table[(right[head] if head >= 0 else left[~head]) * n_states + state]
+        if entry is None:
+            break
+        state, write_id, delta, _ = entry
+        if head >= 0:
+            right[head] = write_id
+        else:
+            left[~head] = write_id
+        if write_id != blank_id:
+            if head < nb_lo:
+                nb_lo = head
+            if head > nb_hi:
+                nb_hi = head
+        head += delta
+        if head >= len(right):
+            right.append(blank_id)
+        elif ~head >= len(left):
+            left.append(blank_id)
+        steps += 1
+    return head, state, steps, nb_lo, nb_hi
+
+
+def linked_rows(cm: CompiledMachine) -> List[List[Optional[Tuple[Any, ...]]]]:
+    """La tabla de ``cm`` reorganizada por estado para ``run_clamped``.
+
+    ``rows[id][símbolo]`` es ``(fila', escritura, delta, acepta', id')`` o
+    ``None``: cada entrada lleva la fila del estado siguiente, así un paso es
+    una sola indexación de lista, sin multiplicar ids ni consultar
+    ``accepting``.
+    """
+    n_states = cm.n_states
+    n_symbols = len(cm.table) // n_states if n_states else 0
+    rows: List[List[Optional[Tuple[Any, ...]]]] = [[None] * n_symbols for _ in range(n_states)]
+    for slot, entry in enumerate(cm.table):
+        if entry is not None:
+            sym, state = divmod(slot, n_states)
+            nxt, write_id, delta, _ = entry
+            rows[state][sym] = (rows[nxt], write_id, delta, cm.accepting[nxt], nxt)
+    return rows
+
+
+def run_clamped(rows: List[List[Optional[Tuple[Any, ...]]]], accepting: Sequence[bool], tape: bytearray,
+                head: int, state: int, max_steps: int) -> Tuple[int, int, int]:
+    """Como ``run_single`` sobre una cinta que empieza en la celda 0: un
+    movimiento a la izquierda desde ella no mueve el cabezal. ``rows`` viene de
+    ``linked_rows``. ``tape`` crece al doble al quedarse corta; no se llevan
+    cotas de celdas no blancas.
+
+    Devuelve ``(head, state, pasos)``.
+    """
+    steps = 0
+    if accepting[state]:
+        return head, state, steps
+    row = rows[state]
+    size = len(tape)
+    while steps < max_steps:
+        entry = row[tape[head]]
+        if entry is None:
+            break
+        row, tape[head], delta, accept, state = entry
+        if delta:
+            head += delta
+            if head < 0:
+                head = 0
+            elif head >= size:
+                # Crecimiento geométrico: O(1) amortizado por paso
+                tape.extend(bytes(size))
+                size += size
+        steps += 1
+        if accept:
+            break
+    return head, state, steps
+
+
+def run_accelerated(cm: CompiledMachine, tape: Tape, head: int, state: int,
+                    max_steps: int) -> Tuple[int, int, int]:
+    """Como ``run_single`` (cinta bi-infinita), pero cada barrido avanza toda la
+    racha de una vez y cada cadena fusionada se aplica como un bloque.
+
+    Actualiza las cotas no blancas de ``tape``; devuelve ``(head, state, pasos)``.
+    """
+    table = cm.table
+    sweep = cm.sweep
+    sweep_symbols = cm.sweep_symbols
+    chains = cm.chains
+    n_states = cm.n_states
+    accepting = cm.accepting
+    blank_id = cm.blank_id
+    tape.ensure(head)
+    left = tape.left
+    right = tape.right
+    nb_lo = tape.nb_lo
+    nb_hi = tape.nb_hi
+    steps = 0
+    while steps < max_steps and not accepting[state]:
+        slot = (right[head] if head >= 0 else left[~head]) * n_states + state
+        direction = sweep[slot]
+        if direction:
+            # Barrido: sin escrituras ni cambio de estado, solo avanza el cabezal.
+            k = tape.scan(head, direction, sweep_symbols[state][direction > 0], max_steps - steps)
+            head += direction * k
+            steps += k
+            tape.ensure(head)
+            continue
+        chain = chains[slot]
+        if chain is not None:
+            d = chain.direction
+            m = tape.match_run(head, d, chain.reads, max_steps - steps)
+            if m:
+                if d > 0:
+                    tape.put(head, chain.writes[:m])
+                else:
+                    tape.put(head - m + 1, chain.writes[m - 1::-1])
+                first = chain.first_nb
+                if 0 <= first < m:
+                    a = head + d * first
+                    b = head + d * chain.last_nb[m]
+                    if min(a, b) < nb_lo:
+                        nb_lo = min(a, b)
+                    if max(a, b) > nb_hi:
+                        nb_hi = max(a, b)
+                state = chain.states[m - 1]
+                if m == len(chain):
+                    head += d * (m - 1) + chain.last_delta
+                else:
+                    head += d * m
+                steps += m
+                tape.ensure(head)
+                continue
+        entry = table[slot]
+        if entry is None:
+            break
+        state, write_id, delta, _ = entry
+        if head >= 0:
+            right[head] = write_id
+        else:
+            left[~head] = write_id
+        if write_id != blank_id:
+            if head < nb_lo:
+                nb_lo = head
+            if head > nb_hi:
+                nb_hi = head
+        head += delta
+        if head >= len(right):
+            right.append(blank_id)
+        elif ~head >= len(left):
+            left.append(blank_id)
+        steps += 1
+    tape.nb_lo = nb_lo
+    tape.nb_hi = nb_hi
+    return head, state, steps
+
+
+class MultiTapeProgram:
+    """Tabla de una máquina de ``num_tapes`` cintas para ``run_multi``.
+
+    ``transitions`` son ``(estado, lecturas, estado', escrituras, movimientos)``
+    con códigos de símbolo (bytes, uno por cinta) y movimientos 'L'/'R'/otro;
+    si un par (estado, lecturas) se repite, gana el primero.
+
+    ``rows[id]`` es el diccionario de transiciones del estado ``id`` indexado
+    por los códigos leídos. Cada entrada lleva el diccionario del estado
+    siguiente para no volver a indexar ``rows`` en cada paso:
+    ``(fila', escrituras, movimientos, acepta', id')``; las escrituras son solo
+    los pares (cinta, código) que difieren de lo leído y los movimientos los
+    pares (cinta, delta) con delta != 0, así cada paso toca únicamente las
+    cintas que cambian.
+    """
+
+    def __init__(self, num_tapes: int, transitions: Sequence[Tuple[str, bytes, str, bytes, Sequence[str]]],
+                 accept_states: Sequence[str], states: Sequence[str] = ()):
+        self.num_tapes = num_tapes
+        self.state_ids: Dict[str, int] = {}
+        for name in states:
+            self.state_ids.setdefault(name, len(self.state_ids))
+        for state, _, next_state, _, _ in transitions:
+            self.state_ids.setdefault(state, len(self.state_ids))
+            self.state_ids.setdefault(next_state, len(self.state_ids))
+        self.state_names: List[str] = list(self.state_ids)
+        accept = set(accept_states)
+        self.accepting: List[bool] = [name in accept for name in self.state_names]
+        self.rows: List[Dict[bytes, Tuple[Any, ...]]] = [{} for _ in self.state_names]
+        for state, read, next_state, write, moves in transitions:
+            if len(read) != num_tapes:
+                continue  # nunca coincide con lo leído de num_tapes cintas
+            row = self.rows[self.state_ids[state]]
+            if read in row:
+                continue
+            nxt = self.state_ids[next_state]
+            writes = tuple((i, w) for i, (r, w) in enumerate(zip(read, write)) if r != w)
+            deltas = tuple((i, d) for i, d in enumerate(MOVE_DELTA.get(m, 0) for m in moves) if d)
+            row[read] = (self.rows[nxt], writes, deltas, self.accepting[nxt], nxt)
+
+
+def run_multi(program: MultiTapeProgram, tapes: List[bytearray], heads: List[int], state: int,
+              max_steps: int) -> Tuple[int, int]:
+    """Ejecuta una máquina multi-cinta hasta aceptar, quedar sin transición o dar
+    ``max_steps`` pasos. Las celdas bajo ``heads`` deben estar asignadas; las
+    cintas crecen al doble al quedarse cortas y los cabezales no pasan de la
+    celda 0.
+
+    Modifica ``tapes`` y ``heads``; devuelve ``(state, pasos)``.
+    """
+    row = program.rows[state]
+    steps = 0
+    if program.accepting[state]:
+        return state, steps
+    # Símbolos bajo los cabezales; solo se actualizan las cintas que cambian
+    reads = bytearray(tape[head] for tape, head in zip(tapes, heads))
+    while steps < max_steps:
+        entry = row.get(bytes(reads))
+        if entry is None:
+            break
+        row, writes, moves, accept, state = entry
+        for i, code in writes:
+            tapes[i][heads[i]] = code
+            reads[i] = code
+        for i, delta in moves:
+            tape = tapes[i]
+            pos = heads[i] + delta
+            if pos < 0:
+                pos = 0
+            elif pos >= len(tape):
+                tape.extend(bytes(len(tape)))
+            heads[i] = pos
+            reads[i] = tape[pos]
+        steps += 1
+        if accept:
+            break
+    return state, steps
+
+
+def _single_cells(tape: Tape) -> Tuple[int, bytes]:
+    """(posición de la primera celda no blanca, celdas hasta la última no blanca)."""
+    cells = bytes(tape.left[::-1]) + bytes(tape.right)
+    trimmed = cells.lstrip(b'\0')
+    return len(cells) - len(trimmed) - len(tape.left), trimmed.rstrip(b'\0')
+
+
+def run_single_detect(cm: CompiledMachine, tape: Tape, head: int, state: int, max_steps: int,
+                      detector: LoopDetector, first_step: int = 0) -> Tuple[int, int, int]:
+    """Como ``run_single`` sobre ``tape`` (bi-infinita), deteniéndose también si
+    la configuración se repite; en ese caso llama ``detector.found``.
+    ``first_step`` es el número del primer paso (para ``cycle_start``).
+
+    Devuelve ``(head, state, pasos)``.
+    """
+    table = cm.table
+    n_states = cm.n_states
+    accepting = cm.accepting
+    blank_id = cm.blank_id
+    tape.ensure(head)
+    left = tape.left
+    right = tape.right
+    nb_lo = tape.nb_lo
+    nb_hi = tape.nb_hi
+    # Hash de la cinta: XOR de hash((posición, código)) de las celdas no blancas
+    cells_hash = 0
+    for pos, code in enumerate(right):
+        if code != blank_id:
+            cells_hash ^= hash((pos, code))
+    for i, code in enumerate(left):
+        if code != blank_id:
+            cells_hash ^= hash((~i, code))
+    # Brent: configuración guardada en el paso saved_step, comparada en cada paso
+    saved = (state, head, cells_hash)
+    snapshot = _single_cells(tape)
+    detector.snapshots += 1
+    saved_step = 0
+    power = 1
+    # Excursión actual sobre blancos fuera de [nb_lo, nb_hi]: estado -> (cabezal, paso)
+    excursion: Dict[int, Tuple[int, int]] = {}
+    steps = 0
+    while steps < max_steps and not accepting[state]:
+        old = right[head] if head >= 0 else left[~head]
+        entry = table[old * n_states + state]
+        if entry is None:
+            break
+        nxt, write_id, delta, _ = entry
+        if old == blank_id and write_id == blank_id and (head < nb_lo or head > nb_hi):
+            seen = excursion.get(state)
+            if seen is not None:
+                before, step0 = seen
+                if head == before or (head < before and head < nb_lo) or (head > before and head > nb_hi):
+                    detector.found(first_step + step0, steps - step0, (head - before,))
+                    break
+            excursion[state] = (head, steps)
+        elif excursion:
+            excursion = {}
+        state = nxt
+        if write_id != old:
+            if head >= 0:
+                right[head] = write_id
+            else:
+                left[~head] = write_id
+            if old != blank_id:
+                cells_hash ^= hash((head, old))
+            if write_id != blank_id:
+                cells_hash ^= hash((head, write_id))
+                if head < nb_lo:
+                    nb_lo = head
+                if head > nb_hi:
+                    nb_hi = head
+        head += delta
+        if head >= len(right):
+            right.append(blank_id)
+        elif ~head >= len(left):
+            left.append(blank_id)
+        steps += 1
+        if cells_hash == saved[2] and head == saved[1] and state == saved[0]:
+            if _single_cells(tape) == snapshot:
+                detector.found(first_step + saved_step, steps - saved_step, (0,))
+                break
+            detector.collisions += 1
+        if steps - saved_step == power:
+            saved = (state, head, cells_hash)
+            snapshot = _single_cells(tape)
+            detector.snapshots += 1
+            saved_step = steps
+            power += power
+    tape.nb_lo = nb_lo
+    tape.nb_hi = nb_hi
+    return head, state, steps
+
+
+def _multi_cells(tapes: List[bytearray]) -> Tuple[bytes, ...]:
+    return tuple(bytes(tape).rstrip(b'\0') for tape in tapes)
+
+
+def run_multi_detect(program: MultiTapeProgram, tapes: List[bytearray], heads: List[int], state: int,
+                     max_steps: int, detector: LoopDetector, first_step: int = 0) -> Tuple[int, int]:
+    """Como ``run_multi``, deteniéndose también si la configuración se repite;
+    en ese caso llama ``detector.found``. ``first_step`` es el número del
+    primer paso (para ``cycle_start``).
+
+    Devuelve ``(state, pasos)``.
+    """
+    row = program.rows[state]
+    steps = 0
+    if program.accepting[state]:
+        return state, steps
+    reads = bytearray(tape[head] for tape, head in zip(tapes, heads))
+    # Hash de las cintas: XOR de hash((cinta, posición, código)) de las celdas no blancas
+    cells_hash = 0
+    for i, tape in enumerate(tapes):
+        for pos, code in enumerate(tape):
+            if code:
+                cells_hash ^= hash((i, pos, code))
+    saved = (state, list(heads), cells_hash)
+    snapshot = _multi_cells(tapes)
+    detector.snapshots += 1
+    saved_step = 0
+    power = 1
+    # Última celda no blanca de cada cinta (cota: no baja al borrar) y excursión
+    # actual con todos los cabezales sobre blancos a su derecha: estado -> (cabezales, paso)
+    hi = [len(tape.rstrip(b'\0')) - 1 for tape in tapes]
+    excursion: Dict[int, Tuple[List[int], int]] = {}
+    while steps < max_steps:
+        entry = row.get(bytes(reads))
+        if entry is None:
+            break
+        if not entry[1] and not any(reads) and all(map(int.__gt__, heads, hi)):
+            seen = excursion.get(state)
+            if seen is not None:
+                before, step0 = seen
+                if all(map(int.__ge__, heads, before)):
+                    detector.found(first_step + step0, steps - step0, tuple(map(int.__sub__, heads, before)))
+                    break
+            excursion[state] = (list(heads), steps)
+        elif excursion:
+            excursion = {}
+        row, writes, moves, accept, state = entry
+        for i, code in writes:
+            pos = heads[i]
+            old = reads[i]
+            if old:
+                cells_hash ^= hash((i, pos, old))
+            if code:
+                cells_hash ^= hash((i, pos, code))
+                if pos > hi[i]:
+                    hi[i] = pos
+            tapes[i][pos] = code
+            reads[i] = code
+        for i, delta in moves:
+            tape = tapes[i]
+            pos = heads[i] + delta
+            if pos < 0:
+                # Tope en la celda 0: el recorrido ya no se repite desplazado
+                pos = 0
+                if excursion:
+                    excursion = {}
+            elif pos >= len(tape):
+                tape.extend(bytes(len(tape)))
+            heads[i] = pos
+            reads[i] = tape[pos]
+        steps += 1
+        if accept:
+            break
+        if cells_hash == saved[2] and state == saved[0] and heads == saved[1]:
+            if _multi_cells(tapes) == snapshot:
+                detector.found(first_step + saved_step, steps - saved_step, (0,) * len(tapes))
+                break
+            detector.collisions += 1
+        if steps - saved_step == power:
+            saved = (state, list(heads), cells_hash)
+            snapshot = _multi_cells(tapes)
+            detector.snapshots += 1
+            saved_step = steps
+            power += power
+    return state, steps
+
+
+def compile_single(transitions: Sequence[Tuple[str, str, str, str, str]], states: Sequence[str],
+                   tape_alphabet: Sequence[str], initial_state: Optional[str],
+                   accept_states: Sequence[str], blank_symbol: str) -> CompiledMachine:
+    """``CompiledMachine`` a partir de transiciones ``(estado, lee, estado', escribe, mov)``."""
+    return CompiledMachine({
+        'states': list(states),
+        'tape_alphabet': list(tape_alphabet),
+        'initial_state': initial_state,
+        'accept_states': list(accept_states),
+        'blank_symbol': blank_symbol,
+        'transitions': [{'current_state': q, 'read_symbol': r, 'next_state': p, 'write_symbol': w, 'move': m}
+                        for q, r, p, w, m in transitions],
+    })
@@ -0,0 +1,157 @@
+"""trace_recorder.py
+
+Registro estructurado de ejecuciones de MT, sin pasar por texto.
+
+Se asigna a ``tm.recorder`` en cualquiera de los dos simuladores
+(``turing_simulator`` o ``turing_machine``). Desde la configuración inicial
+(``initialize_tape``/``run``/``restore``), cada paso agrega un registro compacto
+en arreglos (``array``), uno por campo y por cinta:
+
+- ``state``: id del estado al que pasa la máquina (``state_names`` lo decodifica)
+- ``head``: posición donde se leyó y escribió
+- ``read`` / ``write``: códigos del símbolo anterior y del escrito
+- ``move``: desplazamiento real del cabezal (-1, 0, 1)
+
+Son ~15 bytes por paso y cinta, contra una línea formateada por paso (más un
+volcado de cinta cada 25) del modo debug. La cinta completa de cualquier paso
+se reconstruye reproduciendo las escrituras sobre la cinta inicial
+(``tape_at``).
+
+Uso:
+    tm.recorder = TraceRecorder()
+    tm.run('||+|||')
+    tm.recorder.step(3)          # TraceStep(index=3, state='q1', ...)
+    tm.recorder.tape_at(3)       # (origen, ['|', '|', ...])
+"""
+from __future__ import annotations
+from array import array
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+TraceStep = namedtuple('TraceStep', ['index', 'state', 'heads', 'reads', 'writes', 'moves'])
+TraceStep.__doc__ = """Paso ``index`` decodificado: estado resultante y, por cinta, posición,
+símbolo leído, símbolo escrito y desplazamiento."""
+
+
+class TraceRecorder:
+    def __init__(self):
+        self.output: Optional[str] = None  # salida de la ejecución, si se conoce
+        self.num_tapes = 1
+        self.symbols: List[str] = []
+        self.state_names: List[str] = []
+        self.state_ids: Dict[str, int] = {}
+        self.initial_state: Optional[str] = None
+        self.initial_tapes: List[Tuple[int, bytes]] = []
+        self.initial_heads: List[int] = []
+        self.foreign: Dict[int, str] = {}
+        self._reset_arrays()
+
+    def _reset_arrays(self) -> None:
+        self.state = array('i')
+        self.head = array('q')
+        self.read = array('B')
+        self.write = array('B')
+        self.move = array('b')
+
+    def start(self, symbols: Sequence[str], state_names: Sequence[str], initial_state: Optional[str],
+              tapes: List[Tuple[int, bytes]], heads: List[int],
+              foreign: Optional[Dict[int, str]] = None) -> None:
+        """Descarta lo grabado y fija la configuración inicial.
+
+        ``tapes[i]`` es ``(origen, códigos)`` de la cinta i; ``heads`` son
+        posiciones absolutas. ``state_names`` puede crecer con ``state_id``.
+        """
+        self.num_tapes = len(tapes)
+        self.symbols = list(symbols)
+        self.state_names = list(state_names)
+        self.state_ids = {name: i for i, name in enumerate(self.state_names)}
+        self.initial_state = initial_state
+        self.initial_tapes = [(origin, bytes(cells)) for origin, cells in tapes]
+        self.initial_heads = list(heads)
+        self.foreign = dict(foreign or {})
+        self.output = None
+        self._reset_arrays()
+
+    def state_id(self, name: str) -> int:
+        sid = self.state_ids.get(name)
+        if sid is None:
+            sid = len(self.state_names)
+            self.state_names.append(name)
+            self.state_ids[name] = sid
+        return sid
+
+    def record(self, state_id: int, head: int, read: int, write: int, move: int) -> None:
+        """Agrega un paso de una máquina de una cinta."""
+        self.state.append(state_id)
+        self.head.append(head)
+        self.read.append(read)
+        self.write.append(write)
+        self.move.append(move)
+
+    def record_multi(self, state_id: int, heads: Sequence[int], reads: bytes, writes: bytes,
+                     moves: Sequence[int]) -> None:
+        """Agrega un paso multi-cinta (un valor por cinta en cada campo)."""
+        self.state.append(state_id)
+        self.head.extend(heads)
+        self.read.extend(reads)
+        self.write.extend(writes)
+        self.move.extend(moves)
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    def state_at(self, k: int) -> Optional[str]:
+        """Estado tras ``k`` pasos (``k == 0``: estado inicial)."""
+        if k == 0:
+            return self.initial_state
+        return self.state_names[self.state[k - 1]]
+
+    def heads_at(self, k: int) -> List[int]:
+        """Posición de cada cabezal tras ``k`` pasos."""
+        if k == 0:
+            return list(self.initial_heads)
+        n = self.num_tapes
+        base = (k - 1) * n
+        return [self.head[base + i] + self.move[base + i] for i in range(n)]
+
+    def step(self, index: int) -> TraceStep:
+        """Registro decodificado del paso ``index`` (0 = primer paso)."""
+        if not 0 <= index < len(self.state):
+            raise IndexError(index)
+        n = self.num_tapes
+        a, b = index * n, (index + 1) * n
+        symbols = self.symbols
+        return TraceStep(index, self.state_names[self.state[index]], list(self.head[a:b]),
+                         [self._symbol(self.read[i], self.head[i], i % n) for i in range(a, b)],
+                         [symbols[c] for c in self.write[a:b]], list(self.move[a:b]))
+
+    def _symbol(self, code: int, pos: int, tape_idx: int) -> str:
+        if code < len(self.symbols):
+            return self.symbols[code]
+        return self.foreign.get(pos, '?') if tape_idx == 0 else '?'
+
+    def tape_at(self, k: int, tape_idx: int = 0) -> Tuple[int, List[str]]:
+        """Cinta ``tape_idx`` tras ``k`` pasos, reproduciendo las escrituras.
+
+        Devuelve ``(origen, celdas)``: la celda ``j`` está en la posición
+        ``origen + j``. Cubre la cinta inicial y todas las posiciones visitadas.
+        """
+        if not 0 <= k <= len(self.state):
+            raise IndexError(k)
+        origin, initial = self.initial_tapes[tape_idx]
+        n = self.num_tapes
+        heads = self.head[tape_idx:k * n:n]
+        visited = list(heads) + [self.heads_at(k)[tape_idx], self.initial_heads[tape_idx]]
+        lo = min([origin] + visited)
+        hi = max([origin + len(initial) - 1] + visited)
+        cells = bytearray(hi - lo + 1)
+        cells[origin - lo:origin - lo + len(initial)] = initial
+        writes = self.write[tape_idx:k * n:n]
+        for pos, code in zip(heads, writes):
+            cells[pos - lo] = code
+        out = [self.symbols[c] if c < len(self.symbols) else '' for c in cells]
+        if tape_idx == 0:
+            for pos, sym in self.foreign.items():
+                if lo <= pos <= hi and cells[pos - lo] >= len(self.symbols):
+                    out[pos - lo] = sym
+        return lo, out
@@ -32,13 +32,52 @@ Formato JSON multi-cinta (ejemplo 2 cintas):
     ]
 }
 
+Representación interna: cada símbolo recibe un código de un byte (el blanco es
+0) y cada cinta es un ``bytearray``; las transiciones se indexan por códigos.
+``tapes`` es una vista decodificada (lista de listas de str) que se construye
+al leerla; ``tape_window`` decodifica solo un tramo.
+
+``run``/``resume`` sin debug, grabación ni perfil usan ``_run_fast``, que
+delega en el núcleo compartido ``tm_core`` (el mismo del simulador de una
+cinta): con una cinta, la tabla densa de ``CompiledMachine`` con el cabezal
+detenido en la celda 0; con varias, una tabla por estado que por transición
+solo toca las cintas que cambian. ``step()`` conserva el camino general.
+
+Con ``loop_detector`` (ver loop_detector.py), ``_run_fast`` se detiene además
+si la configuración se repite: la MT no iba a detenerse.
+
+Debug, grabación (``recorder``) y cualquier otro seguimiento paso a paso son
+observadores (ver observers.py): ``add_observer``/``remove_observer``. Sin
+observadores, ``run`` no hace ninguna comprobación por paso.
+
 NOTA: El simulador es agnóstico al propósito de la máquina (cifrado César, aritmética, etc.).
 Toda la lógica reside en el JSON.
 """
 
 import json
+from itertools import repeat
 from typing import List, Dict, Tuple, Optional, Any
 
+try:
+    import tm_core  # type: ignore
+    from checkpoint import Checkpoint, definition_digest  # type: ignore
+    from trace_recorder import TraceRecorder  # type: ignore
+    from profiler import ExecutionProfiler  # type: ignore
+    from loop_detector import LoopDetector  # type: ignore
+    from observers import (ACCEPT, MAX_STEPS, NO_TRANSITION, DebugPrinter, ObserverSet,  # type: ignore
+                           RecorderObserver, StepEvent, StepObserver)
+except ImportError:  # importado como paquete (src.turing_machine)
+    from . import tm_core
+    from .checkpoint import Checkpoint, definition_digest
+    from .trace_recorder import TraceRecorder
+    from .profiler import ExecutionProfiler
+    from .loop_detector import LoopDetector
+    from .observers import (ACCEPT, MAX_STEPS, NO_TRANSITION, DebugPrinter, ObserverSet,
+                            RecorderObserver, StepEvent, StepObserver)
+
+# Desplazamiento del cabezal por movimiento ('N' u otro: 0).
+_MOVE_DELTA = {'R': 1, 'L': -1}
+
 
 class TuringMachine:
     """Simulador Universal de MT (una o múltiples cintas)."""
@@ -66,13 +105,27 @@ class TuringMachine:
         self.transitions: Dict[Any, Any] = {}
         if transitions:
             self._load_transitions(transitions)
+        self._compile()
         # Estado ejecución
-        self.tapes: List[List[str]] = []
+        self._tapes: List[bytearray] = []
+        # Por cinta: posición -> símbolo de las celdas fuera del alfabeto
+        self._foreign_cells: List[Dict[int, str]] = []
         self.head_positions: List[int] = []
         self.current_state: Optional[str] = initial_state
         self.step_count = 0
         self.halted = False
-        self.debug_mode = False
+        # Entrada de la ejecución en curso (run); None si se reanudó de un checkpoint
+        self.input_string: Optional[str] = None
+        # Observadores de la ejecución (debug, grabación, GUIs); ver observers.py
+        self._observers = ObserverSet()
+        self._recording: Optional[RecorderObserver] = None
+        # Ruta del JSON de origen, si se conoce (se anota en los checkpoints).
+        self.source: Optional[str] = None
+        # Si se asigna, run()/resume() cuentan visitas y transiciones (ver profiler.py).
+        self.profiler: Optional[ExecutionProfiler] = None
+        # Si se asigna, run()/resume() sin observadores se detienen al repetirse
+        # una configuración (ver loop_detector.py).
+        self.loop_detector: Optional[LoopDetector] = None
     
     def _load_transitions(self, transitions: List[Dict[str, Any]]):
         for trans in transitions:
@@ -86,82 +139,233 @@ class TuringMachine:
             else:
                 key = (state, trans["read_symbol"])
                 self.transitions[key] = (trans["next_state"], trans["write_symbol"], trans["move"])
+
+    def _compile(self):
+        """Asigna códigos a los símbolos y construye la tabla indexada por códigos."""
+        self._symbols: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._intern(self.blank_symbol)
+        for sym in self.tape_alphabet:
+            self._intern(sym)
+        # Una cinta: (estado, código) -> (estado', código escrito, delta)
+        # Multi-cinta: (estado, bytes leídos) -> (estado', bytes escritos, deltas)
+        self._table: Dict[Any, Any] = {}
+        # Misma clave -> movimientos declarados (para los observadores)
+        self._moves: Dict[Any, Tuple[str, ...]] = {}
+        for (state, read), (next_state, write, moves) in self.transitions.items():
+            if isinstance(read, tuple):
+                key = (state, bytes(self._intern(r) for r in read))
+                value = (next_state, bytes(self._intern(w) for w in write),
+                         tuple(_MOVE_DELTA.get(m, 0) for m in moves))
+                self._moves[key] = tuple(moves)
+            else:
+                key = (state, self._intern(read))
+                value = (next_state, self._intern(write), _MOVE_DELTA.get(moves, 0))
+                self._moves[key] = (moves,)
+            self._table[key] = value
+        # Código común de los símbolos fuera del alfabeto (ninguna transición lo
+        # lee); su texto se guarda aparte, en _foreign_cells, como en tape.Tape
+        self._foreign = len(self._symbols)
+        self._program = None
+
+    def _intern(self, symbol: str) -> int:
+        code = self._codes.get(symbol)
+        if code is None:
+            code = len(self._symbols)
+            if code > 255:
+                raise ValueError("La cinta admite como máximo 256 símbolos distintos")
+            self._symbols.append(symbol)
+            self._codes[symbol] = code
+        return code
+
+    def _encode(self, cells, foreign_cells: Dict[int, str]) -> bytearray:
+        """Códigos de ``cells``; anota en ``foreign_cells`` los símbolos fuera del alfabeto."""
+        foreign = self._foreign
+        codes = bytearray(map(self._codes.get, cells, repeat(foreign, len(cells))))
+        if foreign in codes:
+            if foreign > 255:
+                raise ValueError("La cinta admite como máximo 255 símbolos en el alfabeto "
+                                 "si la entrada tiene otros")
+            foreign_cells.update((i, sym) for i, sym in enumerate(cells) if sym not in self._codes)
+        return codes
+
+    def _decode(self, codes, tape_idx: int = 0, start: int = 0) -> List[str]:
+        """Símbolos de ``codes``, el tramo de la cinta ``tape_idx`` que empieza en ``start``."""
+        symbols = self._symbols
+        foreign = self._foreign
+        if foreign not in codes:
+            return list(map(symbols.__getitem__, codes))
+        cells = self._foreign_cells[tape_idx]
+        return [cells[start + i] if c == foreign else symbols[c] for i, c in enumerate(codes)]
+
+    @property
+    def tapes(self) -> List[List[str]]:
+        """Cintas decodificadas (copia); cada cinta empieza en la posición 0."""
+        return [self._decode(t, i) for i, t in enumerate(self._tapes)]
+
+    @tapes.setter
+    def tapes(self, tapes: List[List[str]]):
+        self._foreign_cells = [{} for _ in tapes]
+        self._tapes = [self._encode(t, f) for t, f in zip(tapes, self._foreign_cells)]
+
+    def tape_length(self, tape_idx: int) -> int:
+        return len(self._tapes[tape_idx])
+
+    def tape_window(self, tape_idx: int, start: int, end: int) -> List[str]:
+        """Símbolos de ``start`` a ``end`` (exclusivo) de una cinta, con blancos
+        fuera de lo asignado; decodifica solo ese tramo."""
+        start = max(start, 0)
+        if end <= start:
+            return []
+        cells = self._decode(self._tapes[tape_idx][start:end], tape_idx, start)
+        cells.extend([self.blank_symbol] * (end - start - len(cells)))
+        return cells
     
     def load_config(self, json_file: str) -> bool:
         try:
             with open(json_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
+        except Exception as e:
+            print(f"Error al cargar configuración '{json_file}': {e}")
+            return False
+        return self.load_config_data(config, json_file)
+
+    def load_config_data(self, config: Dict[str, Any], source: str = '<dict>') -> bool:
+        """Carga una configuración ya parseada (p. ej. desde machine_registry)."""
+        try:
             required = ["states", "input_alphabet", "tape_alphabet", "initial_state", "accept_states", "transitions"]
             for field in required:
                 if field not in config:
-                    print(f"Error: falta campo '{field}' en {json_file}")
+                    print(f"Error: falta campo '{field}' en {source}")
                     return False
-            self.states = config["states"]
-            self.input_alphabet = config["input_alphabet"]
-            self.tape_alphabet = config["tape_alphabet"]
+            # Copias: config puede ser el JSON compartido de machine_registry
+            self.states = list(config["states"])
+            self.input_alphabet = list(config["input_alphabet"])
+            self.tape_alphabet = list(config["tape_alphabet"])
             self.initial_state = config["initial_state"]
-            self.accept_states = config["accept_states"]
+            self.accept_states = list(config["accept_states"])
             self.blank_symbol = config.get("blank_symbol", "_")
             self.num_tapes = config.get("num_tapes", 1)
             self.transitions = {}
             self._load_transitions(config["transitions"])
+            self._compile()
             self.current_state = self.initial_state
             self.step_count = 0
             self.halted = False
+            self.source = source if source != '<dict>' else None
             return True
         except Exception as e:
-            print(f"Error al cargar configuración '{json_file}': {e}")
+            print(f"Error al cargar configuración '{source}': {e}")
             return False
     
+    def fresh(self) -> 'TuringMachine':
+        """Instancia nueva con la misma definición, sin volver a compilarla.
+
+        Comparte las tablas de símbolos y de transiciones (no se modifican
+        después de cargar) y copia las listas de la definición. Cintas, estado
+        y observadores son propios.
+        """
+        tm = type(self)(blank_symbol=self.blank_symbol, num_tapes=self.num_tapes)
+        tm.states = list(self.states)
+        tm.input_alphabet = list(self.input_alphabet)
+        tm.tape_alphabet = list(self.tape_alphabet)
+        tm.initial_state = self.initial_state
+        tm.accept_states = list(self.accept_states)
+        tm.transitions = self.transitions
+        tm._table = self._table
+        tm._moves = self._moves
+        tm._symbols = self._symbols
+        tm._codes = self._codes
+        tm._foreign = self._foreign
+        tm._program = self._program
+        tm.current_state = self.initial_state
+        tm.source = self.source
+        return tm
+
     def _init_tapes(self, input_string: str):
-        self.tapes = []
-        if self.num_tapes == 1:
-            primary = list(input_string)
-            primary.extend([self.blank_symbol] * 50)
-            self.tapes.append(primary)
-        else:
-            # Primera cinta con entrada, resto en blanco
-            first = list(input_string)
-            first.extend([self.blank_symbol] * 50)
-            self.tapes.append(first)
-            for _ in range(self.num_tapes - 1):
-                blank_tape = [self.blank_symbol] * (len(first))
-                self.tapes.append(blank_tape)
+        # Primera cinta con entrada (más 50 blancos), resto en blanco del mismo largo
+        self.input_string = input_string
+        self._foreign_cells = [{} for _ in range(self.num_tapes)]
+        first = self._encode(input_string, self._foreign_cells[0])
+        first.extend(bytes(50))
+        self._tapes = [first]
+        for _ in range(self.num_tapes - 1):
+            self._tapes.append(bytearray(len(first)))
         self.head_positions = [0] * self.num_tapes
         self.current_state = self.initial_state
         self.step_count = 0
         self.halted = False
-    
+        if self._observers:
+            self._observers.start(self)
+
+    # ---- Observadores ----
+    def add_observer(self, observer: StepObserver):
+        self._observers.add(observer)
+
+    def remove_observer(self, observer: StepObserver):
+        """Quita ``observer`` (antes le entrega los pasos que tenga pendientes)."""
+        self._observers.remove(observer, self)
+
+    @property
+    def observers(self) -> List[StepObserver]:
+        return list(self._observers)
+
+    @property
+    def debug_mode(self) -> bool:
+        return any(isinstance(o, DebugPrinter) for o in self._observers)
+
+    @debug_mode.setter
+    def debug_mode(self, enabled: bool):
+        printers = [o for o in self._observers if isinstance(o, DebugPrinter)]
+        if enabled and not printers:
+            self.add_observer(DebugPrinter())
+        elif not enabled:
+            for printer in printers:
+                self.remove_observer(printer)
+
+    @property
+    def recorder(self) -> Optional[TraceRecorder]:
+        """Si se asigna, cada paso se graba en él (ver trace_recorder.py)."""
+        return self._recording.recorder if self._recording is not None else None
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[TraceRecorder]):
+        if self._recording is not None:
+            self.remove_observer(self._recording)
+            self._recording = None
+        if recorder is not None:
+            self._recording = RecorderObserver(recorder)
+            self.add_observer(self._recording)
+
     def _ensure_index(self, tape_idx: int):
-        while self.head_positions[tape_idx] >= len(self.tapes[tape_idx]):
-            self.tapes[tape_idx].append(self.blank_symbol)
+        tape = self._tapes[tape_idx]
+        missing = self.head_positions[tape_idx] - len(tape) + 1
+        if missing > 0:
+            tape.extend(bytes(missing))
+            if self._observers:
+                self._observers.tape_grow(self, tape_idx, len(tape))
 
-    def _read_symbols(self) -> Tuple[str, ...]:
-        symbols = []
+    def _read_codes(self) -> bytes:
+        codes = bytearray()
         for i in range(self.num_tapes):
             self._ensure_index(i)
-            pos = self.head_positions[i]
-            if pos < 0:
-                symbols.append(self.blank_symbol)
-            else:
-                symbols.append(self.tapes[i][pos])
-        return tuple(symbols)
+            codes.append(self._tapes[i][self.head_positions[i]])
+        return bytes(codes)
+
+    def _read_symbols(self) -> Tuple[str, ...]:
+        codes = self._read_codes()
+        return tuple(self._decode(codes[i:i + 1], i, head)[0] for i, head in enumerate(self.head_positions))
     
-    def _write_symbols(self, write: Tuple[str, ...]):
-        for i, sym in enumerate(write):
+    def _write_codes(self, write: bytes):
+        for i, code in enumerate(write):
             self._ensure_index(i)
-            if self.head_positions[i] >= 0:
-                self.tapes[i][self.head_positions[i]] = sym
+            self._tapes[i][self.head_positions[i]] = code
     
-    def _apply_movements(self, movements: Tuple[str, ...]):
-        for i, mv in enumerate(movements):
-            if mv == 'R':
-                self.head_positions[i] += 1
-            elif mv == 'L':
-                self.head_positions[i] -= 1
-                if self.head_positions[i] < 0:
-                    self.head_positions[i] = 0
-            # 'N' no mueve
+    def _apply_movements(self, deltas: Tuple[int, ...]):
+        for i, delta in enumerate(deltas):
+            pos = self.head_positions[i] + delta
+            # El cabezal no pasa a la izquierda de la celda 0
+            self.head_positions[i] = pos if pos > 0 else 0
     
     def _find_transition(self, state: str, symbols: Tuple[str, ...]):
         if self.num_tapes == 1:
@@ -174,24 +378,37 @@ class TuringMachine:
     def step(self) -> bool:
         if self.halted:
             return False
-        symbols = self._read_symbols()
-        transition = self._find_transition(self.current_state, symbols)
+        codes = self._read_codes()
+        if self.num_tapes == 1:
+            transition = self._table.get((self.current_state, codes[0]))
+        else:
+            transition = self._table.get((self.current_state, codes))
         if transition is None:
-            if self.debug_mode:
-                print(f"Sin transición para estado={self.current_state} símbolos={symbols}")
             self.halted = True
+            if self._observers:
+                self._observers.halt(self, NO_TRANSITION)
             return False
-        next_state, write, moves = transition
+        next_state, write, deltas = transition
         if self.num_tapes == 1:
             # Normalizar tipos
-            write = (write,)
-            moves = (moves,)
-        if self.debug_mode:
-            print(f"Paso {self.step_count}: estado={self.current_state} símbolos={symbols} -> {next_state}, escribir={write}, movimientos={moves}")
-        self._write_symbols(write)
+            write = bytes((write,))
+            deltas = (deltas,)
+        observers = self._observers
+        if observers:
+            state = self.current_state
+            before = list(self.head_positions)
+        self._write_codes(write)
         self.current_state = next_state
-        self._apply_movements(moves)
+        self._apply_movements(deltas)
         self.step_count += 1
+        if observers:
+            key = (state, codes[0]) if self.num_tapes == 1 else (state, codes)
+            observers.step(self, StepEvent(self.step_count - 1, state, next_state, before, codes, write,
+                                           self._moves[key],
+                                           [h - b for h, b in zip(self.head_positions, before)],
+                                           self._symbols))
+            if next_state in self.accept_states:
+                observers.halt(self, ACCEPT)
         return True
     
     def is_accepting_state(self) -> bool:
@@ -199,32 +416,217 @@ class TuringMachine:
     
     def run(self, input_string: str, max_steps: int = 200000) -> str:
         self._init_tapes(input_string)
-        if self.debug_mode:
-            print("=== Inicio ejecución MT ===")
-            print(f"Cintas: {self.num_tapes}, Entrada: '{input_string}'")
+        self._execute(max_steps)
+        return self._result()
+
+    def advance(self, count: int) -> int:
+        """Da hasta ``count`` pasos más desde la configuración actual (sin
+        reiniciar las cintas ni avisar del límite); devuelve los pasos dados.
+
+        Para ejecutar por tramos (modo turbo de la GUI): sin observadores ni
+        perfilador usa el bucle rápido del núcleo, como ``run()``.
+        """
+        before = self.step_count
+        self._loop(before + count)
+        return self.step_count - before
+
+    def _loop(self, max_steps: int):
+        if self.profiler is not None:
+            self._run_profiled(max_steps)
+        elif not self._observers:
+            self._run_fast(max_steps)
+        else:
+            while not self.halted and self.step_count < max_steps:
+                progressed = self.step()
+                if not progressed:
+                    break
+                if self.is_accepting_state():
+                    self.halted = True
+                    break
+
+    def _execute(self, max_steps: int):
+        """Ejecuta pasos hasta detenerse o hasta que ``step_count`` llegue a ``max_steps``."""
+        self._loop(max_steps)
+        if self.step_count >= max_steps:
+            print(f"ADVERTENCIA: límite de pasos {max_steps} alcanzado")
+        if self._observers:
+            if not self.halted:
+                self._observers.halt(self, MAX_STEPS)
+            self._observers.flush(self)
+
+    def _core_program(self, dense: bool = True):
+        """Programa del núcleo compartido (tm_core) para _run_fast; se arma una
+        vez por definición.
+
+        Con una cinta y ``dense`` es una ``CompiledMachine`` cuyos ids de
+        símbolo son los mismos códigos de ``_symbols`` (y cuya fila vacía de
+        símbolos ajenos es ``_foreign``) junto con sus ``linked_rows``; si no, o si hay más símbolos de los que admite la
+        tabla densa, un ``MultiTapeProgram`` (y ``None``). Devuelve
+        ``(programa, filas)``.
+        """
+        n = self.num_tapes
+        # Depende también de num_tapes y accept_states (asignables a mano)
+        signature = (n, tuple(self.accept_states), dense)
+        if self._program is not None and self._program[0] == signature:
+            return self._program[1:]
+        program = None
+        if n == 1 and dense:
+            rows = []
+            for key, (next_state, write, _) in self._table.items():
+                state, read = key
+                if isinstance(read, int):
+                    rows.append((state, self._symbols[read], next_state, self._symbols[write],
+                                 self._moves[key][0]))
+            try:
+                program = tm_core.compile_single(rows, self.states, self._symbols[1:], self.initial_state,
+                                                 self.accept_states, self._symbols[0])
+            except ValueError:
+                program = None  # más de 255 símbolos: tabla por diccionario
+        if program is None:
+            rows = []
+            for key, (next_state, write, _) in self._table.items():
+                state, read = key
+                if isinstance(read, int):
+                    if n != 1:
+                        continue
+                    read, write = bytes((read,)), bytes((write,))
+                elif n == 1:
+                    continue
+                rows.append((state, read, next_state, write, self._moves[key]))
+            program = tm_core.MultiTapeProgram(n, rows, self.accept_states, self.states)
+            self._program = (signature, program, None)
+        else:
+            self._program = (signature, program, tm_core.linked_rows(program))
+        return self._program[1:]
+
+    def _run_fast(self, max_steps: int):
+        """Equivale a llamar step() hasta detenerse, aceptar o llegar a
+        ``max_steps``; el bucle es el del núcleo compartido (tm_core)."""
+        detector = self.loop_detector
+        if detector is not None:
+            detector.start()
+        if self.halted or self.step_count >= max_steps:
+            return
+        if self.is_accepting_state():
+            # Esta MT da un paso aunque empiece en un estado de aceptación
+            if self.step() and self.is_accepting_state():
+                self.halted = True
+            if self.halted or self.step_count >= max_steps:
+                return
+        program, rows = self._core_program(dense=detector is None)
+        state = program.state_ids.get(self.current_state)
+        if state is None:
+            self.halted = True
+            return
+        for i in range(self.num_tapes):
+            self._ensure_index(i)
+        budget = max_steps - self.step_count
+        if detector is not None:
+            state, steps = tm_core.run_multi_detect(program, self._tapes, self.head_positions, state, budget,
+                                                    detector, self.step_count)
+        elif rows is None:
+            state, steps = tm_core.run_multi(program, self._tapes, self.head_positions, state, budget)
+        else:
+            self.head_positions[0], state, steps = tm_core.run_clamped(
+                rows, program.accepting, self._tapes[0], self.head_positions[0], state, budget)
+        self.step_count += steps
+        self.current_state = program.state_names[state]
+        # Se detuvo antes del límite: aceptó, no hubo transición o divergió
+        self.halted = program.accepting[state] or steps < budget or bool(detector and detector.diverged)
+
+    def _run_profiled(self, max_steps: int):
+        """El bucle de _execute, contando en ``profiler`` visitas por estado,
+        transiciones aplicadas, recorrido de los cabezales y crecimiento de las
+        cintas. Sin perfilador, _execute no pasa por aquí."""
+        prof = self.profiler
+        labels = []
+        for (state, read), (next_state, write, moves) in self.transitions.items():
+            if isinstance(read, tuple):
+                read, write, moves = ','.join(read), ','.join(write), ','.join(moves)
+            labels.append(f"{state}, {read} -> {next_state}, {write}, {moves}")
+        # _table tiene las mismas claves que transitions, en el mismo orden
+        index = {key: i for i, key in enumerate(self._table)}
+        prof.start('multi', self.states, labels, self.step_count, self.source)
+        visits = prof.state_visits
+        hits = prof.transition_hits
+        tapes = self._tapes
+        heads = self.head_positions
+        single = self.num_tapes == 1
+        state_id = prof.state_id(self.current_state)
+        prof.segment(state_id, self.step_count, sum(map(len, tapes)))
         while not self.halted and self.step_count < max_steps:
-            progressed = self.step()
-            if not progressed:
+            state = self.current_state
+            cells = sum(map(len, tapes))
+            before = list(heads)
+            codes = self._read_codes()
+            grown = sum(map(len, tapes)) - cells
+            if not self.step():
+                prof.growth_events += grown > 0
                 break
+            visits[state_id] += 1
+            hits[index[(state, codes[0] if single else codes)]] += 1
+            prof.head_travel += sum(abs(h - b) for h, b in zip(heads, before))
+            prof.growth_events += grown > 0
+            if self.current_state != state:
+                state_id = prof.state_id(self.current_state)
+                prof.segment(state_id, self.step_count, sum(map(len, tapes)))
             if self.is_accepting_state():
                 self.halted = True
                 break
-            if self.debug_mode and self.step_count % 25 == 0:
-                self.display_tape()
-        if self.step_count >= max_steps:
-            print(f"ADVERTENCIA: límite de pasos {max_steps} alcanzado")
-        if self.debug_mode:
-            print("=== Fin ejecución ===")
-            print(f"Pasos: {self.step_count} | Estado final: {self.current_state} | Aceptado: {self.is_accepting_state()}")
-            self.display_tape()
-        # Resultado principal (cinta 0)
-        principal = ''.join(self.tapes[0]).rstrip(self.blank_symbol)
+        prof.finish(self.step_count, sum(map(len, self._tapes)))
+
+    def _result(self) -> str:
+        # Resultado principal (cinta 0); solo se decodifica hasta el último no blanco
+        principal = ''.join(self._decode(self._tapes[0].rstrip(b'\0'))).rstrip(self.blank_symbol)
         return principal
+
+    def _definition_digest(self) -> str:
+        # Claves de una y de varias cintas pueden mezclarse: se ordena por su forma JSON
+        transitions = sorted(json.dumps([k, v], ensure_ascii=False) for k, v in self.transitions.items())
+        return definition_digest([self.states, self.tape_alphabet, self.initial_state, self.accept_states,
+                                  self.blank_symbol, self.num_tapes, transitions])
+
+    def checkpoint(self) -> Checkpoint:
+        """Configuración actual (estado, cabezales, cintas, pasos) serializable."""
+        return Checkpoint('multi', self._definition_digest(), self.current_state, self.step_count,
+                          list(self._symbols), [bytes(t) for t in self._tapes], [0] * len(self._tapes),
+                          list(self.head_positions), halted=self.halted,
+                          foreign=dict(self._foreign_cells[0]) if self._foreign_cells else None,
+                          source=self.source, foreign_extra=[dict(c) for c in self._foreign_cells[1:]])
+
+    def restore(self, checkpoint: Checkpoint):
+        """Vuelve a la configuración guardada en ``checkpoint``."""
+        checkpoint.check('multi', self._definition_digest())
+        # Códigos desde len(symbols): celdas fuera del alfabeto (texto en foreign)
+        foreign = self._foreign
+        remap = bytes([self._codes.get(sym, foreign) for sym in checkpoint.symbols]
+                      + [foreign] * (256 - len(checkpoint.symbols)))
+        self._tapes = [bytearray(t.translate(remap)) for t in checkpoint.tapes]
+        self._foreign_cells = [dict(checkpoint.foreign)] + [dict(c) for c in checkpoint.foreign_extra]
+        self._foreign_cells += [{} for _ in range(len(self._tapes) - len(self._foreign_cells))]
+        # Checkpoints anteriores guardaban esos símbolos en la tabla de símbolos
+        outside = {code: sym for code, sym in enumerate(checkpoint.symbols) if sym not in self._codes}
+        if outside:
+            for t, cells in zip(checkpoint.tapes, self._foreign_cells):
+                cells.update((pos, outside[code]) for pos, code in enumerate(t) if code in outside)
+        self.head_positions = list(checkpoint.heads)
+        self.current_state = checkpoint.state
+        self.step_count = checkpoint.steps
+        self.halted = checkpoint.halted
+        self.input_string = None
+        if self._observers:
+            self._observers.start(self)
+
+    def resume(self, checkpoint: Checkpoint, extra_steps: int = 200000) -> str:
+        """Continúa desde ``checkpoint`` hasta ``extra_steps`` pasos más."""
+        self.restore(checkpoint)
+        self._execute(self.step_count + extra_steps)
+        return self._result()
     
     def display_tape(self):
         for i in range(self.num_tapes):
             span = max(self.head_positions[i] + 10, 30)
-            snippet = ''.join(self.tapes[i][:span])
+            snippet = ''.join(self.tape_window(i, 0, min(span, self.tape_length(i))))
             print(f"Cinta {i}: [{snippet}]")
             caret_spaces = ' ' * (self.head_positions[i] + 9)
             print(f"{caret_spaces}^ (pos {self.head_positions[i]})")
@@ -240,7 +642,7 @@ class TuringMachine:
         print("="*48)
     
     def enable_debug_mode(self):
-        """Activa el modo debug para ver cada paso de la ejecución"""
+        """Activa el modo debug para ver cada paso de la ejecución (un DebugPrinter)"""
         self.debug_mode = True
     
     def disable_debug_mode(self):
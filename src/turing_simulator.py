@@ -18,9 +18,21 @@ Estructura JSON esperada (exacta):
 
 Características:
 - Carga directa del JSON sin reinterpretar la lógica.
-- Cinta conceptualmente infinita: se expande dinámicamente a la izquierda o derecha.
-- Búsqueda de transición lineal en el orden declarado (prioriza primera coincidencia).
+- Cinta conceptualmente infinita: se expande dinámicamente a la izquierda o derecha
+  en O(1) amortizado (ver tape.Tape); ``head_position`` sigue siendo el índice
+  dentro de ``tape`` (0 = celda más a la izquierda).
+- Celdas como códigos de un byte (``bytearray``); los símbolos se decodifican
+  solo al leer ``tape``/``get_tape_contents()``.
+- Tabla de transiciones compilada al cargar (ids enteros de estado/símbolo,
+  búsqueda O(1)); conserva la regla de primera coincidencia declarada.
+- run() delega el bucle en el núcleo compartido ``tm_core`` (el mismo que usa
+  el simulador multi-cinta); esta clase es el adaptador de una cinta.
 - Pasos individuales mediante step(); ejecución completa con run().
+- checkpoint()/resume() para guardar la configuración y continuar una ejecución
+  que agotó ``max_steps`` (ver checkpoint.py).
+- Grabación opcional paso a paso en ``recorder`` (ver trace_recorder.py).
+- Perfil opcional de estados y transiciones en ``profiler`` (ver profiler.py).
+- Detección opcional de ciclos en ``loop_detector`` (ver loop_detector.py).
 
 Limitaciones intencionales (para mantener pureza):
 - No se incluye soporte multi-cinta ni atajos lógicos.
@@ -29,11 +41,28 @@ Limitaciones intencionales (para mantener pureza):
 
 from __future__ import annotations
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import tm_core  # type: ignore
+    from compiled_machine import CompiledMachine  # type: ignore
+    from tape import Tape  # type: ignore
+    from checkpoint import Checkpoint, definition_digest  # type: ignore
+    from trace_recorder import TraceRecorder  # type: ignore
+    from profiler import ExecutionProfiler  # type: ignore
+    from loop_detector import LoopDetector  # type: ignore
+except ImportError:  # importado como paquete (src.turing_simulator)
+    from . import tm_core
+    from .compiled_machine import CompiledMachine
+    from .tape import Tape
+    from .checkpoint import Checkpoint, definition_digest
+    from .trace_recorder import TraceRecorder
+    from .profiler import ExecutionProfiler
+    from .loop_detector import LoopDetector
 
 
 class TuringMachine:
-    def __init__(self, json_file: str):
+    def __init__(self, json_file: Optional[str] = None):
         self.states: List[str] = []
         self.input_alphabet: List[str] = []
         self.tape_alphabet: List[str] = []
@@ -41,94 +70,312 @@ class TuringMachine:
         self.accept_states: List[str] = []
         self.blank_symbol: str = '_'
         self.transitions: List[Dict[str, str]] = []
+        self.compiled: Optional[CompiledMachine] = None
+        # Ruta del JSON de origen, si se conoce (se anota en los checkpoints).
+        self.source: Optional[str] = None
+        # Si se asigna, cada paso se graba en él (las ejecuciones van paso a paso).
+        self.recorder: Optional[TraceRecorder] = None
+        # Si se asigna, run()/resume() cuentan visitas y transiciones (paso a paso).
+        self.profiler: Optional[ExecutionProfiler] = None
+        # Si se asigna, run()/resume() se detienen al repetirse una configuración
+        # (paso a paso, sin acelerar; ver loop_detector.py).
+        self.loop_detector: Optional[LoopDetector] = None
 
-        self.tape: List[str] = []
-        self.head_position: int = 0
+        # Cinta bi-infinita y posición absoluta del cabezal (puede ser negativa).
+        self._tape: Tape = Tape()
+        self._head: int = 0
         self.current_state: Optional[str] = None
         self.steps_executed: int = 0
 
-        self.load_machine(json_file)
+        if json_file is not None:
+            self.load_machine(json_file)
+
+    @classmethod
+    def from_definition(cls, data: Dict, compiled: CompiledMachine,
+                        source: Optional[str] = None) -> 'TuringMachine':
+        """Instancia nueva (estado de ejecución propio) que comparte una definición
+        ya parseada y compilada, p. ej. la de machine_registry."""
+        tm = cls()
+        tm.load_data(data, compiled)
+        tm.source = source
+        return tm
 
     def load_machine(self, json_file: str) -> None:
         with open(json_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        self.states = data.get('states', [])
-        self.input_alphabet = data.get('input_alphabet', [])
-        self.tape_alphabet = data.get('tape_alphabet', [])
+        self.load_data(data)
+        self.source = json_file
+
+    def load_data(self, data: Dict, compiled: Optional[CompiledMachine] = None) -> None:
+        # Copias: data puede ser el JSON compartido de machine_registry
+        self.states = list(data.get('states', []))
+        self.input_alphabet = list(data.get('input_alphabet', []))
+        self.tape_alphabet = list(data.get('tape_alphabet', []))
         self.initial_state = data.get('initial_state')
-        self.accept_states = data.get('accept_states', [])
+        self.accept_states = list(data.get('accept_states', []))
         self.blank_symbol = data.get('blank_symbol', '_')
-        self.transitions = data.get('transitions', [])
+        self.transitions = list(data.get('transitions', []))
+        self.compiled = compiled if compiled is not None else CompiledMachine(data)
+
+    @property
+    def tape(self) -> List[str]:
+        """Celdas asignadas de izquierda a derecha (copia de la cinta)."""
+        return self._tape.to_list()
+
+    @tape.setter
+    def tape(self, cells: List[str]) -> None:
+        self._tape = self._new_tape(cells)
+        self._head = 0
+        self._start_recording()
+
+    @property
+    def head_position(self) -> int:
+        """Índice del cabezal dentro de ``tape`` (0 = celda más a la izquierda)."""
+        return self._head - self._tape.lo
+
+    @head_position.setter
+    def head_position(self, index: int) -> None:
+        self._head = index + self._tape.lo
+
+    def _new_tape(self, cells) -> Tape:
+        if self.compiled is None:
+            return Tape((self.blank_symbol,), cells)
+        return Tape(self.compiled.symbols, cells, self.compiled.symbol_ids)
 
     def initialize_tape(self, input_string: str) -> None:
-        self.tape = list(input_string) if input_string else []
-        if not self.tape:
-            self.tape.append(self.blank_symbol)
-        self.head_position = 0
+        self._tape = self._new_tape(input_string)
+        self._head = 0
         self.current_state = self.initial_state
         self.steps_executed = 0
+        self._start_recording()
+
+    def _start_recording(self) -> None:
+        if self.recorder is None or self.compiled is None:
+            return
+        tape = self._tape
+        self.recorder.start(self.compiled.symbols, self.compiled.state_names, self.current_state,
+                            [(tape.lo, tape.segment(tape.lo, tape.hi))], [self._head], tape.foreign_cells)
 
     def find_transition(self, state: str, symbol: str) -> Optional[Dict[str, str]]:
-        for t in self.transitions:
-            if t.get('current_state') == state and t.get('read_symbol') == symbol:
-                return t
-        return None
+        entry = self.compiled.lookup(state, symbol)
+        if entry is None:
+            return None
+        return self.transitions[entry[3]]
 
     def step(self) -> bool:
         if self.current_state is None:
             return False
         if self.current_state in self.accept_states:
             return False
-        if self.head_position < 0:
-            needed = -self.head_position
-            self.tape = [self.blank_symbol] * needed + self.tape
-            self.head_position = 0
-        if self.head_position >= len(self.tape):
-            self.tape.append(self.blank_symbol)
-        current_symbol = self.tape[self.head_position]
-        transition = self.find_transition(self.current_state, current_symbol)
-        if transition is None:
+        cm = self.compiled
+        self._tape.ensure(self._head)
+        sid = cm.state_ids.get(self.current_state)
+        if sid is None:
+            return False
+        entry = cm.table[self._tape.code_at(self._head) * cm.n_states + sid]
+        if entry is None:
             return False
-        write_symbol = transition.get('write_symbol', current_symbol)
-        move = transition.get('move', 'N')
-        next_state = transition.get('next_state', self.current_state)
-        self.tape[self.head_position] = write_symbol
-        if move == 'L':
-            self.head_position -= 1
-        elif move == 'R':
-            self.head_position += 1
-        if self.head_position < 0:
-            self.tape.insert(0, self.blank_symbol)
-            self.head_position = 0
-        elif self.head_position >= len(self.tape):
-            self.tape.append(self.blank_symbol)
-        self.current_state = next_state
+        next_id, write_id, delta, _ = entry
+        if self.recorder is not None:
+            self.recorder.record(next_id, self._head, self._tape.code_at(self._head), write_id, delta)
+        self._tape.write_code(self._head, write_id)
+        self._head += delta
+        self._tape.ensure(self._head)
+        self.current_state = self.compiled.state_names[next_id]
         self.steps_executed += 1
         return True
 
-    def run(self, input_string: str, max_steps: int = 10000) -> str:
+    def run(self, input_string: str, max_steps: int = 10000, accelerate: bool = False) -> str:
+        """Ejecuta desde la configuración inicial.
+
+        Con ``accelerate=True`` las rachas de transiciones de barrido (mismo
+        estado, mismo símbolo, movimiento L/R) se saltan en bloque y las cadenas
+        deterministas de estados se ejecutan como una sola escritura por franjas;
+        el resultado, ``steps_executed`` y la cinta son idénticos a ejecutar paso
+        a paso.
+        """
         self.initialize_tape(input_string)
-        for _ in range(max_steps):
-            if self.current_state in self.accept_states:
-                break
-            progressed = self.step()
-            if not progressed:
-                break
+        self._execute(max_steps, accelerate)
+        return self.get_tape_contents()
+
+    def _execute(self, max_steps: int, accelerate: bool) -> None:
+        if self.profiler is not None:
+            # Perfilando: paso a paso (graba también si hay recorder).
+            self._run_profiled(max_steps)
+        elif self.recorder is not None:
+            # Grabando: paso a paso, para tener un registro por paso.
+            for _ in range(max_steps):
+                if not self.step():
+                    break
+        elif self.loop_detector is not None:
+            self._run_detecting(max_steps)
+        elif accelerate:
+            self._run_accelerated(max_steps)
+        else:
+            self._run_compiled(max_steps)
+
+    def _definition_digest(self) -> str:
+        return definition_digest([self.states, self.tape_alphabet, self.initial_state,
+                                  self.accept_states, self.blank_symbol, self.transitions])
+
+    def checkpoint(self) -> Checkpoint:
+        """Configuración actual (estado, cabezal, cinta, pasos) serializable."""
+        tape = self._tape
+        return Checkpoint('single', self._definition_digest(), self.current_state, self.steps_executed,
+                          list(self.compiled.symbols), [tape.segment(tape.lo, tape.hi)], [tape.lo],
+                          [self._head], foreign=dict(tape.foreign_cells), source=self.source)
+
+    def restore(self, checkpoint: Checkpoint) -> None:
+        """Vuelve a la configuración guardada en ``checkpoint``."""
+        checkpoint.check('single', self._definition_digest())
+        if checkpoint.symbols != self.compiled.symbols:
+            raise ValueError("El checkpoint usa otra codificación de símbolos")
+        self._tape = Tape.from_codes(self.compiled.symbols, checkpoint.origins[0], checkpoint.tapes[0],
+                                     checkpoint.foreign, self.compiled.symbol_ids)
+        self._head = checkpoint.heads[0]
+        self._tape.ensure(self._head)
+        self.current_state = checkpoint.state
+        self.steps_executed = checkpoint.steps
+        self._start_recording()
+
+    def resume(self, checkpoint: Checkpoint, extra_steps: int = 10000, accelerate: bool = False) -> str:
+        """Continúa desde ``checkpoint`` hasta ``extra_steps`` pasos más.
+
+        ``steps_executed`` sigue contando desde el checkpoint; el resultado es el
+        mismo que haber ejecutado run() con el presupuesto total.
+        """
+        self.restore(checkpoint)
+        self._execute(extra_steps, accelerate)
         return self.get_tape_contents()
 
+    def _run_compiled(self, max_steps: int) -> None:
+        """Bucle de ejecución sobre ids enteros (tm_core.run_single); equivale a
+        llamar step() hasta aceptar, quedar sin transición o agotar ``max_steps``."""
+        if self.current_state is None:
+            return
+        cm = self.compiled
+        tape = self._tape
+        tape.ensure(self._head)
+        self._head, state, steps, tape.nb_lo, tape.nb_hi = tm_core.run_single(
+            cm, tape.left, tape.right, self._head, cm.state_ids[self.current_state], max_steps,
+            nb_lo=tape.nb_lo, nb_hi=tape.nb_hi)
+        self.current_state = cm.state_names[state]
+        self.steps_executed += steps
+
+    def _run_detecting(self, max_steps: int) -> None:
+        """Como _run_compiled, deteniéndose también si la configuración se repite
+        (tm_core.run_single_detect); el resultado queda en ``loop_detector``."""
+        detector = self.loop_detector
+        detector.start()
+        if self.current_state is None:
+            return
+        cm = self.compiled
+        self._head, state, steps = tm_core.run_single_detect(
+            cm, self._tape, self._head, cm.state_ids[self.current_state], max_steps, detector,
+            self.steps_executed)
+        self.current_state = cm.state_names[state]
+        self.steps_executed += steps
+
+    def _run_profiled(self, max_steps: int) -> None:
+        """Como _run_compiled, contando en ``profiler`` cada estado visitado,
+        cada transición aplicada, el recorrido del cabezal y el crecimiento de
+        la cinta. Los otros bucles no cambian: sin perfilador no hay costo."""
+        prof = self.profiler
+        cm = self.compiled
+        prof.start('single', cm.state_names,
+                   [_transition_label(t) for t in self.transitions], self.steps_executed, self.source)
+        tape = self._tape
+        if self.current_state is None:
+            prof.finish(self.steps_executed, len(tape))
+            return
+        tape.ensure(self._head)
+        table = cm.table
+        n_states = cm.n_states
+        accepting = cm.accepting
+        blank_id = cm.blank_id
+        recorder = self.recorder
+        visits = prof.state_visits
+        hits = prof.transition_hits
+        segment = prof.segment
+        left = tape.left
+        right = tape.right
+        nb_lo = tape.nb_lo
+        nb_hi = tape.nb_hi
+        head = self._head
+        state = cm.state_ids[self.current_state]
+        start = self.steps_executed
+        segment(state, start, len(left) + len(right))
+        travel = 0
+        growth = 0
+        steps = 0
+        while steps < max_steps and not accepting[state]:
+            read_id = right[head] if head >= 0 else left[~head]
+            entry = table[read_id * n_states + state]
+            if entry is None:
+                break
+            visits[state] += 1
+            next_id, write_id, delta, idx = entry
+            hits[idx] += 1
+            if recorder is not None:
+                recorder.record(next_id, head, read_id, write_id, delta)
+            if head >= 0:
+                right[head] = write_id
+            else:
+                left[~head] = write_id
+            if write_id != blank_id:
+                if head < nb_lo:
+                    nb_lo = head
+                if head > nb_hi:
+                    nb_hi = head
+            head += delta
+            if delta:
+                travel += 1
+                if head >= len(right):
+                    right.append(blank_id)
+                    growth += 1
+                elif ~head >= len(left):
+                    left.append(blank_id)
+                    growth += 1
+            steps += 1
+            if next_id != state:
+                state = next_id
+                segment(state, start + steps, len(left) + len(right))
+        tape.nb_lo = nb_lo
+        tape.nb_hi = nb_hi
+        self._head = head
+        self.current_state = cm.state_names[state]
+        self.steps_executed += steps
+        prof.head_travel = travel
+        prof.growth_events = growth
+        prof.finish(self.steps_executed, len(tape))
+
+    def _run_accelerated(self, max_steps: int) -> None:
+        """Como _run_compiled, pero cada barrido avanza toda la racha de una vez
+        y cada cadena fusionada se aplica como un bloque (tm_core.run_accelerated)."""
+        if self.current_state is None:
+            return
+        cm = self.compiled
+        self._head, state, steps = tm_core.run_accelerated(
+            cm, self._tape, self._head, cm.state_ids[self.current_state], max_steps)
+        self.current_state = cm.state_names[state]
+        self.steps_executed += steps
+
+    def tape_bounds(self) -> Optional[Tuple[int, int]]:
+        """Índices en ``tape`` (inclusive) del primer y último símbolo no blanco,
+        o None si la cinta está en blanco. O(1) amortizado."""
+        b = self._tape.bounds()
+        if b is None:
+            return None
+        lo = self._tape.lo
+        return b[0] - lo, b[1] - lo
+
     def get_tape_contents(self) -> str:
-        if not self.tape:
-            return ''
-        first = None
-        last = None
-        for i, sym in enumerate(self.tape):
-            if sym != self.blank_symbol:
-                if first is None:
-                    first = i
-                last = i
-        if first is None:
-            return ''
-        return ''.join(self.tape[first:last + 1])
+        return self._tape.contents()
+
+
+def _transition_label(t: Dict[str, str]) -> str:
+    return (f"{t.get('current_state')}, {t.get('read_symbol')} -> "
+            f"{t.get('next_state')}, {t.get('write_symbol')}, {t.get('move')}")
 
 
 if __name__ == "__main__":
@@ -21,6 +21,13 @@ def test_mod26_wrap_and_letter():
     assert encrypt_text('B', 'Z') == 'A'
 
 
+def test_mod26_single_pass_matches_subtraction():
+    for n in (1, 25, 26, 27, 50, 51, 52, 77, 130, 300):
+        marks = '|' * n
+        assert mod26(marks) == '|' * (n % 26)
+        assert mod26(marks, use_subtraction=True) == mod26(marks)
+
+
 def test_encrypt_preserves_non_letters():
     out = encrypt_text('B', 'A Z!')
     # A->B, space unchanged, Z->A after +1 mod 26, ! unchanged
@@ -29,3 +36,41 @@ def test_encrypt_preserves_non_letters():
     assert out[0] == 'B'
     assert out[1] == ' '
     assert out[-1] == '!'
+
+
+def test_run_cache_hits_on_repeated_letters():
+    from orchestrator import enable_run_cache, disable_run_cache, run_cache_info  # type: ignore
+    expected = encrypt_text('C', 'ABAB ABBA')
+    enable_run_cache(maxsize=64)
+    try:
+        assert encrypt_text('C', 'ABAB ABBA') == expected
+        info = run_cache_info()
+        assert info.enabled and info.hits > 0
+        misses = info.misses
+        assert encrypt_text('C', 'BABA') == 'DCDC'
+        assert run_cache_info().misses == misses
+        assert decrypt_text('C', expected) == 'ABAB ABBA'
+    finally:
+        disable_run_cache()
+    assert run_cache_info() == (0, 0, 64, 0, False)
+
+
+def test_stream_matches_text_api():
+    import io
+    from orchestrator import encrypt_stream, decrypt_stream  # type: ignore
+    text = 'HOLA, MUNDO\nzeta 42'
+    chunks = list(encrypt_stream('D', io.StringIO(text), chunk_size=4))
+    assert len(chunks) == 5
+    assert ''.join(chunks) == encrypt_text('D', text)
+    back = ''.join(decrypt_stream('D', io.StringIO(''.join(chunks)), chunk_size=7))
+    assert back == text.upper()
+
+
+def test_parallel_preserves_order():
+    from orchestrator import encrypt_text_parallel, decrypt_text_parallel  # type: ignore
+    text = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ .,' * 3
+    enc = encrypt_text_parallel('H', text, workers=2, chunk_size=10, min_length=0)
+    assert enc == encrypt_text('H', text)
+    assert decrypt_text_parallel('H', enc, workers=2, chunk_size=10, min_length=0) == text
+    # Entradas cortas: camino serial
+    assert encrypt_text_parallel('H', 'ABC') == encrypt_text('H', 'ABC')
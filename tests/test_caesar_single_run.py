@@ -0,0 +1,59 @@
+import os
+import sys
+import json
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from orchestrator import (encrypt_text, decrypt_text,  # type: ignore
+                          encrypt_text_single_run, decrypt_text_single_run)
+from caesar_machine import build_caesar_machine, caesar_step_budget  # type: ignore
+from machine_composer import MachineComposer  # type: ignore
+from turing_simulator import TuringMachine  # type: ignore
+
+TEXT = 'Hola, Mundo! XYZ abc 0123 #|+-'
+KEYS = [chr(ord('A') + k) for k in range(26)]
+
+
+def test_single_run_matches_orchestrator_for_all_keys():
+    for key in KEYS:
+        cipher = encrypt_text(key, TEXT)
+        assert encrypt_text_single_run(key, TEXT) == cipher
+        assert decrypt_text_single_run(key, cipher) == decrypt_text(key, cipher)
+    assert encrypt_text_single_run('d', '') == ''
+
+
+def test_committed_configs_match_the_compiler():
+    for decrypt, name in ((False, 'caesar_encrypt_composed.json'), (True, 'caesar_decrypt_composed.json')):
+        with open(os.path.join(ROOT, 'config', name), encoding='utf-8') as fh:
+            assert json.load(fh) == build_caesar_machine(decrypt)
+
+
+def test_one_run_leaves_only_the_cipher():
+    tm = TuringMachine()
+    tm.load_data(build_caesar_machine(decrypt=False))
+    # Claves numéricas vía number_key_to_letter, como en la GUI
+    for tape, expected in (('3#ROMA', 'URPD'), ('25#ROMA', 'QNLZ'), ('D#HOLA', 'KROD'), ('Z#', '')):
+        for accelerate in (False, True):
+            assert tm.run(tape, max_steps=caesar_step_budget(len(tape)), accelerate=accelerate) == expected
+            assert tm.current_state == 'q_accept'
+            if expected:
+                assert tm._tape.bounds()[0] == tm._head
+    with pytest.raises(ValueError):
+        encrypt_text_single_run('D', 'a_b')  # el blanco no se distingue del fin del texto
+
+
+def test_composer_checks_handoffs():
+    with open(os.path.join(ROOT, 'config', 'add_simple.json'), encoding='utf-8') as fh:
+        add = json.load(fh)
+    composer = MachineComposer()
+    with pytest.raises(ValueError):
+        composer.include(add, 'ADD', {})
+    start = composer.include(add, 'ADD', {'q_accept': 'q_done'})
+    assert start == 'ADD_q0'
+    with pytest.raises(ValueError):
+        composer.add('ADD_q0', '|', 'q_done')  # par ya definido por el componente
@@ -0,0 +1,84 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from checkpoint import load_checkpoint, save_checkpoint  # type: ignore
+from turing_simulator import TuringMachine  # type: ignore
+
+
+def cfg(name: str) -> str:
+    return os.path.join(ROOT, 'config', name)
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    full = TuringMachine(cfg('mod26_full.json'))
+    expected = full.run('|' * 300, max_steps=100000)
+
+    tm = TuringMachine(cfg('mod26_full.json'))
+    tm.run('|' * 300, max_steps=1000)
+    assert tm.current_state not in tm.accept_states
+    path = str(tmp_path / 'run.tmck')
+    save_checkpoint(tm.checkpoint(), path)
+
+    resumed = TuringMachine(cfg('mod26_full.json'))
+    out = resumed.resume(load_checkpoint(path), extra_steps=100000 - 1000, accelerate=True)
+    assert out == expected == '|' * (300 % 26)
+    assert resumed.steps_executed == full.steps_executed
+    assert (resumed.head_position, resumed.tape) == (full.head_position, full.tape)
+
+
+def test_resume_keeps_left_growth_and_foreign_symbols():
+    full = TuringMachine(cfg('number_to_letter.json'))
+    full.run('||é', max_steps=40)
+    tm = TuringMachine(cfg('number_to_letter.json'))
+    tm.run('||é', max_steps=15)
+    resumed = TuringMachine(cfg('number_to_letter.json'))
+    resumed.resume(tm.checkpoint(), extra_steps=25)
+    assert (resumed.tape, resumed.head_position, resumed.current_state) == \
+        (full.tape, full.head_position, full.current_state)
+
+
+def test_resume_rejects_other_machine():
+    tm = TuringMachine(cfg('test_simple.json'))
+    tm.run('AAA', max_steps=1)
+    with pytest.raises(ValueError):
+        TuringMachine(cfg('add_simple.json')).resume(tm.checkpoint(), 10)
+
+
+def test_multi_engine_resume(tmp_path):
+    from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+    full = MultiTuringMachine()
+    full.load_config(cfg('add_simple.json'))
+    expected = full.run('|||+||')
+
+    tm = MultiTuringMachine()
+    tm.load_config(cfg('add_simple.json'))
+    tm.run('|||+||', max_steps=4)
+    path = str(tmp_path / 'multi.tmck')
+    save_checkpoint(tm.checkpoint(), path)
+
+    resumed = MultiTuringMachine()
+    resumed.load_config(cfg('add_simple.json'))
+    assert resumed.resume(load_checkpoint(path)) == expected
+    assert resumed.step_count == full.step_count
+
+
+def test_multi_engine_checkpoint_keeps_foreign_symbols(tmp_path):
+    from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+    full = MultiTuringMachine()
+    full.load_config(cfg('test_simple.json'))
+    expected = full.run('AAAé日A')
+    tm = MultiTuringMachine()
+    tm.load_config(cfg('test_simple.json'))
+    tm.run('AAAé日A', max_steps=1)
+    path = str(tmp_path / 'multi.tmck')
+    save_checkpoint(tm.checkpoint(), path)
+    resumed = MultiTuringMachine()
+    resumed.load_config(cfg('test_simple.json'))
+    assert resumed.resume(load_checkpoint(path), extra_steps=100) == expected == 'BBBé日A'
@@ -0,0 +1,103 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from compiled_machine import CompiledMachine  # type: ignore
+from turing_simulator import TuringMachine  # type: ignore
+
+
+def cfg(name: str) -> str:
+    return os.path.join(ROOT, 'config', name)
+
+
+def test_first_declared_match_wins():
+    data = {
+        'states': ['q0', 'q1', 'q2'],
+        'tape_alphabet': ['A', '_'],
+        'initial_state': 'q0',
+        'accept_states': ['q2'],
+        'blank_symbol': '_',
+        'transitions': [
+            {'current_state': 'q0', 'read_symbol': 'A', 'next_state': 'q1', 'write_symbol': 'A', 'move': 'R'},
+            {'current_state': 'q0', 'read_symbol': 'A', 'next_state': 'q2', 'write_symbol': '_', 'move': 'L'},
+        ],
+    }
+    cm = CompiledMachine(data)
+    next_id, write_id, delta, index = cm.lookup('q0', 'A')
+    assert cm.state_names[next_id] == 'q1'
+    assert cm.symbols[write_id] == 'A'
+    assert (delta, index) == (1, 0)
+    assert cm.lookup('q1', 'A') is None
+    assert cm.lookup('q0', '?') is None
+
+
+def test_find_transition_returns_declared_dict():
+    tm = TuringMachine(cfg('number_to_letter.json'))
+    t = tm.find_transition('q_back', '_')
+    assert t is tm.transitions[-2]
+    assert t['next_state'] == 'q_back'
+
+
+def test_step_and_run_agree():
+    stepped = TuringMachine(cfg('subtract_simple.json'))
+    stepped.initialize_tape('|||||-||')
+    while stepped.current_state not in stepped.accept_states and stepped.step():
+        pass
+    ran = TuringMachine(cfg('subtract_simple.json'))
+    out = ran.run('|||||-||')
+    assert out == stepped.get_tape_contents()
+    assert out.count('|') == 3
+    assert ran.steps_executed == stepped.steps_executed
+    assert ran.head_position == stepped.head_position
+
+
+def test_accelerated_run_matches_plain_stepping():
+    cases = [
+        ('add_simple.json', '|' * 40 + '+' + '|' * 25),
+        ('subtract_simple.json', '|' * 30 + '-' + '|' * 26),
+        ('number_to_letter.json', '|' * 7),
+        ('mod26_full.json', '|' * 40),
+        ('test_simple.json', 'AB' * 20),
+    ]
+    for name, w in cases:
+        for max_steps in (1, 37, 10000):
+            plain = TuringMachine(cfg(name))
+            fast = TuringMachine(cfg(name))
+            out = plain.run(w, max_steps=max_steps)
+            assert fast.run(w, max_steps=max_steps, accelerate=True) == out
+            assert fast.steps_executed == plain.steps_executed
+            assert fast.current_state == plain.current_state
+            assert fast.head_position == plain.head_position
+            assert fast.tape == plain.tape
+
+
+def test_fused_chain_left_across_origin(tmp_path):
+    # q0 escribe a, b, c moviéndose a la izquierda (cruza el origen de la cinta)
+    import json
+    data = {
+        'states': ['q0', 'q1', 'q2', 'q_accept'],
+        'tape_alphabet': ['a', 'b', 'c', 'x', '_'],
+        'initial_state': 'q0',
+        'accept_states': ['q_accept'],
+        'blank_symbol': '_',
+        'transitions': [
+            {'current_state': 'q0', 'read_symbol': 'x', 'next_state': 'q1', 'write_symbol': 'a', 'move': 'L'},
+            {'current_state': 'q1', 'read_symbol': 'x', 'next_state': 'q2', 'write_symbol': 'b', 'move': 'L'},
+            {'current_state': 'q2', 'read_symbol': '_', 'next_state': 'q_accept', 'write_symbol': 'c', 'move': 'L'},
+        ],
+    }
+    path = tmp_path / 'chain_left.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    cm = TuringMachine(str(path)).compiled
+    assert cm.chains[cm.symbol_ids['x'] * cm.n_states + cm.state_ids['q0']] is not None
+    for w in ('x', 'xx', '_x', 'xxx'):
+        plain = TuringMachine(str(path))
+        fast = TuringMachine(str(path))
+        out = plain.run(w)
+        assert fast.run(w, accelerate=True) == out
+        assert (fast.steps_executed, fast.current_state, fast.head_position, fast.tape) == \
+            (plain.steps_executed, plain.current_state, plain.head_position, plain.tape)
@@ -0,0 +1,154 @@
+"""Pruebas diferenciales del núcleo compartido (tm_core).
+
+Los dos simuladores corren sobre tm_core; cada uno se compara con un
+intérprete de referencia escrito directamente desde su semántica:
+
+- turing_simulator: cinta bi-infinita, gana la primera transición declarada,
+  no da pasos desde un estado de aceptación.
+- turing_machine: cabezales que no pasan de la celda 0, gana la última
+  transición declarada, da un paso aunque empiece en aceptación y ``halted``
+  queda en True al aceptar o quedar sin transición.
+"""
+import glob
+import json
+import os
+import sys
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+import turing_machine  # type: ignore
+import turing_simulator  # type: ignore
+
+DELTA = {'L': -1, 'R': 1}
+
+
+def reference_single(config: dict, w: str, max_steps: int):
+    """turing_simulator: (estado, pasos, cabezal, celdas no blancas)."""
+    blank = config['blank_symbol']
+    table = {}
+    for t in config['transitions']:
+        table.setdefault((t['current_state'], t['read_symbol']), t)
+    tape = dict(enumerate(w))
+    head, state, steps = 0, config['initial_state'], 0
+    while steps < max_steps and state not in config['accept_states']:
+        t = table.get((state, tape.get(head, blank)))
+        if t is None:
+            break
+        tape[head] = t['write_symbol']
+        head += DELTA.get(t['move'], 0)
+        state = t['next_state']
+        steps += 1
+    return state, steps, head, {i: s for i, s in tape.items() if s != blank}
+
+
+def reference_multi(config: dict, w: str, max_steps: int):
+    """turing_machine: (estado, pasos, halted, cabezales, celdas no blancas por cinta)."""
+    k = config.get('num_tapes', 1)
+    blank = config['blank_symbol']
+    table = {}
+    for t in config['transitions']:
+        if 'read_symbols' in t:
+            table[(t['current_state'], tuple(t['read_symbols']))] = \
+                (t['next_state'], t['write_symbols'], t['movements'])
+        else:
+            table[(t['current_state'], (t['read_symbol'],))] = \
+                (t['next_state'], [t['write_symbol']], [t['move']])
+    tapes = [dict(enumerate(w))] + [{} for _ in range(k - 1)]
+    heads = [0] * k
+    state, steps, halted = config['initial_state'], 0, False
+    while steps < max_steps:
+        t = table.get((state, tuple(tape.get(h, blank) for tape, h in zip(tapes, heads))))
+        if t is None:
+            halted = True
+            break
+        state, writes, moves = t
+        for i, sym in enumerate(writes):
+            tapes[i][heads[i]] = sym
+            heads[i] = max(0, heads[i] + DELTA.get(moves[i], 0))
+        steps += 1
+        if state in config['accept_states']:
+            halted = True
+            break
+    return state, steps, halted, heads, [{i: s for i, s in tape.items() if s != blank} for tape in tapes]
+
+
+def run_single(config: dict, w: str, max_steps: int, accelerate: bool):
+    tm = turing_simulator.TuringMachine()
+    tm.load_data(config)
+    tm.run(w, max_steps=max_steps, accelerate=accelerate)
+    lo = tm._tape.lo
+    cells = {lo + i: s for i, s in enumerate(tm.tape) if s != config['blank_symbol']}
+    return tm.current_state, tm.steps_executed, tm._head, cells
+
+
+def run_multi(config: dict, w: str, max_steps: int):
+    tm = turing_machine.TuringMachine()
+    assert tm.load_config_data(config)
+    tm.run(w, max_steps=max_steps)
+    cells = [{i: s for i, s in enumerate(tape) if s != config['blank_symbol']} for tape in tm.tapes]
+    return tm.current_state, tm.step_count, tm.halted, tm.head_positions, cells
+
+
+def check(config: dict, w: str, max_steps: int):
+    expected = reference_single(config, w, max_steps) if 'read_symbol' in config['transitions'][0] else None
+    if expected is not None:
+        assert run_single(config, w, max_steps, False) == expected
+        assert run_single(config, w, max_steps, True) == expected
+    assert run_multi(config, w, max_steps) == reference_multi(config, w, max_steps)
+
+
+def random_config(rng: random.Random, num_tapes: int) -> dict:
+    states = [f"q{i}" for i in range(4)] + ['q_acc']
+    symbols = ['_', 'a', 'b']
+    transitions = []
+    for _ in range(rng.randint(1, 40)):
+        state = rng.choice(states)  # también desde aceptación y con pares repetidos
+        reads = [rng.choice(symbols) for _ in range(num_tapes)]
+        nxt = 'q_acc' if rng.random() < 0.05 else rng.choice(states[:-1])
+        writes = [rng.choice(symbols) for _ in range(num_tapes)]
+        moves = [rng.choice('LRN') for _ in range(num_tapes)]
+        if num_tapes == 1:
+            transitions.append({'current_state': state, 'read_symbol': reads[0], 'next_state': nxt,
+                                'write_symbol': writes[0], 'move': moves[0]})
+        else:
+            transitions.append({'current_state': state, 'read_symbols': reads, 'next_state': nxt,
+                                'write_symbols': writes, 'movements': moves})
+    return {'num_tapes': num_tapes, 'states': states, 'input_alphabet': ['a', 'b'],
+            'tape_alphabet': symbols, 'initial_state': rng.choice(['q0', 'q0', 'q0', 'q_acc']),
+            'accept_states': ['q_acc'], 'blank_symbol': '_', 'transitions': transitions}
+
+
+def test_repository_machines(capsys):
+    rng = random.Random(22)
+    for path in sorted(glob.glob(os.path.join(ROOT, 'config', '*.json'))):
+        with open(path, encoding='utf-8') as fh:
+            config = json.load(fh)
+        alphabet = config['input_alphabet']
+        for _ in range(4):
+            w = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+            check(config, w, rng.choice((3, 500, 20000)))
+    capsys.readouterr()  # avisos de límite de pasos
+
+
+def test_random_single_tape_machines(capsys):
+    rng = random.Random(2022)
+    for _ in range(300):
+        config = random_config(rng, 1)
+        # 'c' queda fuera del alfabeto: leerla detiene ambas máquinas
+        w = ''.join(rng.choice('abbc' if rng.random() < 0.2 else 'ab') for _ in range(rng.randint(0, 8)))
+        check(config, w, rng.choice((0, 1, 7, 300)))
+    capsys.readouterr()
+
+
+def test_random_multi_tape_machines(capsys):
+    rng = random.Random(2023)
+    for num_tapes in (2, 3):
+        for _ in range(150):
+            config = random_config(rng, num_tapes)
+            w = ''.join(rng.choice('ab') for _ in range(rng.randint(0, 8)))
+            check(config, w, rng.choice((0, 1, 7, 300)))
+    capsys.readouterr()
@@ -0,0 +1,100 @@
+import os
+import sys
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+import turing_machine  # type: ignore
+import turing_simulator  # type: ignore
+from loop_detector import DIVERGES, LoopDetector  # type: ignore
+
+
+def cfg(name: str) -> str:
+    return os.path.join(ROOT, 'config', name)
+
+
+def machine(rows, initial='q0'):
+    return {'states': ['q0', 'q1', 'q2'], 'input_alphabet': ['a', 'b'], 'tape_alphabet': ['a', 'b', '_'],
+            'initial_state': initial, 'accept_states': ['q_acc'], 'blank_symbol': '_',
+            'transitions': [dict(zip(('current_state', 'read_symbol', 'next_state', 'write_symbol', 'move'), r))
+                            for r in rows]}
+
+
+def both_engines(config):
+    single = turing_simulator.TuringMachine()
+    single.load_data(config)
+    multi = turing_machine.TuringMachine()
+    assert multi.load_config_data(config)
+    return single, multi
+
+
+def steps(tm) -> int:
+    return tm.steps_executed if isinstance(tm, turing_simulator.TuringMachine) else tm.step_count
+
+
+def test_exact_and_shifted_cycles_stop_early(capsys):
+    # Ida y vuelta sobre dos blancos: la configuración del paso 0 vuelve en el 2
+    pingpong = machine([('q0', '_', 'q1', '_', 'R'), ('q1', '_', 'q0', '_', 'L')])
+    # Salta la entrada y sigue a la derecha sobre blancos: se repite desplazada
+    walk = machine([('q0', 'a', 'q0', 'a', 'R'), ('q0', '_', 'q1', '_', 'R'), ('q1', '_', 'q0', '_', 'R')])
+    for config, w, drift in ((pingpong, '', 0), (walk, 'aaa', 2)):
+        for tm in both_engines(config):
+            tm.loop_detector = LoopDetector()
+            tm.run(w, max_steps=100000)
+            d = tm.loop_detector
+            assert d.result == DIVERGES and d.drift == (drift,)
+            assert d.cycle_length == 2 and steps(tm) == d.cycle_start + d.cycle_length < 10
+            if isinstance(tm, turing_machine.TuringMachine):
+                assert tm.halted
+    assert 'ADVERTENCIA' not in capsys.readouterr().out
+
+    # number_to_letter termina yendo a la izquierda para siempre en q_back
+    tm = turing_simulator.TuringMachine(cfg('number_to_letter.json'))
+    tm.loop_detector = LoopDetector()
+    tm.run('|||', max_steps=200000)
+    assert tm.loop_detector.diverged and tm.loop_detector.drift == (-1,)
+    assert tm.current_state == 'q_back' and tm.steps_executed < 20
+
+
+def test_halting_runs_are_unchanged(capsys):
+    cases = [('add_simple.json', '|||+||'), ('subtract_simple.json', '|||||-||'),
+             ('mod26_full.json', '|' * 300), ('caesar_encrypt_full.json', 'C#HOLA')]
+    for name, w in cases:
+        plain = turing_simulator.TuringMachine(cfg(name))
+        out = plain.run(w, max_steps=100000)
+        tm = turing_simulator.TuringMachine(cfg(name))
+        tm.loop_detector = LoopDetector()
+        assert tm.run(w, max_steps=100000, accelerate=True) == out
+        assert (tm.current_state, tm.steps_executed, tm.head_position) == \
+            (plain.current_state, plain.steps_executed, plain.head_position)
+        assert tm.loop_detector.result is None
+        # Copias de cinta solo en los pasos potencia de dos
+        assert tm.loop_detector.snapshots <= tm.steps_executed.bit_length() + 1
+    capsys.readouterr()
+
+
+def test_random_machines_agree_and_divergence_is_real(capsys):
+    rng = random.Random(23)
+    diverged = 0
+    for _ in range(300):
+        rows = [(rng.choice(['q0', 'q1', 'q2']), rng.choice('ab_'), rng.choice(['q0', 'q1', 'q2', 'q2', 'q_acc']),
+                 rng.choice('ab_'), rng.choice('LRN')) for _ in range(rng.randint(2, 12))]
+        config = machine(rows)
+        w = ''.join(rng.choice('ab') for _ in range(rng.randint(0, 6)))
+        for plain, tm in zip(both_engines(config), both_engines(config)):
+            tm.loop_detector = LoopDetector()
+            tm.run(w, max_steps=3000)
+            plain.run(w, max_steps=3000)
+            if tm.loop_detector.diverged:
+                diverged += 1
+                # Sin detector, la misma MT sigue hasta agotar los pasos
+                assert steps(plain) == 3000
+                assert steps(tm) < 3000
+            else:
+                assert (tm.current_state, steps(tm)) == (plain.current_state, steps(plain))
+    # Las que escriben mientras avanzan (contadores) no repiten configuración
+    assert diverged > 20
+    capsys.readouterr()
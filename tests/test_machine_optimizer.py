@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from machine_optimizer import optimize  # type: ignore
+import turing_simulator  # type: ignore
+
+
+def load(name: str) -> dict:
+    with open(os.path.join(ROOT, 'config', name), encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def outcome(data: dict, w: str, max_steps: int):
+    tm = turing_simulator.TuringMachine()
+    tm.load_data(data)
+    out = tm.run(w, max_steps=max_steps)
+    return out, tm.steps_executed, tm.head_position, tm.current_state
+
+
+def assert_equivalent(data: dict, inputs, max_steps: int = 5000):
+    optimized, report = optimize(data)
+    rep = {s: r for r, merged in report.merged.items() for s in merged}
+    for w in inputs:
+        out, steps, head, state = outcome(data, w, max_steps)
+        assert outcome(optimized, w, max_steps) == (out, steps, head, rep.get(state, state))
+    keys = [(t['current_state'], t['read_symbol']) for t in optimized['transitions']]
+    assert len(keys) == len(set(keys))
+    return optimized, report
+
+
+def test_unified_caesar_machine_shrinks():
+    data = load('caesar_encrypt_full.json')
+    rng = random.Random(24)
+    alphabet = data['input_alphabet']
+    inputs = ['C#HOLA', 'A#Z', '#'] + [''.join(rng.choice(alphabet) for _ in range(8)) for _ in range(30)]
+    optimized, report = assert_equivalent(data, inputs)
+    assert report.duplicates == 25
+    assert {'q_copy_nonalpha', 'q_prepare_letter'} <= set(report.unreachable_states)
+    assert 'q_copy_nonalpha' not in optimized['states']
+    assert report.states_after < report.states_before // 4
+    assert report.transitions_after == len(optimized['transitions']) < report.transitions_before // 2
+    assert optimize(optimized)[1].changed is False
+
+
+def test_config_machines_keep_their_results(capsys):
+    rng = random.Random(2024)
+    for name in ('letter_to_number.json', 'number_to_letter.json', 'subtract_simple.json',
+                 'add_simple.json', 'mod26_full.json', 'test_simple.json'):
+        data = load(name)
+        alphabet = data['input_alphabet']
+        inputs = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(15)]
+        assert_equivalent(data, inputs)
+    capsys.readouterr()  # avisos de límite de pasos
+
+
+def test_equivalent_states_merge_but_accept_states_do_not():
+    def t(q, r, p, w, m):
+        return {'current_state': q, 'read_symbol': r, 'next_state': p, 'write_symbol': w, 'move': m}
+    data = {
+        'states': ['q0', 'a1', 'a2', 'b1', 'ok', 'ok2', 'lost'], 'input_alphabet': ['x', 'y'],
+        'tape_alphabet': ['x', 'y', '_'], 'initial_state': 'q0', 'accept_states': ['ok', 'ok2'],
+        'blank_symbol': '_',
+        'transitions': [
+            t('q0', 'x', 'a1', 'y', 'R'), t('q0', 'y', 'b1', 'y', 'R'),
+            # a1/b1 se comportan igual (a2 es igual a a1, y ok/ok2 son aceptación distintas)
+            t('a1', 'x', 'a2', 'x', 'R'), t('a1', '_', 'ok', '_', 'N'),
+            t('a2', 'x', 'a1', 'x', 'R'), t('a2', '_', 'ok', '_', 'N'),
+            t('b1', 'x', 'b1', 'x', 'R'), t('b1', '_', 'ok', '_', 'N'),
+            t('q0', '_', 'ok2', '_', 'N'), t('q0', 'x', 'ok2', 'x', 'N'),
+            t('ok', '_', 'q0', '_', 'L'), t('lost', 'x', 'q0', 'x', 'R'),
+        ],
+    }
+    optimized, report = assert_equivalent(data, ['', 'x', 'yxxx', 'xxx', 'xyx', 'yy'])
+    assert report.merged == {'a1': ['a2', 'b1']}
+    assert (report.shadowed, report.from_accept, report.unreachable_states) == (1, 1, ['lost'])
+    assert optimized['states'] == ['q0', 'a1', 'ok', 'ok2']
+    assert len(optimized['transitions']) == 5
@@ -0,0 +1,66 @@
+import os
+import sys
+import json
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from machine_registry import MachineRegistry  # type: ignore
+
+
+def cfg(name: str) -> str:
+    return os.path.join(ROOT, 'config', name)
+
+
+def test_definition_loaded_once_and_instances_are_independent():
+    reg = MachineRegistry()
+    a = reg.new_machine(cfg('add_simple.json'))
+    b = reg.new_machine(cfg('add_simple.json'))
+    assert reg.loads == 1
+    assert a is not b and a.compiled is b.compiled
+    assert a.run('||+|').count('|') == 3
+    assert b.run('|+|').count('|') == 2
+    assert a.steps_executed != b.steps_executed
+    # Las listas de la definición no son las del JSON compartido
+    a.accept_states.append('q0')
+    a.transitions.clear()
+    shared = reg.config(cfg('add_simple.json'))
+    assert 'q0' not in shared['accept_states'] and 'q0' not in b.accept_states
+    assert shared['transitions'] and b.transitions
+
+
+def test_reload_only_when_content_changes(tmp_path):
+    with open(cfg('test_simple.json'), encoding='utf-8') as f:
+        data = json.load(f)
+    path = tmp_path / 'm.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    reg = MachineRegistry()
+    first = reg.definition(str(path))
+    # Mismo contenido con otro mtime: se reutiliza la compilación
+    os.utime(path, ns=(1, 1))
+    assert reg.definition(str(path)) is first
+    data['transitions'][0]['write_symbol'] = 'A'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    second = reg.definition(str(path))
+    assert second is not first
+    assert second.new_machine().run('AA') == 'AA'
+    assert reg.loads == 2
+
+
+def test_multi_machines_share_the_compiled_definition():
+    reg = MachineRegistry()
+    a = reg.new_multi_machine(cfg('add_simple.json'))
+    b = reg.new_multi_machine(cfg('add_simple.json'))
+    assert reg.loads == 1
+    assert a is not b and a._table is b._table
+    assert a.run('||+|').count('|') == 3
+    assert b.run('|+|').count('|') == 2
+    # Las listas de la definición no son las del JSON compartido
+    a.accept_states.append('q0')
+    assert 'q0' not in reg.config(cfg('add_simple.json'))['accept_states']
+    assert 'q0' not in b.accept_states
+    # Símbolos ajenos al alfabeto se internan solo en la instancia que los lee
+    a.run('||+|X')
+    assert 'X' not in b._symbols
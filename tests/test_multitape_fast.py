@@ -0,0 +1,80 @@
+import os
+import sys
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from turing_machine import TuringMachine  # type: ignore
+
+
+def random_config(rng: random.Random, num_tapes: int) -> dict:
+    states = [f"q{i}" for i in range(5)] + ['q_acc']
+    symbols = ['_', 'a', 'b']
+    transitions = []
+    # Casi todas las combinaciones tienen transición y casi nunca se acepta: ejecuciones largas
+    combos = [[]]
+    for _ in range(num_tapes):
+        combos = [c + [s] for c in combos for s in symbols]
+    for state in states[:-1]:
+        for reads in combos:
+            if rng.random() < 0.03:
+                continue
+            nxt = 'q_acc' if rng.random() < 0.01 else rng.choice(states[:-1])
+            writes = [rng.choice(symbols) for _ in range(num_tapes)]
+            moves = [rng.choice('LRS') for _ in range(num_tapes)]
+            if num_tapes == 1:
+                transitions.append({'current_state': state, 'read_symbol': reads[0], 'next_state': nxt,
+                                    'write_symbol': writes[0], 'move': moves[0]})
+            else:
+                transitions.append({'current_state': state, 'read_symbols': reads, 'next_state': nxt,
+                                    'write_symbols': writes, 'movements': moves})
+    return {'num_tapes': num_tapes, 'states': states, 'input_alphabet': ['a', 'b'],
+            'tape_alphabet': symbols, 'initial_state': 'q0', 'accept_states': ['q_acc'],
+            'blank_symbol': '_', 'transitions': transitions}
+
+
+def stepwise(tm: TuringMachine, w: str, max_steps: int):
+    """Referencia: el bucle general de _execute, paso a paso."""
+    tm._init_tapes(w)
+    while not tm.halted and tm.step_count < max_steps:
+        if not tm.step():
+            break
+        if tm.is_accepting_state():
+            tm.halted = True
+            break
+
+
+def configuration(tm: TuringMachine):
+    # El largo asignado de las cintas puede diferir (crecimiento geométrico)
+    return (tm.current_state, tm.step_count, tm.halted, list(tm.head_positions),
+            [bytes(t).rstrip(b'\0') for t in tm._tapes])
+
+
+def test_fast_loop_matches_step_on_random_machines(capsys):
+    rng = random.Random(20)
+    for num_tapes in (1, 2, 3):
+        for _ in range(30):
+            config = random_config(rng, num_tapes)
+            w = ''.join(rng.choice('ab') for _ in range(rng.randint(0, 12)))
+            max_steps = rng.choice((5, 200, 3000))
+            ref = TuringMachine()
+            fast = TuringMachine()
+            assert ref.load_config_data(config) and fast.load_config_data(config)
+            stepwise(ref, w, max_steps)
+            fast.run(w, max_steps=max_steps)
+            assert configuration(fast) == configuration(ref)
+
+            # Continuar desde un checkpoint también usa el bucle rápido
+            if not ref.halted:
+                checkpoint = fast.checkpoint()
+                fast.resume(checkpoint, 100)
+                while not ref.halted and ref.step_count < max_steps + 100:
+                    if not ref.step():
+                        break
+                    if ref.is_accepting_state():
+                        ref.halted = True
+                assert configuration(fast) == configuration(ref)
+    capsys.readouterr()  # avisos de límite de pasos
@@ -0,0 +1,97 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from turing_machine import TuringMachine  # type: ignore
+from observers import ACCEPT, MAX_STEPS, NO_TRANSITION, StepObserver  # type: ignore
+
+
+def cfg(name: str) -> str:
+    return os.path.join(ROOT, 'config', name)
+
+
+class Collector(StepObserver):
+    def __init__(self, batch=1):
+        self.batch = batch
+        self.calls = []
+        self.events = []
+
+    def on_start(self, tm):
+        self.calls.append(('start', tm.current_state))
+
+    def on_steps(self, tm, events):
+        self.calls.append(('steps', [e.step for e in events]))
+        self.events.extend(events)
+
+    def on_tape_grow(self, tm, tape_idx, length):
+        self.calls.append(('grow', tape_idx, length))
+
+    def on_halt(self, tm, reason):
+        self.calls.append(('halt', reason))
+
+
+def test_observer_batches_and_halt():
+    tm = TuringMachine()
+    assert tm.load_config(cfg('add_simple.json'))
+    obs = Collector(batch=4)
+    tm.add_observer(obs)
+    assert tm.run('|||+||') == '|||_||'
+    assert obs.calls[0] == ('start', tm.initial_state)
+    assert obs.calls[-1] == ('halt', ACCEPT)
+    batches = [c[1] for c in obs.calls if c[0] == 'steps']
+    assert [step for batch in batches for step in batch] == list(range(tm.step_count))
+    assert all(len(b) == 4 for b in batches[:-1])
+
+
+def test_step_event_and_tape_growth():
+    config = {
+        'states': ['q0'], 'input_alphabet': ['a'], 'tape_alphabet': ['a', '_'],
+        'initial_state': 'q0', 'accept_states': [], 'blank_symbol': '_',
+        'transitions': [{'current_state': 'q0', 'read_symbol': '_', 'next_state': 'q0',
+                         'write_symbol': 'a', 'move': 'R'}],
+    }
+    tm = TuringMachine()
+    assert tm.load_config_data(config)
+    obs = Collector()
+    tm.add_observer(obs)
+    tm.run('', max_steps=55)
+    grows = [c for c in obs.calls if c[0] == 'grow']
+    assert grows and grows[0] == ('grow', 0, 51)
+    assert obs.calls[-1] == ('halt', MAX_STEPS)
+    e = obs.events[3]
+    assert (e.step, e.state, e.next_state, e.reads, e.writes, e.moves, e.heads, e.deltas) == \
+        (3, 'q0', 'q0', ('_',), ('a',), ('R',), [3], [1])
+
+
+def test_no_observers_uses_fast_loop_and_debug_is_an_observer(capsys, monkeypatch):
+    tm = TuringMachine()
+    assert tm.load_config(cfg('subtract_simple.json'))
+
+    def fail():
+        raise AssertionError("run() sin observadores no debe pasar por step()")
+    monkeypatch.setattr(tm, 'step', fail)
+    expected = tm.run('|||||-||')
+    monkeypatch.undo()
+
+    tm.enable_debug_mode()
+    assert tm.debug_mode and len(tm.observers) == 1
+    assert tm.run('|||||-||') == expected
+    out = capsys.readouterr().out
+    assert "Paso 0: estado=" in out and "=== Fin ejecución ===" in out
+    assert "Entrada: '|||||-||'" in out
+    # Al reanudar no hay entrada: se informa el paso en lugar del contenido de la cinta
+    tm.resume(tm.checkpoint(), 10)
+    assert "Reanudación desde el paso" in capsys.readouterr().out
+    tm.disable_debug_mode()
+    assert tm.observers == []
+
+    obs = Collector()
+    tm.add_observer(obs)
+    tm._init_tapes('-')
+    while tm.step():
+        pass
+    assert obs.calls[-1] == ('halt', NO_TRANSITION)
@@ -0,0 +1,86 @@
+import os
+import sys
+import json
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from turing_simulator import TuringMachine  # type: ignore
+from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+from profiler import ExecutionProfiler  # type: ignore
+from trace_recorder import TraceRecorder  # type: ignore
+
+
+def cfg(name: str) -> str:
+    return os.path.join(ROOT, 'config', name)
+
+
+def _check_counts(prof, steps):
+    assert prof.steps == steps
+    assert sum(prof.state_visits) == steps
+    assert sum(prof.transition_hits) == steps
+    # Los tramos de la línea de tiempo cubren todos los pasos, en orden
+    segments = list(prof._segments())
+    assert sum(length for _, _, length, _ in segments) == steps
+    assert all(a[1] + a[2] == b[1] for a, b in zip(segments, segments[1:]))
+
+
+def test_profiler_counts_match_both_engines():
+    w = '|' * 60
+    plain = TuringMachine(cfg('mod26_full.json'))
+    expected = plain.run(w)
+
+    tm = TuringMachine(cfg('mod26_full.json'))
+    tm.profiler = ExecutionProfiler()
+    assert tm.run(w, accelerate=True) == expected
+    assert tm.steps_executed == plain.steps_executed
+    assert tm.current_state == plain.current_state
+    _check_counts(tm.profiler, tm.steps_executed)
+    assert tm.profiler.head_travel == tm.steps_executed  # mod26 siempre mueve el cabezal
+    assert tm.profiler.hot_states(1)[0][0] == 'q_erase'
+
+    multi = MultiTuringMachine()
+    assert multi.load_config(cfg('mod26_full.json'))
+    multi.profiler = ExecutionProfiler()
+    multi.recorder = TraceRecorder()
+    assert multi.run(w).lstrip('_') == expected  # el motor multi-cinta no recorta a la izquierda
+    _check_counts(multi.profiler, multi.step_count)
+    # Estado de partida de cada paso, según la grabación
+    rec = multi.recorder
+    origins = [rec.state_at(k) for k in range(len(rec))]
+    by_state = dict(zip(multi.profiler.state_names, multi.profiler.state_visits))
+    assert {name: n for name, n in by_state.items() if n} == {s: origins.count(s) for s in set(origins)}
+
+
+def test_profiler_counts_growth_and_keeps_recording():
+    tm = TuringMachine(cfg('test_simple.json'))
+    tm.recorder = TraceRecorder()
+    tm.profiler = ExecutionProfiler()
+    tm.run('AAAA')
+    prof = tm.profiler
+    assert len(tm.recorder) == tm.steps_executed == prof.steps
+    assert prof.growth_events == prof.final_cells - 4
+
+
+def test_profiler_exports(tmp_path):
+    tm = TuringMachine(cfg('subtract_simple.json'))
+    tm.profiler = ExecutionProfiler()
+    tm.run('|||||-||')
+    prof = tm.profiler
+
+    path = tmp_path / 'chrome.json'
+    prof.save(str(path), 'chrome')
+    events = json.loads(path.read_text(encoding='utf-8'))['traceEvents']
+    spans = [e for e in events if e['ph'] == 'X']
+    assert sum(e['dur'] for e in spans) == tm.steps_executed
+    assert spans[0]['name'] == tm.initial_state
+
+    doc = prof.to_speedscope()
+    profile = doc['profiles'][0]
+    assert profile['endValue'] - profile['startValue'] == tm.steps_executed
+    opens = [e for e in profile['events'] if e['type'] == 'O']
+    closes = [e for e in profile['events'] if e['type'] == 'C']
+    assert len(opens) == len(closes) == len(spans)
+    assert all(0 <= e['frame'] < len(doc['shared']['frames']) for e in opens)
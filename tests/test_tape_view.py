@@ -0,0 +1,82 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from gui.tape_view import BLANK_GLYPH, FrameLimiter, TapeView  # type: ignore
+
+
+class FakeCanvas:
+    """Canvas mínimo en memoria: guarda las opciones de cada ítem y cuenta llamadas."""
+
+    def __init__(self):
+        self.items = {}
+        self.updates = 0
+
+    def _create(self, kind, coords, options):
+        item = len(self.items) + 1
+        self.items[item] = dict(options, kind=kind, coords=list(coords), state=options.get('state', 'normal'))
+        return item
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rect', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', coords, options)
+
+    def itemconfigure(self, item, **options):
+        self.updates += 1
+        self.items[item].update(options)
+
+    def coords(self, item, *coords):
+        self.updates += 1
+        self.items[item]['coords'] = list(coords)
+
+    def delete(self, item):
+        del self.items[item]
+
+
+class FakeWidget:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+
+def test_tape_view_reuses_items_and_updates_only_changes():
+    canvas = FakeCanvas()
+    view = TapeView(canvas, 0, 40, window=5, cell_w=10, cell_h=20, font=None,
+                    markers=[dict(text='▼', dy=-10)])
+    created = len(canvas.items)
+    view.show(list('||_|'), 1)
+    texts = [canvas.items[t] for t in view._texts]
+    assert [t['text'] for t in texts[:4]] == ['|', '|', BLANK_GLYPH, '|']
+    assert canvas.items[view._rects[4]]['state'] == 'hidden'
+    assert canvas.items[view._rects[1]]['fill'] == '#fff6cc'
+    assert canvas.items[view._markers[0]]['coords'] == [15.0, 30]
+
+    # Un paso típico: escribe una celda y mueve el cabezal
+    canvas.updates = 0
+    view.show(list('|X_|'), 2)
+    assert len(canvas.items) == created
+    assert canvas.updates == 4  # texto, resaltado viejo, resaltado nuevo, marcador
+    assert canvas.items[view._rects[1]]['fill'] == 'white'
+    assert canvas.items[view._markers[0]]['coords'] == [25.0, 30]
+
+
+def test_frame_limiter_coalesces_requests():
+    widget = FakeWidget()
+    frames = []
+    limiter = FrameLimiter(widget, lambda: frames.append(1), max_fps=30)
+    for _ in range(100):
+        limiter.request()
+    assert len(widget.scheduled) == 1
+    widget.scheduled[0]()
+    assert frames == [1]
+    limiter.request()
+    assert len(widget.scheduled) == 2
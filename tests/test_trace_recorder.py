@@ -0,0 +1,103 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from turing_simulator import TuringMachine  # type: ignore
+from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+from gui.trace import KeyframeTrace, LazyTrace, RunSpec, run_with_trace  # type: ignore
+
+
+def cfg(name: str) -> str:
+    return os.path.join(ROOT, 'config', name)
+
+
+def test_recorder_replays_every_step():
+    live = TuringMachine(cfg('subtract_simple.json'))
+    live.initialize_tape('|||||-||')
+    snapshots = [(live.head_position, live.tape, live.current_state)]
+    while live.step():
+        snapshots.append((live.head_position, live.tape, live.current_state))
+
+    tm = TuringMachine(cfg('subtract_simple.json'))
+    rec = run_with_trace(tm, '|||||-||')
+    assert tm.recorder is None
+    assert rec.output == live.get_tape_contents()
+    assert len(rec) == len(snapshots) - 1
+    for k, (head, tape, state) in enumerate(snapshots):
+        origin, cells = rec.tape_at(k)
+        assert cells == tape
+        assert rec.heads_at(k) == [head + origin]
+        assert rec.state_at(k) == state
+
+
+def test_recorder_step_records_transition():
+    rec = run_with_trace(TuringMachine(cfg('test_simple.json')), 'AB')
+    first = rec.step(0)
+    assert (first.state, first.heads, first.reads, first.writes, first.moves) == \
+        ('q0', [0], ['A'], ['B'], [1])
+    assert rec.output == 'BB'
+
+
+def test_recorder_on_multi_engine():
+    tm = MultiTuringMachine()
+    assert tm.load_config(cfg('add_simple.json'))
+    rec = run_with_trace(tm, '||+|')
+    assert len(rec) == tm.step_count
+    origin, cells = rec.tape_at(len(rec))
+    assert ''.join(cells).rstrip('_') == rec.output
+    assert rec.heads_at(len(rec)) == tm.head_positions
+
+
+def test_keyframe_trace_matches_live_steps():
+    # number_to_letter crece hacia la izquierda; min_interval chico fuerza varios keyframes
+    live = TuringMachine(cfg('number_to_letter.json'))
+    live.initialize_tape('|||')
+    snapshots = [(live.tape, live.head_position, live.current_state)]
+    while len(snapshots) <= 300 and live.step():
+        snapshots.append((live.tape, live.head_position, live.current_state))
+
+    trace = KeyframeTrace(min_interval=4)
+    for name in ('a', 'b'):
+        trace.add_run(run_with_trace(TuringMachine(cfg('number_to_letter.json')), '|||', max_steps=300),
+                      name, 'desc')
+    assert len(trace) == 2 * len(snapshots)
+    for i, (tape, head, state) in enumerate(snapshots):
+        frame = trace[len(snapshots) + i]
+        assert (frame['tape'], frame['head'], frame['state']) == (tape, head, state)
+        assert (frame['machine'], frame['step']) == ('b', i)
+    assert trace[-1]['tape'] == snapshots[-1][0]
+
+
+def test_lazy_trace_runs_machines_on_demand():
+    executed = []
+
+    def runs():
+        for i, letter in enumerate('ABC'):
+            executed.append(letter)
+            rec = yield RunSpec(i, 'letra', 'letter_to_number.json', letter, cfg('letter_to_number.json'), letter)
+            yield RunSpec(i, 'suma', 'add_simple.json', letter, cfg('add_simple.json'), rec.output + '+|')
+
+    trace = LazyTrace(runs(), window=1, min_interval=2)
+    first = trace[0]
+    assert executed == ['A'] and not trace.exhausted
+    assert (first['letter'], first['stage'], first['step']) == (0, 'letra', 0)
+
+    c = trace.next_letter(0)
+    c = trace.next_letter(c)
+    assert trace[c]['letter'] == 2 and executed == ['A', 'B', 'C']
+    assert trace.next_letter(c) is None
+    assert trace.next_stage(trace.next_stage(c)) is None and trace.exhausted
+    assert trace.prev_letter(c) == trace.stages[2].start
+
+    # Las ejecuciones desalojadas de la ventana se reproducen igual
+    eager = KeyframeTrace()
+    for info in trace.stages:
+        spec = info.spec
+        eager.add_run(run_with_trace(TuringMachine(spec.config), spec.tape_input), spec.machine, spec.description)
+    assert len(eager) == trace.known_length
+    for i in range(trace.known_length):
+        assert trace[i]['tape'] == eager[i]['tape'] and trace[i]['head'] == eager[i]['head']
@@ -0,0 +1,65 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from turing_machine import TuringMachine  # type: ignore
+from gui.turbo import ACCEPTED, MAX_STEPS, TurboRunner  # type: ignore
+
+
+def machine(input_string: str) -> TuringMachine:
+    tm = TuringMachine()
+    assert tm.load_config(os.path.join(ROOT, 'config', 'subtract_simple.json'))
+    tm._init_tapes(input_string)
+    return tm
+
+
+def test_turbo_runs_to_the_same_result_as_run():
+    w = '|' * 120 + '-' + '|' * 26
+    ref = machine('')
+    expected = ref.run(w)
+
+    tm = machine(w)
+    runner = TurboRunner(tm, 10 ** 6)
+    runner.start()
+    runner._thread.join()
+    assert runner.finished == ACCEPTED
+    assert runner.steps == ref.step_count
+    assert tm._result() == expected
+    final = runner.latest()
+    assert final.finished == ACCEPTED and final.steps == ref.step_count
+    assert final.current_state == tm.current_state
+    assert final.tape_window(0, 0, 5) == tm.tape_window(0, 0, 5)
+
+
+def test_turbo_stop_and_max_steps():
+    tm = machine('|' * 500 + '-' + '|' * 26)
+    runner = TurboRunner(tm, 10 ** 7)
+    runner.start()
+    runner.stop()
+    assert not runner.running and runner.steps == tm.step_count
+
+    # Máquina aparte: con el bucle rápido la anterior puede haber aceptado antes del stop()
+    tm = machine('|' * 500 + '-' + '|' * 26)
+    tm.advance(50)
+    limited = TurboRunner(tm, 150, steps=50)
+    limited.start()
+    limited._thread.join()
+    assert limited.finished == MAX_STEPS and tm.step_count == 150
+
+
+def test_turbo_uses_the_core_loop_without_observers(monkeypatch):
+    tm = machine('|' * 200 + '-' + '|' * 26)
+
+    def fail():
+        pytest.fail("sin observadores el turbo no debe llamar a step()")
+    monkeypatch.setattr(tm, 'step', fail)
+    runner = TurboRunner(tm, 10 ** 6)
+    runner.start()
+    runner._thread.join()
+    assert runner.finished == ACCEPTED and runner.steps == tm.step_count
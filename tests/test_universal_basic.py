@@ -42,3 +42,58 @@ def test_max_steps_guard():
     # Con solo 2 pasos no habrá procesado toda la cadena
     assert out.startswith('B')  # Al menos primer símbolo cambiado
     assert tm.steps_executed == 2
+
+
+def test_left_growth_keeps_head_index_semantics():
+    # number_to_letter queda retrocediendo sobre blancos (q_back) hasta agotar pasos
+    tm = TuringMachine(cfg('number_to_letter.json'))
+    out = tm.run('||', max_steps=5000)
+    assert out == 'C'
+    assert tm.steps_executed == 5000
+    assert tm.head_position == 0
+    assert tm.tape[0] == tm.blank_symbol
+    assert ''.join(tm.tape).strip('_') == 'C'
+
+
+def test_tape_bounds_tracks_non_blank_region():
+    tm = TuringMachine(cfg('number_to_letter.json'))
+    tm.run('|||', max_steps=200)
+    first, last = tm.tape_bounds()
+    assert first == last
+    assert tm.tape[first] == 'D'
+    tm.initialize_tape('')
+    assert tm.tape_bounds() is None
+
+
+def test_symbols_outside_alphabet_are_preserved():
+    # 'é' no está en el alfabeto: la máquina se detiene sobre ella sin perderla
+    tm = TuringMachine(cfg('test_simple.json'))
+    out = tm.run('AAéA')
+    assert out == 'BBéA'
+    assert tm.tape[tm.head_position] == 'é'
+    assert tm.steps_executed == 2
+
+
+def test_multi_engine_tapes_view_is_decoded():
+    from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+    tm = MultiTuringMachine()
+    assert tm.load_config(cfg('test_simple.json'))
+    assert tm.run('ABé') == 'BBé'
+    assert tm.tapes[0][:4] == ['B', 'B', 'é', '_']
+    assert tm.tape_window(0, 1, 4) == ['B', 'é', '_']
+    assert tm.tape_window(0, tm.tape_length(0) - 1, tm.tape_length(0) + 2) == ['_'] * 3
+
+
+def test_multi_engine_keeps_any_number_of_foreign_symbols():
+    from turing_machine import TuringMachine as MultiTuringMachine  # type: ignore
+    tm = MultiTuringMachine()
+    assert tm.load_config(cfg('test_simple.json'))
+    symbols = list(tm._symbols)
+    # Más de 256 símbolos ajenos distintos, en una ejecución y en varias sobre la misma instancia
+    text = ''.join(chr(0x4E00 + i) for i in range(300))
+    assert tm.run('AA' + text) == 'BB' + text
+    for start in range(0, 3000, 300):
+        text = ''.join(chr(0x4E00 + i) for i in range(start, start + 300))
+        assert tm.run(text + 'A') == text + 'A'
+        assert tm.tape_window(0, 0, 2) == list(text[:2])
+    assert tm._symbols == symbols
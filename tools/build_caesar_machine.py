@@ -0,0 +1,74 @@
+"""Compilador de las MT de cifrado César de una sola ejecución.
+
+Compone las máquinas modulares de config/ (number_key_to_letter,
+letter_to_number, subtract_simple, add_simple, mod26_full, number_to_letter)
+en una sola MT por operación (ver src/caesar_machine.py) y escribe:
+- config/caesar_encrypt_composed.json
+- config/caesar_decrypt_composed.json
+
+A diferencia de las unificadas de build_unified_machines.py (demostrativas),
+estas calculan el cifrado correcto: una ejecución sobre "clave#texto" deja el
+texto cifrado en la cinta. Antes de escribirlas se verifican contra
+orchestrator.encrypt_text/decrypt_text con las 26 claves.
+
+Uso:
+  python tools/build_caesar_machine.py [--optimize] [--text "HOLA, MUNDO"]
+
+Con --optimize se escriben ya pasadas por src/machine_optimizer.py (mismos
+pasos y misma cinta, menos estados; los nombres de estados fusionados pasan a
+ser los de su representante).
+"""
+from pathlib import Path
+import argparse
+import json
+import sys
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CONFIG_DIR = BASE_DIR / 'config'
+SRC_DIR = BASE_DIR / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from caesar_machine import build_caesar_machine, caesar_step_budget  # type: ignore
+from machine_optimizer import optimize  # type: ignore
+from orchestrator import encrypt_text, decrypt_text  # type: ignore
+from turing_simulator import TuringMachine  # type: ignore
+
+OUTPUTS = {False: 'caesar_encrypt_composed.json', True: 'caesar_decrypt_composed.json'}
+
+SAMPLE_TEXT = 'Hola, Mundo! XYZ abc 123 #|+-'
+
+
+def verify(machine: dict, decrypt: bool, text: str) -> None:
+    """Compara la MT con el orquestador para las 26 claves; termina con error si difiere."""
+    reference = decrypt_text if decrypt else encrypt_text
+    tm = TuringMachine()
+    tm.load_data(machine)
+    for key in (chr(ord('A') + k) for k in range(26)):
+        out = tm.run(f"{key}#{text}", max_steps=caesar_step_budget(len(text)), accelerate=True)
+        expected = reference(key, text)
+        if out != expected or tm.current_state not in machine['accept_states']:
+            print(f"Error: clave {key}: la MT dejó {out!r} ({tm.current_state}), "
+                  f"el orquestador {expected!r}", file=sys.stderr)
+            sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Componer las MT de cifrado César de una sola ejecución")
+    parser.add_argument('--optimize', action='store_true', help="Optimizar las máquinas antes de escribirlas")
+    parser.add_argument('--text', default=SAMPLE_TEXT, help="Texto de verificación")
+    args = parser.parse_args()
+
+    for decrypt, name in OUTPUTS.items():
+        machine = build_caesar_machine(decrypt)
+        if args.optimize:
+            machine, _ = optimize(machine)
+        verify(machine, decrypt, args.text)
+        with open(CONFIG_DIR / name, 'w', encoding='utf-8') as f:
+            json.dump(machine, f, ensure_ascii=False, indent=2)
+        print(f"Generado {name}: {len(machine['states'])} estados, {len(machine['transitions'])} transiciones "
+              f"(verificado con las 26 claves)")
+
+
+if __name__ == '__main__':
+    main()
@@ -17,19 +17,30 @@ Limitaciones / Simplificaciones:
 - El bucle de procesamiento de letras aplica el pipeline por cada símbolo.
 - El módulo 26 y conversiones usan la misma lógica que los JSON originales pero con nombres de estados prefijados.
 - Esta MT unificada será grande; el objetivo principal es demostrar la construcción.
+  No calcula el cifrado correcto: las MT de una sola ejecución que sí lo hacen
+  se generan con tools/build_caesar_machine.py.
 
 Uso:
-  python tools/build_unified_machines.py
+  python tools/build_unified_machines.py [--optimize]
 
-Esto dejará los archivos en config/.
+Esto dejará los archivos en config/. Con --optimize se escriben ya pasados por
+src/machine_optimizer.py (sin transiciones repetidas, estados inalcanzables ni
+estados equivalentes duplicados; ver tools/optimize_machine.py).
 
 Nota: El simulador actual soporta un solo diccionario de transiciones plano; aquí integramos todo en ese esquema.
 """
 from pathlib import Path
+import argparse
 import json
+import sys
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_DIR = BASE_DIR / 'config'
+SRC_DIR = BASE_DIR / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from machine_optimizer import optimize  # type: ignore
 
 # Archivos modulares existentes (se usan como fuente de transiciones que se renombrarán)
 MODULAR_FILES = {
@@ -68,7 +79,7 @@ def prefix_transitions(data, prefix):
         'blank_symbol': data.get('blank_symbol', '_')
     }
 
-def build_unified(encrypt=True):
+def build_unified(encrypt=True, optimized=False):
     # Cargar componentes
     letter_to_number = load_json(MODULAR_FILES['letter_to_number'])
     number_to_letter = load_json(MODULAR_FILES['number_to_letter'])
@@ -162,6 +173,8 @@ def build_unified(encrypt=True):
         'blank_symbol': '_',
         'transitions': transitions
     }
+    if optimized:
+        machine, _ = optimize(machine)
     out_name = 'caesar_encrypt_full.json' if encrypt else 'caesar_decrypt_full.json'
     with open(CONFIG_DIR / out_name, 'w', encoding='utf-8') as f:
         json.dump(machine, f, ensure_ascii=False, indent=2)
@@ -169,8 +182,11 @@ def build_unified(encrypt=True):
 
 
 def main():
-    enc_file, enc_states, enc_trans = build_unified(True)
-    dec_file, dec_states, dec_trans = build_unified(False)
+    parser = argparse.ArgumentParser(description="Generar las MT unificadas de cifrado César")
+    parser.add_argument('--optimize', action='store_true', help="Optimizar las máquinas antes de escribirlas")
+    args = parser.parse_args()
+    enc_file, enc_states, enc_trans = build_unified(True, args.optimize)
+    dec_file, dec_states, dec_trans = build_unified(False, args.optimize)
     print(f"Generado {enc_file}: {enc_states} estados, {enc_trans} transiciones")
     print(f"Generado {dec_file}: {enc_states} estados, {enc_trans} transiciones (estructura similar)")
 
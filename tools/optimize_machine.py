@@ -0,0 +1,114 @@
+"""Optimizador de definiciones JSON de MT (ver src/machine_optimizer.py).
+
+Quita transiciones repetidas y muertas y estados inalcanzables, fusiona estados
+equivalentes y escribe la máquina resultante. Antes de escribirla ejecuta la
+original y la optimizada (turing_simulator) sobre entradas de muestra y
+verifica que dejan la misma cinta con los mismos pasos; luego reporta:
+- tamaño del JSON (ambas serializadas igual, con indent=2),
+- tiempo de carga (parseo del JSON + compilación de la tabla),
+- tiempo por paso sobre las muestras.
+
+Uso:
+  python tools/optimize_machine.py config/caesar_encrypt_full.json
+  python tools/optimize_machine.py config/letter_to_number.json --out /tmp/l2n.json --input H Z A
+
+Sin --out se escribe <nombre>.opt.json junto al original. Sin --input se
+usan entradas al azar sobre input_alphabet.
+"""
+from pathlib import Path
+import argparse
+import json
+import random
+import sys
+import time
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SRC_DIR = BASE_DIR / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from machine_optimizer import optimize  # type: ignore
+from turing_simulator import TuringMachine  # type: ignore
+
+
+def load_time(text: str, repeat: int) -> float:
+    """Mejor tiempo de parsear y compilar la definición."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        TuringMachine().load_data(json.loads(text))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_samples(data: dict, inputs, max_steps: int, repeat: int):
+    """(resultados por entrada, pasos totales, mejor tiempo total)."""
+    tm = TuringMachine()
+    tm.load_data(data)
+    best = float('inf')
+    results = []
+    for _ in range(repeat):
+        results = []
+        start = time.perf_counter()
+        for w in inputs:
+            out = tm.run(w, max_steps=max_steps)
+            results.append((out, tm.steps_executed, tm.head_position, tm.current_state))
+        best = min(best, time.perf_counter() - start)
+    return results, sum(r[1] for r in results), best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimizar una MT: estados inalcanzables, fusión y duplicados")
+    parser.add_argument('machine', help="JSON de la máquina")
+    parser.add_argument('--out', help="Ruta del JSON optimizado (por defecto <nombre>.opt.json)")
+    parser.add_argument('--input', nargs='+', help="Entradas de muestra para verificar y medir")
+    parser.add_argument('--samples', type=int, default=20, help="Entradas al azar si no se da --input")
+    parser.add_argument('--max-steps', type=int, default=100000, help="Límite de pasos por entrada")
+    parser.add_argument('--repeat', type=int, default=5, help="Repeticiones por medición (se toma la mejor)")
+    args = parser.parse_args()
+
+    source = Path(args.machine)
+    text = source.read_text(encoding='utf-8')
+    data = json.loads(text)
+    optimized, report = optimize(data)
+    out_text = json.dumps(optimized, ensure_ascii=False, indent=2)
+
+    inputs = args.input
+    if not inputs:
+        rng = random.Random(0)
+        alphabet = data.get('input_alphabet') or ['_']
+        inputs = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))) for _ in range(args.samples)]
+    before, steps, t_before = run_samples(data, inputs, args.max_steps, args.repeat)
+    after, _, t_after = run_samples(optimized, inputs, args.max_steps, args.repeat)
+    rep = {s: r for r, merged in report.merged.items() for s in merged}
+    for w, a, b in zip(inputs, before, after):
+        if a[:3] != b[:3] or rep.get(a[3], a[3]) != b[3]:
+            print(f"Error: la máquina optimizada difiere con la entrada {w!r}: {a} != {b}", file=sys.stderr)
+            sys.exit(1)
+
+    out = Path(args.out) if args.out else source.with_name(source.stem + '.opt.json')
+    out.write_text(out_text + '\n', encoding='utf-8')
+
+    print(report.summary())
+    print()
+    load_before = load_time(text, args.repeat)
+    load_after = load_time(out_text, args.repeat)
+    print(f"{'':<16} {'original':>12} {'optimizada':>12} {'mejora':>8}")
+    size_before = len(json.dumps(data, ensure_ascii=False, indent=2).encode())
+    size_after = len(out_text.encode())
+    print(f"{'JSON (KB)':<16} {size_before / 1024:>12.1f} {size_after / 1024:>12.1f} "
+          f"{size_before / size_after:>7.1f}x")
+    print(f"{'carga (ms)':<16} {load_before * 1e3:>12.2f} {load_after * 1e3:>12.2f} "
+          f"{load_before / load_after:>7.1f}x")
+    if steps:
+        print(f"{'paso (ns)':<16} {t_before / steps * 1e9:>12.0f} {t_after / steps * 1e9:>12.0f} "
+              f"{t_before / t_after:>7.1f}x")
+    print()
+    print(f"Verificado con {len(inputs)} entradas ({steps} pasos): misma cinta y mismos pasos.")
+    if steps < 1000 * len(inputs):
+        print("Nota: ejecuciones cortas; el tiempo por paso incluye el arranque de run().")
+    print(f"Escrito {out}")
+
+
+if __name__ == '__main__':
+    main()